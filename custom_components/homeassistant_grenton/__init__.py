@@ -4,12 +4,15 @@ from homeassistant.core import HomeAssistant
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
 from homeassistant.helpers import device_registry as dr, entity_registry as er
+from homeassistant.helpers.storage import Store
 
 from .integration_config import GrentonConfigEntry, GrentonConfigEntryData, RuntimeData
-from .coordinator import GrentonCoordinator
+from .coordinator import GrentonCoordinator, KEY_TIERS_STORAGE_VERSION, key_tiers_storage_key, STATE_STORAGE_VERSION, state_storage_key
 from .mappers.device_mapper import DeviceMapper
+from .const import CONF_SETTINGS
+from .startup_timeline import GrentonStartupTimeline
+from .interface_cache import async_load_mobile_interface, interface_cache_path, remove_interface_cache
 
-from .dto.mobile_interface import GrentonMobileInterfaceDto
 from .domain.encryption import GrentonEncryption
 from .domain.clu import GrentonClu
 
@@ -22,12 +25,20 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: GrentonConfigEntr
     
     config_data: GrentonConfigEntryData = config_entry.data # type: ignore
 
-    mobile_interface_dto = GrentonMobileInterfaceDto(**config_data["interface"])
+    # Summary is logged once platforms are forwarded and every CLU was tried
+    timeline = GrentonStartupTimeline()
+    timeline.expect("platforms")
+
+    # Validated model is reused until the interface changes
+    with timeline.measure("validate_interface") as details:
+        mobile_interface_dto, details["cached"] = await async_load_mobile_interface(
+            hass, config_entry.entry_id, config_data["interface"]
+        )
     
     # Create coordinator first (before devices need it)
     encryption = GrentonEncryption.from_dto(mobile_interface_dto.encryption)
     clus = [GrentonClu.from_dto(clu) for clu in mobile_interface_dto.clus]
-    coordinator = GrentonCoordinator(hass, config_entry, clus, encryption)
+    coordinator = GrentonCoordinator(hass, config_entry, clus, encryption, startup_timeline=timeline)
     
     _LOGGER.debug("Loaded interface with %d CLU(s)", len(clus))
     _LOGGER.debug("CLU details:")
@@ -35,7 +46,9 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: GrentonConfigEntr
         _LOGGER.debug("- CLU %s (%s) at %s:%d", clu.name, clu.serial_number, clu.ip, clu.port)
     
     # Map mobile interface DTO to devices
-    devices = DeviceMapper.from_mobile_interface(mobile_interface_dto, coordinator)
+    with timeline.measure("map_devices") as details:
+        devices = DeviceMapper.from_mobile_interface(mobile_interface_dto, coordinator)
+        details["devices"] = len(devices)
 
     _LOGGER.debug("Mapped %d device(s) from mobile interface", len(devices))
     _LOGGER.debug("Device details:")
@@ -49,16 +62,33 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: GrentonConfigEntr
     config_entry.runtime_data = RuntimeData(coordinator=coordinator, devices=devices)
 
     # Drop entities and devices that no longer exist in the freshly fetched interface
-    _cleanup_orphans(hass, config_entry, devices)
+    with timeline.measure("cleanup_orphans"):
+        _cleanup_orphans(hass, config_entry, devices)
 
-    # Setup the coordinator
+    # Restores the last snapshot and starts bringing up CLUs in the
+    # background; entities are added right away
     await coordinator.async_setup()
 
-    await hass.config_entries.async_forward_entry_setups(config_entry, PLATFORMS)
+    with timeline.measure("forward_platforms"):
+        await hass.config_entries.async_forward_entry_setups(config_entry, PLATFORMS)
+    timeline.complete("platforms")
+
+    config_entry.async_on_unload(config_entry.add_update_listener(_async_update_listener))
 
     return True
 
 
+async def _async_update_listener(hass: HomeAssistant, config_entry: GrentonConfigEntry) -> None:
+    """Reload when integration settings change.
+
+    Per-entity configuration is applied live by the entities themselves, so
+    only a change of the integration-wide settings needs a reload.
+    """
+    coordinator = config_entry.runtime_data.coordinator
+    if config_entry.options.get(CONF_SETTINGS, {}) != coordinator.settings:
+        hass.config_entries.async_schedule_reload(config_entry.entry_id)
+
+
 def _cleanup_orphans(
     hass: HomeAssistant,
     config_entry: ConfigEntry,
@@ -92,6 +122,12 @@ def _cleanup_orphans(
             _LOGGER.debug("Removing orphaned device %s", device.id)
             device_reg.async_update_device(device.id, remove_config_entry_id=config_entry.entry_id)
 
+async def async_remove_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> None:
+    """Drop data persisted for the entry."""
+    await Store(hass, KEY_TIERS_STORAGE_VERSION, key_tiers_storage_key(config_entry.entry_id)).async_remove()
+    await Store(hass, STATE_STORAGE_VERSION, state_storage_key(config_entry.entry_id)).async_remove()
+    await hass.async_add_executor_job(remove_interface_cache, interface_cache_path(hass, config_entry.entry_id))
+
 async def async_unload_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> bool:
     coordinator: GrentonCoordinator = config_entry.runtime_data.coordinator
     
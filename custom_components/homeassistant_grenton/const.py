@@ -1 +1,7 @@
-DOMAIN = "grenton"
\ No newline at end of file
+DOMAIN = "grenton"
+
+# Integration-wide settings, stored in config entry options under CONF_SETTINGS
+CONF_SETTINGS = "settings"
+CONF_PROBE_PAYLOAD_SIZE = "probe_payload_size"
+CONF_IO_THREAD = "io_thread"
+CONF_GATEWAY_PROCESS = "gateway_process"
@@ -1,27 +1,75 @@
 from __future__ import annotations
-from typing import Any
+from dataclasses import dataclass, replace
+from functools import partial
+from typing import Any, Coroutine, TypeVar
 
 import logging
 import asyncio
+import time
 
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, CALLBACK_TYPE, callback
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.helpers.storage import Store
 
 from .domain.clu import GrentonClu
 from .domain.encryption import GrentonEncryption
 from .domain.state_object import GrentonStateObject
-from .domain.action import GrentonAction
+from .domain.action import GrentonAction, GrentonActionAttribute, GrentonActionVariable
 from .domain.api.clu import GrentonCluApi
-from .state import GrentonState, GrentonCluState, GrentonCluStateVariableKey, GrentonCluStateAttributeKey, GrentonValue
+from .state import GrentonState, GrentonCluState, GrentonCluStateVariableKey, GrentonCluStateAttributeKey, GrentonStateHandle, GrentonValue, deserialize_state_key
 from .domain.api.clu_messages import GrentonCluApiActionRequest
+from .report_batcher import GrentonReportBatcher, GrentonReport
+from .io_thread import GrentonIoThread
+from .gateway_process import GrentonGatewayProcess
+from .gateway_worker import GrentonGatewayLayout
+from .startup_timeline import GrentonStartupTimeline
 
-from .const import DOMAIN
+from .const import DOMAIN, CONF_SETTINGS, CONF_PROBE_PAYLOAD_SIZE, CONF_IO_THREAD, CONF_GATEWAY_PROCESS
 
 _LOGGER = logging.getLogger(__name__)
 
+_T = TypeVar("_T")
+
+KEY_TIERS_STORAGE_VERSION = 1
+STATE_STORAGE_VERSION = 1
+
+# How often per-key change rates are folded into hot/cold tiers
+KEY_TIERS_UPDATE_INTERVAL = 600
+
+# Retry backoff of a CLU that did not come up at startup
+MIN_CLU_RETRY_DELAY = 5.0
+MAX_CLU_RETRY_DELAY = 60.0
+
+# Delay between a state change and the snapshot write that includes it;
+# changes arriving in the meantime are written together
+STATE_SAVE_DELAY = 60
+
+
+def key_tiers_storage_key(entry_id: str) -> str:
+    return f"{DOMAIN}.{entry_id}.key_tiers"
+
+
+def state_storage_key(entry_id: str) -> str:
+    return f"{DOMAIN}.{entry_id}.state"
+
+
+@dataclass(slots=True)
+class _CoalescedWrite:
+    """Latest not-yet-sent write to one target, shared by all callers it replaced."""
+    action: GrentonAction
+    future: asyncio.Future[None]
+
+
 class GrentonCoordinator(DataUpdateCoordinator):
-    def __init__(self, hass: HomeAssistant, config_entry: ConfigEntry, clus: list[GrentonClu], encryption: GrentonEncryption):
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        config_entry: ConfigEntry,
+        clus: list[GrentonClu],
+        encryption: GrentonEncryption,
+        startup_timeline: GrentonStartupTimeline | None = None,
+    ):
         super().__init__(
             hass,
             _LOGGER,
@@ -35,26 +83,127 @@ class GrentonCoordinator(DataUpdateCoordinator):
         
         # Map CLU IDs to their API instances
         self._apis: dict[str, GrentonCluApi] = {}
+
+        # Entity update callbacks indexed by (clu_id, state key), so a report
+        # only wakes the entities bound to the values that changed.
+        self._state_listeners: dict[
+            tuple[str, GrentonCluStateVariableKey | GrentonCluStateAttributeKey],
+            list[CALLBACK_TYPE],
+        ] = {}
         
+        # Latest-wins coalescing of set-value writes, keyed by write target.
+        # At most one write per target is in flight; later values replace the
+        # queued one so the final value always lands.
+        self._queued_writes: dict[tuple[str, ...], _CoalescedWrite] = {}
+        self._writing_targets: set[tuple[str, ...]] = set()
+        self.coalesced_writes = 0
+
+        # Hot key tiers per CLU, persisted so chunk layout survives restarts
+        self._key_tiers_store: Store[dict[str, list[list[str]]]] = Store(
+            hass, KEY_TIERS_STORAGE_VERSION, key_tiers_storage_key(config_entry.entry_id)
+        )
+        self._key_tiers_updated_at = time.monotonic()
+
+        # Last known values per CLU, restored on startup until the CLUs
+        # report. Only keys marked dirty since the previous write are folded
+        # into the snapshot, keyed by serialized state key.
+        self._state_store: Store[dict[str, dict[str, Any]]] = Store(
+            hass, STATE_STORAGE_VERSION, state_storage_key(config_entry.entry_id)
+        )
+        self._state_snapshot: dict[str, dict[tuple[str, ...], GrentonValue]] = {}
+        self._state_save_scheduled = False
+
+        # CLUs that answered their first registration. Setup does not wait for
+        # them; each one is brought up by its own background task.
+        self._ready_clus: set[str] = set()
+        self._startup_tasks: dict[str, asyncio.Task[None]] = {}
+
+        # Phase durations of this setup; complete once every CLU had its
+        # first bring-up attempt
+        self.startup_timeline = startup_timeline or GrentonStartupTimeline()
+        self.startup_timeline.expect(*(clu.id for clu in clus))
+
+        # Integration-wide settings this coordinator was built with
+        self.settings: dict[str, Any] = dict(config_entry.options.get(CONF_SETTINGS, {}))
+
+        # Optional worker process owning all CLU sockets and subscriptions.
+        # Changed values come back through shared memory; it takes precedence
+        # over the I/O thread, which would have nothing left to do.
+        self._gateway: GrentonGatewayProcess | None = None
+        # Shared slot -> (CLU ID, slot in that CLU's state)
+        self._gateway_slot_owners: list[tuple[str, int]] = []
+        if self.settings.get(CONF_GATEWAY_PROCESS, False):
+            self._gateway = GrentonGatewayProcess(
+                clus,
+                encryption,
+                probe_payload_size=self.settings.get(CONF_PROBE_PAYLOAD_SIZE, False),
+                on_values=self._apply_gateway_values,
+                on_ready=self._mark_clu_ready,
+                on_timing=self._record_gateway_timing,
+            )
+
+        # Optional thread owning all CLU sockets. API coroutines then run on
+        # its loop (see _run_io) and only coalesced, decoded reports come back.
+        self._io_thread: GrentonIoThread | None = (
+            GrentonIoThread()
+            if self._gateway is None and self.settings.get(CONF_IO_THREAD, False)
+            else None
+        )
+
+        # Reports are applied per CLU in batches, one notification pass each.
+        # Batchers run on the loop owning the sockets.
+        self._report_batchers: dict[str, GrentonReportBatcher] = {
+            clu.id: GrentonReportBatcher(
+                partial(self._hand_off_reports if self._io_thread else self._apply_reports, clu.id)
+            )
+            for clu in clus
+        }
         # Initialize API instances for each CLU
-        for clu in clus:
-            self._apis[clu.id] = GrentonCluApi(clu, encryption)
+        for clu in clus if self._gateway is None else ():
+            self._apis[clu.id] = GrentonCluApi(
+                clu,
+                encryption,
+                probe_payload_size=self.settings.get(CONF_PROBE_PAYLOAD_SIZE, False),
+            )
 
     async def _async_update_data(self): # type: ignore
         return self.state
+
+    async def _run_io(self, coro: Coroutine[Any, Any, _T]) -> _T:
+        """Await an API coroutine on the loop that owns the CLU sockets."""
+        if self._io_thread is None or not self._io_thread.is_running:
+            return await coro
+        return await self._io_thread.run(coro)
+
+    async def _flush_reports_after(
+        self,
+        clu_id: str,
+        values_coro: Coroutine[Any, Any, list[GrentonValue] | None],
+    ) -> list[GrentonValue] | None:
+        """Await register/renew values, then flush the reports queued before them.
+
+        Runs on the socket loop, so in I/O thread mode the flushed reports are
+        handed to the HA loop ahead of the returned values.
+        """
+        values = await values_coro
+        if values:
+            self._report_batchers[clu_id].flush()
+        return values
     
-    async def _send_ping(self, clu_id: str) -> None:
+    async def _send_ping(self, clu_id: str) -> bool:
         api = self._apis.get(clu_id)
         if not api:
             _LOGGER.warning("[%s] No API found for CLU during ping", clu_id)
-            return
+            return False
         
         try:
-            success = await api.ping()
+            success = await self._run_io(api.ping())
             if not success:
                 _LOGGER.warning("[%s] Ping failed", clu_id)
+            return success
         except Exception as e:
             _LOGGER.error("[%s] Error during ping: %s", clu_id, e)
+            return False
     
     async def _ping_loop(self) -> None:
         while True:
@@ -63,7 +212,7 @@ class GrentonCoordinator(DataUpdateCoordinator):
                 ping_interval = 5
                 await asyncio.sleep(ping_interval)
                 
-                tasks = [self._send_ping(clu_id) for clu_id in self._apis.keys()]
+                tasks = [self._send_ping(clu_id) for clu_id in self._ready_clus]
                 if tasks:
                     await asyncio.gather(*tasks, return_exceptions=True)
             except asyncio.CancelledError:
@@ -72,47 +221,177 @@ class GrentonCoordinator(DataUpdateCoordinator):
             except Exception as e:
                 _LOGGER.error("Unexpected error in ping loop: %s", e)
     
-    async def _send_register(self, clu_id: str) -> None:
+    async def _send_register(self, clu_id: str) -> bool:
+        """Register all states of a CLU; False if the CLU answered no chunk."""
         api = self._apis.get(clu_id)
         if not api:
             _LOGGER.warning("[%s] No API found for CLU during state registration", clu_id)
-            return
+            return False
         
         clu_state = self.state.clus[clu_id]
         
         # Check if there are any states to register
         if not clu_state.has_states_to_register():
             _LOGGER.debug("[%s] No component states to register", clu_id)
-            return
+            return True
         
         try:
             keys = clu_state.get_subscription_order()
-            values = await api.register_component_states(keys)
+            # Queued reports are older than these values
+            values = await self._run_io(
+                self._flush_reports_after(clu_id, api.register_component_states(keys))
+            )
             if values:
-                clu_state.update_keys(keys, values)
-                self.async_set_updated_data(self.state.__dict__)
+                changed = clu_state.update_keys(keys, values)
+                self._notify_state_listeners(clu_id, changed)
+            return values is not None and any(value is not None for value in values)
         except Exception as e:
             _LOGGER.error("[%s] Error during registration: %s", clu_id, e)
+            return False
     
+    async def _send_renewal(self, clu_id: str) -> None:
+        api = self._apis.get(clu_id)
+        if not api:
+            _LOGGER.warning("[%s] No API found for CLU during subscription renewal", clu_id)
+            return
+
+        clu_state = self.state.clus[clu_id]
+        if not clu_state.has_states_to_register():
+            return
+
+        try:
+            keys = clu_state.get_subscription_order()
+            values = await self._run_io(
+                self._flush_reports_after(clu_id, api.renew_component_states(keys))
+            )
+            if values:
+                changed = clu_state.update_keys(keys, values)
+                self._notify_state_listeners(clu_id, changed)
+        except Exception as e:
+            _LOGGER.error("[%s] Error during subscription renewal: %s", clu_id, e)
+
+    async def _load_key_tiers(self) -> None:
+        """Restore hot tiers saved by a previous run, before the first registration."""
+        try:
+            data = await self._key_tiers_store.async_load()
+        except Exception as e:
+            _LOGGER.warning("Failed to load key tiers: %s", e)
+            return
+
+        for clu_id, hot_keys in (data or {}).items():
+            clu_state = self.state.clus.get(clu_id)
+            if clu_state:
+                clu_state.set_hot_keys({deserialize_state_key(key) for key in hot_keys})
+
+    def _update_key_tiers(self) -> None:
+        """Re-tier keys by their recent change rate and persist the result.
+
+        A tier change alters the subscription order; the next renewal pass
+        notices the new chunk layout and re-registers only affected chunks.
+        """
+        now = time.monotonic()
+        elapsed = now - self._key_tiers_updated_at
+        self._key_tiers_updated_at = now
+
+        changed = False
+        for clu_id, clu_state in self.state.clus.items():
+            if clu_state.update_key_tiers(elapsed):
+                _LOGGER.debug("[%s] Hot key tier now has %d key(s)", clu_id, len(clu_state.get_hot_keys()))
+                changed = True
+                if self._gateway is not None:
+                    # The worker owns the subscriptions and re-registers there
+                    self._gateway.update_order(clu_id, clu_state.get_slots(clu_state.get_subscription_order()))
+
+        if changed:
+            self._key_tiers_store.async_delay_save(
+                lambda: {
+                    clu_id: [key.serialize() for key in clu_state.get_hot_keys()]
+                    for clu_id, clu_state in self.state.clus.items()
+                },
+                KEY_TIERS_UPDATE_INTERVAL / 10,
+            )
+
+    async def _load_state_snapshot(self) -> None:
+        """Seed registered keys with the values saved by a previous run."""
+        try:
+            data = await self._state_store.async_load()
+        except Exception as e:
+            _LOGGER.warning("Failed to load state snapshot: %s", e)
+            return
+
+        for clu_id, stored in (data or {}).items():
+            clu_state = self.state.clus.get(clu_id)
+            if clu_state is None:
+                continue
+            snapshot: dict[tuple[str, ...], GrentonValue] = {
+                (name,): value for name, value in stored.get("variables", {}).items()
+            }
+            for object_name, attributes in stored.get("attributes", {}).items():
+                for name, value in attributes.items():
+                    snapshot[(object_name, name)] = value
+            self._state_snapshot[clu_id] = snapshot
+            restored = clu_state.restore_values(
+                {deserialize_state_key(list(key)): value for key, value in snapshot.items()}
+            )
+            _LOGGER.debug("[%s] Restored %d value(s) from snapshot", clu_id, restored)
+
+    @callback
+    def _schedule_state_save(self) -> None:
+        # async_delay_save restarts its timer on every call; with reports
+        # arriving continuously the write would never happen
+        if self._state_save_scheduled:
+            return
+        self._state_save_scheduled = True
+        self._state_store.async_delay_save(self._state_snapshot_data, STATE_SAVE_DELAY)
+
+    @callback
+    def _state_snapshot_data(self) -> dict[str, dict[str, Any]]:
+        """Fold dirty keys into the snapshot and return it in storage form.
+
+        Keys no longer registered (e.g. removed from the interface since the
+        snapshot was loaded) are dropped, so the snapshot does not keep every
+        key it has ever seen.
+
+        Per CLU: {"variables": {name: value}, "attributes": {object: {index: value}}}
+        """
+        self._state_save_scheduled = False
+        for clu_id in self._state_snapshot.keys() - self.state.clus.keys():
+            del self._state_snapshot[clu_id]
+        for clu_id, clu_state in self.state.clus.items():
+            snapshot = self._state_snapshot.setdefault(clu_id, {})
+            for key, value in clu_state.pop_dirty():
+                snapshot[tuple(key.serialize())] = value
+            registered = {tuple(key.serialize()) for key in clu_state.get_keys()}
+            for key in snapshot.keys() - registered:
+                del snapshot[key]
+
+        data: dict[str, dict[str, Any]] = {}
+        for clu_id, snapshot in self._state_snapshot.items():
+            variables: dict[str, GrentonValue] = {}
+            attributes: dict[str, dict[str, GrentonValue]] = {}
+            for key, value in snapshot.items():
+                if len(key) == 1:
+                    variables[key[0]] = value
+                else:
+                    attributes.setdefault(key[0], {})[key[1]] = value
+            data[clu_id] = {"variables": variables, "attributes": attributes}
+        return data
+
     async def _register_loop(self) -> None:
         while True:
             try:
-                # Only register if there are actual states to register
-                clu_ids_to_register = [
-                    clu_id for clu_id, clu_state in self.state.clus.items()
-                    if clu_state.has_states_to_register()
-                ]
-                
-                if not clu_ids_to_register:
-                    # No states to register, wait longer before checking again
-                    await asyncio.sleep(45)
-                    continue
-                
-                # Registration interval
-                registration_interval = 45
-                await asyncio.sleep(registration_interval)
-                
-                tasks = [self._send_register(clu_id) for clu_id in clu_ids_to_register]
+                # Check subscription leases frequently; the API only sends
+                # clientRegister for chunks near lease expiry or gone silent,
+                # so most checks cost nothing.
+                renewal_check_interval = 5
+                await asyncio.sleep(renewal_check_interval)
+
+                if time.monotonic() - self._key_tiers_updated_at >= KEY_TIERS_UPDATE_INTERVAL:
+                    self._update_key_tiers()
+
+                # In gateway mode there are no local APIs: the worker renews
+                # on its own and this loop only maintains the key tiers
+                tasks = [self._send_renewal(clu_id) for clu_id in self._ready_clus & self._apis.keys()]
                 if tasks:
                     await asyncio.gather(*tasks, return_exceptions=True)
             except asyncio.CancelledError:
@@ -121,80 +400,387 @@ class GrentonCoordinator(DataUpdateCoordinator):
             except Exception as e:
                 _LOGGER.error("Unexpected error in register loop: %s", e)
     
+    @staticmethod
+    def _write_target(action: GrentonAction) -> tuple[str, ...] | None:
+        """Target of an idempotent set-value action, None if it must not be coalesced.
+
+        Only attribute and variable writes qualify: sending just the last value
+        has the same effect as sending all of them. Methods and scripts may
+        have side effects (toggles, counters) and always run.
+        """
+        if isinstance(action, GrentonActionAttribute):
+            return (action.clu_id, "ATTRIBUTE", action.object_name, action.index)
+        if isinstance(action, GrentonActionVariable):
+            return (action.clu_id, "VARIABLE", action.index)
+        return None
+
     async def execute_action(self, action: GrentonAction) -> None:
-        api = self._apis.get(action.clu_id)
+        target = self._write_target(action)
+        if target is None:
+            await self._execute_action(action)
+            return
+
+        # Snapshot: entities reuse and mutate their action objects
+        action = replace(action)
+
+        queued = self._queued_writes.get(target)
+        if queued is not None:
+            queued.action = action
+            self.coalesced_writes += 1
+            _LOGGER.debug("[%s] Coalesced write to %s (%d total)", action.clu_id, target[2:], self.coalesced_writes)
+            future = queued.future
+        else:
+            future = self.hass.loop.create_future()
+            self._queued_writes[target] = _CoalescedWrite(action, future)
+            if target not in self._writing_targets:
+                self._writing_targets.add(target)
+                self.config_entry.async_create_background_task(
+                    self.hass, self._drain_writes(target), f"{DOMAIN} write {target}"
+                )
+
+        # Shielded: the future is shared with callers this write replaced
+        await asyncio.shield(future)
+
+    async def _drain_writes(self, target: tuple[str, ...]) -> None:
+        """Send queued writes for a target one at a time until none is left."""
+        try:
+            while (write := self._queued_writes.pop(target, None)) is not None:
+                try:
+                    await self._execute_action(write.action)
+                finally:
+                    if not write.future.done():
+                        write.future.set_result(None)
+        finally:
+            self._writing_targets.discard(target)
+            # Cancelled mid-drain (e.g. on unload): release anyone still waiting
+            if (write := self._queued_writes.pop(target, None)) is not None:
+                write.future.set_result(None)
+
+    async def execute_actions(self, actions: list[GrentonAction]) -> None:
+        """Run actions of one CLU strictly in the given order, in one request.
+
+        For steps that depend on each other, e.g. setting a color before
+        switching a light on. Queued writes to the same targets are superseded
+        by the sequence and released once it completes.
+        """
+        superseded = [
+            write for action in actions
+            if (target := self._write_target(action)) is not None
+            and (write := self._queued_writes.pop(target, None)) is not None
+        ]
+        try:
+            # Snapshot: entities reuse and mutate their action objects
+            await self._execute_actions([replace(action) for action in actions])
+        finally:
+            for write in superseded:
+                if not write.future.done():
+                    write.future.set_result(None)
+
+    async def _execute_action(self, action: GrentonAction) -> None:
+        await self._execute_actions([action])
+
+    @staticmethod
+    def _payload(actions: list[GrentonAction]) -> str:
+        return GrentonCluApiActionRequest.sequence(
+            [GrentonCluApiActionRequest.payload_for(action) for action in actions]
+        )
+
+    async def _execute_actions(self, actions: list[GrentonAction]) -> None:
+        clu_id = actions[0].clu_id
+        if self._gateway is not None:
+            if not await self._gateway.execute_actions(actions):
+                _LOGGER.warning("[%s] Action execution failed for payload: %s", clu_id, self._payload(actions))
+            return
+
+        api = self._apis.get(clu_id)
         if not api:
-            _LOGGER.warning("[%s] No API found for CLU during action execution", action.clu_id)
+            _LOGGER.warning("[%s] No API found for CLU during action execution", clu_id)
             return
         
         try:
-            success = await api.execute_action(action)
+            success = await self._run_io(api.execute_actions(actions))
             if not success:
-                _LOGGER.warning("[%s] Action execution failed for payload: %s", action.clu_id, GrentonCluApiActionRequest.from_action(action).payload)
+                _LOGGER.warning("[%s] Action execution failed for payload: %s", clu_id, self._payload(actions))
         except Exception as e:
-            _LOGGER.error("[%s] Error executing action: %s", action.clu_id, e)
+            _LOGGER.error("[%s] Error executing action: %s", clu_id, e)
     
-    async def _process_report(
+    @callback
+    def _process_report(
         self,
         clu_id: str,
         keys: list[GrentonCluStateVariableKey | GrentonCluStateAttributeKey],
         values: list[GrentonValue],
     ) -> None:
-        """Process a report from a CLU and update state for the given keys."""
+        """Queue a report from a CLU; it is applied with the rest of its burst."""
+        self._report_batchers[clu_id].submit(keys, values)
+
+    @callback
+    def _apply_reports(self, clu_id: str, reports: list[GrentonReport]) -> None:
+        """Apply a batch of reports in arrival order and notify listeners once."""
         clu_state = self.state.clus[clu_id]
-        clu_state.update_keys(keys, values)
+        changed: set[GrentonCluStateVariableKey | GrentonCluStateAttributeKey] = set()
+        for keys, values in reports:
+            changed |= clu_state.update_keys(keys, values)
+
+        self._notify_state_listeners(clu_id, changed)
+        _LOGGER.debug("[%s] Processed %d report(s), %d value(s) changed", clu_id, len(reports), len(changed))
+
+    def _hand_off_reports(self, clu_id: str, reports: list[GrentonReport]) -> None:
+        """Pass a batch from the I/O thread to the HA loop, one report per chunk.
+
+        Reports of the same chunk are merged position by position. The merged
+        report keeps the chunk's own key list, so the state's slot vector
+        cached for that list still applies on the HA loop.
+        """
+        if len(reports) > 1:
+            # Keyed by chunk list; a chunk moves to the end when it reports
+            # again, so the latest report of overlapping chunks applies last
+            merged: dict[int, GrentonReport] = {}
+            for keys, values in reports:
+                previous = merged.pop(id(keys), None)
+                if previous is None:
+                    merged[id(keys)] = (keys, list(values))
+                    continue
+                # None marks "no value" and never overrides
+                latest = previous[1]
+                for position, value in enumerate(values):
+                    if value is not None:
+                        latest[position] = value
+                merged[id(keys)] = previous
+            reports = list(merged.values())
+        self.hass.loop.call_soon_threadsafe(self._apply_reports, clu_id, reports)
+
+    def _gateway_layouts(self) -> dict[str, GrentonGatewayLayout]:
+        """Give every CLU a contiguous range of shared slots, in state slot order."""
+        layouts: dict[str, GrentonGatewayLayout] = {}
+        owners: list[tuple[str, int]] = []
+        for clu_id, clu_state in self.state.clus.items():
+            layout = GrentonGatewayLayout.from_clu_state(len(owners), clu_state)
+            owners.extend((clu_id, slot) for slot in range(len(layout.keys)))
+            layouts[clu_id] = layout
+        self._gateway_slot_owners = owners
+        return layouts
+
+    @callback
+    def _apply_gateway_values(self, slots: list[int], values: list[GrentonValue]) -> None:
+        """Apply values read from the gateway's shared region, one notification pass per CLU."""
+        grouped: dict[str, tuple[list[int], list[GrentonValue]]] = {}
+        owners = self._gateway_slot_owners
+        for slot, value in zip(slots, values):
+            clu_id, clu_slot = owners[slot]
+            clu_slots, clu_values = grouped.setdefault(clu_id, ([], []))
+            clu_slots.append(clu_slot)
+            clu_values.append(value)
+
+        for clu_id, (clu_slots, clu_values) in grouped.items():
+            changed = self.state.clus[clu_id].update_slots(clu_slots, clu_values)
+            self._notify_state_listeners(clu_id, changed)
+            _LOGGER.debug("[%s] Read %d value(s) from gateway, %d changed", clu_id, len(clu_slots), len(changed))
+
+    def clu_diagnostics(self) -> dict[str, dict[str, Any]]:
+        """Per-CLU connection details for diagnostics."""
+        diagnostics: dict[str, dict[str, Any]] = {}
+        for clu in self.clus:
+            clu_state = self.state.clus[clu.id]
+            keys = clu_state.get_keys()
+            entry: dict[str, Any] = {
+                "name": clu.name,
+                "ready": self.is_clu_ready(clu.id),
+                "keys": len(keys),
+                "restored_keys": sum(1 for key in keys if clu_state.is_restored(key)),
+            }
+            api = self._apis.get(clu.id)
+            if api is not None:
+                entry.update({
+                    "rtt": {"srtt": api.rtt.srtt, "rttvar": api.rtt.rttvar, "rto": api.rtt.rto},
+                    "register_rtt": {"srtt": api.register_rtt.srtt, "rttvar": api.register_rtt.rttvar, "rto": api.register_rtt.rto},
+                    "max_payload_bytes": api.max_payload_bytes,
+                    "decrypt_stats": api.decrypt_stats(),
+                    "subscription_chunks": api.register_timings(),
+                })
+            diagnostics[clu.id] = entry
+        return diagnostics
+
+    def gateway_metrics(self) -> dict[str, Any] | None:
+        """Gateway process state and restart counters, None when it is not used."""
+        return self._gateway.metrics() if self._gateway is not None else None
+
+    def report_batch_metrics(self) -> dict[str, dict[str, float | int]]:
+        """Current report batching window and batch sizes per CLU."""
+        return {clu_id: batcher.metrics() for clu_id, batcher in self._report_batchers.items()}
+
+    @callback
+    def _notify_state_listeners(
+        self,
+        clu_id: str,
+        keys: set[GrentonCluStateVariableKey | GrentonCluStateAttributeKey],
+    ) -> None:
+        """Invoke each listener bound to any of the changed keys exactly once."""
+        if keys:
+            self._schedule_state_save()
 
-        self.async_set_updated_data(self.state.__dict__)
-        _LOGGER.debug("[%s] Processed report with %d values", clu_id, len(values))
+        # dict keeps insertion order and collapses entities bound to several
+        # changed keys (e.g. LED hue + brightness) into a single write.
+        callbacks: dict[CALLBACK_TYPE, None] = {}
+        for key in keys:
+            for update_callback in self._state_listeners.get((clu_id, key), ()):
+                callbacks[update_callback] = None
+
+        for update_callback in callbacks:
+            update_callback()
+
+    @callback
+    def async_add_state_listener(self, state: GrentonStateObject, update_callback: CALLBACK_TYPE) -> CALLBACK_TYPE:
+        """Listen for value changes of a single component state.
+
+        Returns a callable that removes the listener.
+        """
+        key = GrentonState.get_key_for_component(state)
+        if key is None:
+            return lambda: None
+
+        index_key = (state.clu_id, key)
+        listeners = self._state_listeners.setdefault(index_key, [])
+        listeners.append(update_callback)
+
+        @callback
+        def remove_listener() -> None:
+            listeners.remove(update_callback)
+            if not listeners:
+                self._state_listeners.pop(index_key, None)
+
+        return remove_listener
     
-    def register_component_state(self, state: GrentonStateObject) -> None:
-        self.state.register_state(state)
+    def register_component_state(self, state: GrentonStateObject) -> GrentonStateHandle:
+        return self.state.register_state(state)
     
+    def is_clu_ready(self, clu_id: str) -> bool:
+        """Whether a CLU answered its first registration since setup."""
+        return clu_id in self._ready_clus
+
+    @callback
+    def _mark_clu_ready(self, clu_id: str) -> None:
+        if clu_id in self._ready_clus:
+            return
+        self._ready_clus.add(clu_id)
+        _LOGGER.debug("[%s] CLU is ready", clu_id)
+        # Entities of this CLU become available
+        self.async_update_listeners()
+
     async def async_setup(self) -> None:
-        # Connect all APIs
-        connection_tasks: list[Any] = []
-        for clu in self.clus:
-            api = self._apis[clu.id]
-            connection_tasks.append(self._connect_api(api))
-        
-        # Wait for all connections to complete
-        await asyncio.gather(*connection_tasks, return_exceptions=True)
-        
-        # Send initial pings to establish sessions
-        ping_tasks = [self._send_ping(clu_id) for clu_id in self._apis.keys()]
-        if ping_tasks:
-            await asyncio.gather(*ping_tasks, return_exceptions=True)
-        
-        # Send initial registrations
-        register_tasks = [self._send_register(clu_id) for clu_id in self.state.clus.keys()]
-        if register_tasks:
-            await asyncio.gather(*register_tasks, return_exceptions=True)
-        
-        # Start background tasks
+        """Restore persisted data and start bringing up the CLUs.
+
+        Returns without waiting for any CLU: each one is connected, pinged
+        and registered by its own background task, so one unreachable CLU
+        does not hold up the config entry.
+        """
+        timeline = self.startup_timeline
+        with timeline.measure("load_storage"):
+            await self._load_key_tiers()
+            await self._load_state_snapshot()
+
+        if self._gateway is not None:
+            # The worker connects, pings and registers on its own
+            with timeline.measure("start_gateway"):
+                await self._gateway.start(self._gateway_layouts())
+            self._register_task = asyncio.create_task(self._register_loop())
+            return
+
+        if self._io_thread is not None:
+            self._io_thread.start()
+
+        for clu_id in self._apis:
+            self._startup_tasks[clu_id] = asyncio.create_task(self._bring_up_clu(clu_id))
+
+        # Start background tasks; they only serve CLUs that are ready
         self._ping_task = asyncio.create_task(self._ping_loop())
         self._register_task = asyncio.create_task(self._register_loop())
-    
-    async def _connect_api(self, api: GrentonCluApi) -> None:
+
+    async def _bring_up_clu(self, clu_id: str) -> None:
+        """Connect, ping and register one CLU, retrying with backoff until it answers."""
+        delay = MIN_CLU_RETRY_DELAY
+        record = True
+        try:
+            while True:
+                ready = await self._try_bring_up(clu_id, record)
+                if record:
+                    record = False
+                    self.startup_timeline.complete(clu_id)
+                if ready:
+                    break
+                _LOGGER.warning("[%s] CLU not ready, retrying in %.0f s", clu_id, delay)
+                await asyncio.sleep(delay)
+                delay = min(MAX_CLU_RETRY_DELAY, delay * 2)
+            self._mark_clu_ready(clu_id)
+        finally:
+            self._startup_tasks.pop(clu_id, None)
+
+    async def _try_bring_up(self, clu_id: str, record: bool) -> bool:
+        """One connect/ping/register pass, recorded in the startup timeline if ``record``."""
+        api = self._apis[clu_id]
+        timeline = self.startup_timeline
+
+        if api.protocol is None:
+            started = time.monotonic()
+            connected = await self._connect_api(api)
+            if record:
+                timeline.add("connect", time.monotonic() - started, clu_id, success=connected)
+            if not connected:
+                return False
+
+        started = time.monotonic()
+        success = await self._send_ping(clu_id)
+        if record:
+            timeline.add("ping", time.monotonic() - started, clu_id, success=success)
+        if not success:
+            return False
+
+        started = time.monotonic()
+        success = await self._send_register(clu_id)
+        if record:
+            timeline.add("register", time.monotonic() - started, clu_id, success=success, chunks=api.register_timings())
+        return success
+
+    @callback
+    def _record_gateway_timing(self, clu_id: str, phase: str, duration: float, details: dict[str, Any]) -> None:
+        """Startup phases measured in the gateway process; its first register completes the CLU."""
+        timeline = self.startup_timeline
+        if not timeline.is_pending(clu_id):
+            return
+        timeline.add(phase, duration, clu_id, **details)
+        if phase == "register":
+            timeline.complete(clu_id)
+
+    async def _connect_api(self, api: GrentonCluApi) -> bool:
         """Connect a single API instance."""
         try:
-            success = await api.connect()
+            success = await self._run_io(api.connect())
             if not success:
                 _LOGGER.error("Failed to connect API for CLU %s", api.clu.id)
-                return
+                return False
             
             # Each chunk's subscription socket reports through this single hook;
             # the API layer fans out per-chunk callbacks internally.
-            async def handle_subscription(
+            @callback
+            def handle_subscription(
                 keys: list[GrentonCluStateVariableKey | GrentonCluStateAttributeKey],
                 values: list[GrentonValue],
             ) -> None:
-                await self._process_report(api.clu.id, keys, values)
+                self._process_report(api.clu.id, keys, values)
             api.on_subscription_report = handle_subscription
+            api.value_decoder = self.state.clus[api.clu.id].get_value_decoder
+            return True
         except Exception as e:
             _LOGGER.error("Error connecting API for CLU %s: %s", api.clu.id, e)
+            return False
     
     async def async_shutdown(self) -> None:
         # Cancel background tasks
+        startup_tasks = list(self._startup_tasks.values())
+        for task in startup_tasks:
+            task.cancel()
+        await asyncio.gather(*startup_tasks, return_exceptions=True)
+
         if hasattr(self, '_ping_task'):
             self._ping_task.cancel()
             try:
@@ -218,14 +804,28 @@ class GrentonCoordinator(DataUpdateCoordinator):
         
         await asyncio.gather(*disconnect_tasks, return_exceptions=True)
         self._apis.clear()
+
+        if self._io_thread is not None:
+            await self._io_thread.stop()
+
+        if self._gateway is not None:
+            await self._gateway.stop()
+
+        # Write what changed since the last snapshot, a reload reads it right away
+        await self._state_store.async_save(self._state_snapshot_data())
     
     async def _disconnect_api(self, api: GrentonCluApi) -> None:
         """Disconnect a single API instance."""
         try:
-            await api.disconnect()
+            await self._run_io(self._close_api(api))
         except Exception as e:
             _LOGGER.error("Error disconnecting API for CLU %s: %s", api.clu.id, e)
     
+    async def _close_api(self, api: GrentonCluApi) -> None:
+        # Batchers live on the socket loop, drop their queue there
+        self._report_batchers[api.clu.id].cancel()
+        await api.disconnect()
+
     def get_value_for_component(self, state: GrentonStateObject) -> GrentonValue | None:
         """Get the value for a component from the state."""
         return self.state.get_value_for_component(state)
@@ -0,0 +1,25 @@
+"""Diagnostics support for Grenton integration."""
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+
+from . import GrentonConfigEntry
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant,
+    config_entry: GrentonConfigEntry,
+) -> dict[str, Any]:
+    """Startup timeline and runtime metrics of the coordinator.
+
+    The interface and its encryption key are left out on purpose.
+    """
+    coordinator = config_entry.runtime_data.coordinator
+    return {
+        "settings": coordinator.settings,
+        "startup": coordinator.startup_timeline.as_dict(),
+        "clus": coordinator.clu_diagnostics(),
+        "report_batches": coordinator.report_batch_metrics(),
+        "coalesced_writes": coordinator.coalesced_writes,
+        "gateway": coordinator.gateway_metrics(),
+    }
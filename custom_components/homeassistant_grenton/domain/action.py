@@ -1,3 +1,4 @@
+import sys
 from abc import ABC
 from dataclasses import dataclass
 
@@ -5,7 +6,7 @@ from .enums import GrentonActionEventType
 
 from ..dto.action import GrentonActionAttributeDto, GrentonActionVariableDto, GrentonActionMethodDto, GrentonActionScriptDto, GrentonActionUnionDto
 
-@dataclass
+@dataclass(slots=True)
 class GrentonAction(ABC):
     clu_id: str
     object_name: str
@@ -25,56 +26,56 @@ class GrentonAction(ABC):
         
         raise ValueError()
     
-@dataclass
+@dataclass(slots=True)
 class GrentonActionAttribute(GrentonAction):
     index: str
 
     @staticmethod
     def create(dto: GrentonActionAttributeDto) -> "GrentonActionAttribute":
         return GrentonActionAttribute(
-            clu_id=dto.cluId,
-            object_name=dto.objectName,
+            clu_id=sys.intern(dto.cluId),
+            object_name=sys.intern(dto.objectName),
             event=dto.event,
             value=dto.value,
-            index=dto.index,
+            index=sys.intern(dto.index),
         )
     
-@dataclass
+@dataclass(slots=True)
 class GrentonActionVariable(GrentonAction):
     index: str
 
     @staticmethod
     def create(dto: GrentonActionVariableDto) -> "GrentonActionVariable":
         return GrentonActionVariable(
-            clu_id=dto.cluId,
-            object_name=dto.objectName,
+            clu_id=sys.intern(dto.cluId),
+            object_name=sys.intern(dto.objectName),
             event=dto.event,
             value=dto.value,
-            index=dto.index,
+            index=sys.intern(dto.index),
         )
     
-@dataclass
+@dataclass(slots=True)
 class GrentonActionMethod(GrentonAction):
     index: str
 
     @staticmethod
     def create(dto: GrentonActionMethodDto) -> "GrentonActionMethod":
         return GrentonActionMethod(
-            clu_id=dto.cluId,
-            object_name=dto.objectName,
+            clu_id=sys.intern(dto.cluId),
+            object_name=sys.intern(dto.objectName),
             event=dto.event,
             value=dto.value,
-            index=dto.index,
+            index=sys.intern(dto.index),
         )
     
-@dataclass
+@dataclass(slots=True)
 class GrentonActionScript(GrentonAction):
 
     @staticmethod
     def create(dto: GrentonActionScriptDto) -> "GrentonActionScript":
         return GrentonActionScript(
-            clu_id=dto.cluId,
-            object_name=dto.objectName,
+            clu_id=sys.intern(dto.cluId),
+            object_name=sys.intern(dto.objectName),
             event=dto.event,
             value=dto.value,
         )
\ No newline at end of file
@@ -0,0 +1,129 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING, Optional
+import logging
+import asyncio
+
+from ..action import GrentonAction
+from ..cipher import GrentonCipher
+from .clu_messages import GrentonCluApiActionRequest, MSG_ID_PLACEHOLDER
+
+if TYPE_CHECKING:
+    from .clu import GrentonCluApi
+
+_LOGGER = logging.getLogger(__name__)
+
+# Wire overhead of an action request around its payloads: "req::{8 hex}:..."
+_REQUEST_OVERHEAD = len(f'req::{MSG_ID_PLACEHOLDER}:')
+# Added per payload when several are chained: "(... or 1) and "
+_SEQUENCE_ITEM_OVERHEAD = len("( or 1) and ")
+
+
+class GrentonCluActionBatcher:
+    """Collects actions for one CLU and sends them as a single request.
+
+    Actions submitted during the same event loop iteration (e.g. an HA scene
+    turning on many lights) are joined into one Lua payload. Batches are
+    split only when the encrypted request would exceed the CLU's payload
+    budget, never inside a sequence from submit_sequence.
+
+    Actions run in submission order: within a request the payloads are
+    chained so the CLU runs them in queue order (see
+    GrentonCluApiActionRequest.sequence), and the requests of one flush are
+    sent one after another. A request that fails for several callers is
+    resent per caller if it is idempotent, so one bad action does not fail
+    the others; otherwise every caller in it gets False.
+    """
+
+    def __init__(self, api: GrentonCluApi):
+        self.api = api
+        self._queue: list[tuple[str, bool, asyncio.Future[bool]]] = []
+        self._flush_handle: Optional[asyncio.Handle] = None
+        # Strong references, the loop only keeps weak ones to running tasks
+        self._send_tasks: set[asyncio.Task[None]] = set()
+
+    def submit(self, action: GrentonAction) -> asyncio.Future[bool]:
+        """Queue an action; the future resolves to whether the CLU acknowledged it."""
+        return self.submit_sequence([action])
+
+    def submit_sequence(self, actions: list[GrentonAction]) -> asyncio.Future[bool]:
+        """Queue actions that must run in the given order, in the same request.
+
+        The future resolves to whether the CLU acknowledged all of them.
+        """
+        # Render now: entities reuse and mutate their action objects.
+        payload = GrentonCluApiActionRequest.sequence(
+            [GrentonCluApiActionRequest.payload_for(action) for action in actions]
+        )
+        idempotent = all(GrentonCluApiActionRequest.is_idempotent(action) for action in actions)
+
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[bool] = loop.create_future()
+        self._queue.append((payload, idempotent, future))
+        if self._flush_handle is None:
+            self._flush_handle = loop.call_soon(self._flush)
+        return future
+
+    def _flush(self) -> None:
+        self._flush_handle = None
+        queued, self._queue = self._queue, []
+        task = asyncio.get_running_loop().create_task(self._send_batches(self._split(queued)))
+        self._send_tasks.add(task)
+        task.add_done_callback(self._send_tasks.discard)
+
+    async def _send_batches(self, batches: list[list[tuple[str, bool, asyncio.Future[bool]]]]) -> None:
+        for batch in batches:
+            await self._send(batch)
+
+    def _split(
+        self,
+        queued: list[tuple[str, bool, asyncio.Future[bool]]],
+    ) -> list[list[tuple[str, bool, asyncio.Future[bool]]]]:
+        """Split queued actions into batches that fit the payload budget, keeping order."""
+        batches: list[list[tuple[str, bool, asyncio.Future[bool]]]] = []
+        batch: list[tuple[str, bool, asyncio.Future[bool]]] = []
+        size = _REQUEST_OVERHEAD
+        for item in queued:
+            item_size = len(item[0].encode()) + _SEQUENCE_ITEM_OVERHEAD
+            if batch and GrentonCipher.encrypted_size(size + item_size) > self.api.max_payload_bytes:
+                batches.append(batch)
+                batch = []
+                size = _REQUEST_OVERHEAD
+            batch.append(item)
+            size += item_size
+        if batch:
+            batches.append(batch)
+        return batches
+
+    async def _send(self, batch: list[tuple[str, bool, asyncio.Future[bool]]]) -> None:
+        futures = [future for _, _, future in batch]
+        # One non-idempotent call makes the whole batch unsafe to resend
+        idempotent = all(item_idempotent for _, item_idempotent, _ in batch)
+        try:
+            protocol = self.api.protocol
+            if not protocol:
+                _LOGGER.warning("[%s] No protocol available for action execution", self.api.clu.id)
+                success = False
+            else:
+                request = GrentonCluApiActionRequest.from_payloads(
+                    [payload for payload, _, _ in batch],
+                    idempotent=idempotent,
+                )
+                if len(batch) > 1:
+                    _LOGGER.debug("[%s] Sending %d actions in one request", self.api.clu.id, len(batch))
+                success = await protocol.send_request(request) is not None
+        except Exception as e:
+            for future in futures:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        if not success and idempotent and len(batch) > 1:
+            # Find out which caller's action failed instead of failing them all
+            _LOGGER.debug("[%s] Batch of %d actions failed, resending them one by one", self.api.clu.id, len(batch))
+            for item in batch:
+                await self._send([item])
+            return
+
+        for future in futures:
+            if not future.done():
+                future.set_result(success)
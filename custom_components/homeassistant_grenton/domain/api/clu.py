@@ -1,29 +1,56 @@
 from __future__ import annotations
 from dataclasses import dataclass
-from typing import Any, Optional, Dict, Callable, Awaitable
+from typing import Any, Optional, Dict, Callable
 import logging
 import asyncio
+import heapq
 import secrets
+import time
 
 from ..clu import GrentonClu
 from ..encryption import GrentonEncryption
 from ..action import GrentonAction
-from ...state import GrentonCluStateVariableKey, GrentonCluStateAttributeKey, GrentonValue
-from ..cipher import GrentonCipher
+from ...state import GrentonCluStateVariableKey, GrentonCluStateAttributeKey, GrentonValue, GrentonValueDecoder
+from ..cipher import GrentonCipher, GrentonDatagramDecryptor
+from .action_batcher import GrentonCluActionBatcher
+from .rtt import GrentonRttEstimator, REGISTER_MIN_RTO
 from .clu_messages import (
     GrentonCluApiMessageParser,
+    GrentonCluApiParsedMessage,
     GrentonCluApiPingRequest,
+    GrentonCluApiProbeRequest,
     GrentonCluApiClientRegisterRequest,
-    GrentonCluApiClientRegisterResponse,
-    GrentonCluApiClientReportNotification,
-    GrentonCluApiActionRequest,
 )
+from .clu_messages.report_values import GrentonReportValueDecoder
 
 _LOGGER = logging.getLogger(__name__)
 
-# CLU's UDP buffer caps how many keys fit in one clientRegister payload.
-# 30 keys is empirically safe; payload + AES padding stays under the MTU.
-MAX_KEYS_PER_REGISTER = 30
+# CLU's UDP buffer caps the size of one encrypted request. Register chunks
+# are packed by bytes rather than key count; 512 bytes fits ~30 typical keys
+# and is safe on every CLU seen so far.
+DEFAULT_MAX_PAYLOAD_BYTES = 512
+
+# Upper bound for payload probing: largest AES block multiple that fits a
+# 1500-byte Ethernet MTU after IPv4 + UDP headers (1472 bytes).
+PROBE_MAX_PAYLOAD_BYTES = 1472
+
+# Retransmissions of an idempotent request before giving up on it. Resends
+# are spaced by the CLU's RTO with exponential backoff, all within the
+# protocol's response timeout.
+MAX_RETRANSMISSIONS = 3
+
+# Reports do not extend a subscription on the CLU, only clientRegister does.
+# A chunk is re-registered once its last answered registration is this old,
+# which keeps it inside the CLU's lease.
+SUBSCRIPTION_RENEW_AFTER = 45.0
+
+# A chunk that has been reporting at a steady rate is renewed early once it
+# stays quiet for this many of its usual report intervals, and for at least
+# SUBSCRIPTION_SILENT_MIN seconds: its subscription is probably gone. Chunks
+# without a rhythm (cold keys, or no reports since the last renewal) are
+# only renewed by lease age.
+SUBSCRIPTION_SILENT_INTERVALS = 5
+SUBSCRIPTION_SILENT_MIN = 15.0
 
 StateKey = GrentonCluStateVariableKey | GrentonCluStateAttributeKey
 
@@ -40,29 +67,77 @@ class _SubscriptionEndpoint:
     protocol: "GrentonCluApiProtocol"
     keys: list[StateKey]
     session_id: int
+    # Duration of the last clientRegister round trip, for diagnostics
+    register_time: Optional[float] = None
+    # time.monotonic() of the last answered clientRegister
+    last_registered: float = 0.0
+    # Reports decoded on the socket when the last register response arrived
+    reports_at_register: int = 0
+
+    def initial_values(self, values: list[GrentonValue]) -> list[GrentonValue]:
+        """Register response values, or all None once a report superseded them.
+
+        A report carries every value of the chunk and is applied as it
+        arrives, so register values applied after it would only roll the
+        chunk back.
+        """
+        if self.protocol.report_decoder.reports != self.reports_at_register:
+            return [None] * len(values)
+        return values
+
+    def is_due_for_renewal(self, now: float) -> bool:
+        """Whether the chunk's lease is close to expiring or its reports stopped."""
+        if now - self.last_registered >= SUBSCRIPTION_RENEW_AFTER:
+            return True
+        interval = self.protocol.report_interval
+        if interval is None:
+            return False
+        quiet = now - max(self.protocol.last_report, self.last_registered)
+        return quiet >= max(SUBSCRIPTION_SILENT_MIN, SUBSCRIPTION_SILENT_INTERVALS * interval)
 
 
 class GrentonCluApi:
     """Handles all communication with Grenton CLUs via UDP."""
 
-    def __init__(self, clu: GrentonClu, encryption: GrentonEncryption):
+    def __init__(self, clu: GrentonClu, encryption: GrentonEncryption, probe_payload_size: bool = False):
         self.clu = clu
         self.encryption = encryption
         self.cipher = GrentonCipher(encryption)
 
+        # Largest encrypted request this CLU accepts. Learned once per CLU
+        # when probing is enabled, otherwise the conservative default.
+        self.max_payload_bytes = DEFAULT_MAX_PAYLOAD_BYTES
+        self._probe_payload_size = probe_payload_size
+        self._payload_probed = False
+
+        # Round-trip estimates shared by all of this CLU's sockets: one for
+        # pings and actions, one for the much slower clientRegister
+        self.rtt = GrentonRttEstimator()
+        self.register_rtt = GrentonRttEstimator(min_rto=REGISTER_MIN_RTO)
+
+        # Joins actions issued in the same loop iteration into one request
+        self._action_batcher = GrentonCluActionBatcher(self)
+
         # Main socket — used for pings and actions only.
         self.transport: Optional[asyncio.DatagramTransport] = None
         self.protocol: Optional[GrentonCluApiProtocol] = None
-        self.keep_alive_id = secrets.token_hex(4)
 
         # One socket per chunk of subscribed keys. Reports arrive on the same
         # socket that registered them, so mapping is implicit.
         self._subscription_endpoints: list[_SubscriptionEndpoint] = []
 
-        # Set by the coordinator; invoked with (keys, values) for every report.
+        # Set by the coordinator; invoked synchronously with (keys, values)
+        # for every report, in the order the reports arrived on their socket.
         self.on_subscription_report: Optional[
-            Callable[[list[StateKey], list[GrentonValue]], Awaitable[None]]
+            Callable[[list[StateKey], list[GrentonValue]], None]
         ] = None
+        # Set by the coordinator; picks the report value decoder for a key
+        self.value_decoder: Optional[Callable[[StateKey], GrentonValueDecoder]] = None
+
+        # Chunks of the last key list passed in, see _chunk_keys
+        self._chunked_keys: Optional[list[StateKey]] = None
+        self._chunked_payload_bytes = 0
+        self._chunks: list[list[StateKey]] = []
 
     async def connect(self) -> bool:
         """Open the main UDP socket used for pings and actions."""
@@ -96,16 +171,39 @@ class GrentonCluApi:
         self.protocol = None
 
     async def _close_subscription_endpoints(self) -> None:
-        for endpoint in self._subscription_endpoints:
+        self._close_endpoints(self._subscription_endpoints)
+        self._subscription_endpoints = []
+
+    def _close_endpoints(self, endpoints: list[_SubscriptionEndpoint]) -> None:
+        for endpoint in endpoints:
             try:
                 endpoint.transport.close()
             except Exception as e:
                 _LOGGER.debug("[%s] Error closing subscription socket sid=%d: %s",
                               self.clu.id, endpoint.session_id, e)
-        if self._subscription_endpoints:
+        if endpoints:
             _LOGGER.debug("[%s] Closed %d subscription socket(s)",
-                          self.clu.id, len(self._subscription_endpoints))
-        self._subscription_endpoints = []
+                          self.clu.id, len(endpoints))
+
+    def decrypt_stats(self) -> dict[str, int]:
+        """Receive-path decryption counters summed over the subscription sockets."""
+        stats = {"datagrams": 0, "duplicates": 0}
+        for endpoint in self._subscription_endpoints:
+            decryptor = endpoint.protocol.decryptor
+            stats["datagrams"] += decryptor.datagrams
+            stats["duplicates"] += decryptor.duplicates
+        return stats
+
+    def register_timings(self) -> list[dict[str, Any]]:
+        """Last clientRegister duration of each subscription chunk."""
+        return [
+            {
+                "session_id": endpoint.session_id,
+                "keys": len(endpoint.keys),
+                "register_ms": round(endpoint.register_time * 1000, 1) if endpoint.register_time is not None else None,
+            }
+            for endpoint in self._subscription_endpoints
+        ]
 
     async def ping(self) -> bool:
         """Send a keep-alive ping on the main socket."""
@@ -113,17 +211,65 @@ class GrentonCluApi:
             _LOGGER.warning("[%s] No protocol available for ping", self.clu.id)
             return False
 
-        request = GrentonCluApiPingRequest(self.keep_alive_id)
-        wire_message = await self.protocol.send_request(request)
-        return wire_message is not None
+        request = GrentonCluApiPingRequest()
+        response = await self.protocol.send_request(request)
+        return response is not None
+
+    async def probe_max_payload(self) -> int:
+        """Find the largest encrypted request the CLU answers and cache it.
+
+        Tries the MTU ceiling first (one round-trip on healthy networks), then
+        binary-searches down to the default in AES block steps. A lost probe
+        costs a request timeout, so this only runs once per CLU.
+        """
+        if self._payload_probed or not self.protocol:
+            return self.max_payload_bytes
+
+        async def accepted(size: int) -> bool:
+            assert self.protocol is not None
+            return await self.protocol.send_request(GrentonCluApiProbeRequest(size)) is not None
+
+        low, high = DEFAULT_MAX_PAYLOAD_BYTES, PROBE_MAX_PAYLOAD_BYTES
+        if await accepted(high):
+            low = high
+        while high - low > 16:
+            middle = (low + high) // 32 * 16
+            if await accepted(middle):
+                low = middle
+            else:
+                high = middle
+
+        self.max_payload_bytes = low
+        self._payload_probed = True
+        _LOGGER.debug("[%s] CLU accepts payloads up to %d bytes", self.clu.id, low)
+        return low
+
+    def _chunk_keys(self, keys: list[StateKey]) -> list[list[StateKey]]:
+        """Chunks of ``keys``, cached while the same list object is passed in.
+
+        Callers pass a subscription order that is replaced, never mutated,
+        when it changes, so the renewal check every few seconds does not
+        re-pack the keys.
+        """
+        if keys is not self._chunked_keys or self.max_payload_bytes != self._chunked_payload_bytes:
+            self._chunks = GrentonCluApiClientRegisterRequest.pack_keys(keys, self.max_payload_bytes)
+            self._chunked_keys = keys
+            self._chunked_payload_bytes = self.max_payload_bytes
+        return self._chunks
 
     async def register_component_states(self, keys: list[StateKey]) -> list[GrentonValue] | None:
-        """Register state keys as one sub-subscription per chunk of MAX_KEYS_PER_REGISTER.
+        """Register state keys as one sub-subscription per payload-sized chunk.
 
         Each chunk gets its own UDP socket so that subsequent clientReport
         notifications can be routed back to the right keys without relying on
         any identifier inside the report payload.
 
+        Renewal is make-before-break: a chunk whose key membership is unchanged
+        keeps its socket, protocol and session id and simply re-sends
+        clientRegister, so reports keep flowing while it renews. Sockets are
+        only opened for new chunks and closed for chunks that no longer exist,
+        after the new registrations went out.
+
         Returns initial values in the same order as the input ``keys``; positions
         for chunks that failed are filled with None.
         """
@@ -131,27 +277,107 @@ class GrentonCluApi:
             _LOGGER.debug("[%s] No state keys to register", self.clu.id)
             return None
 
-        await self._close_subscription_endpoints()
+        if self._probe_payload_size:
+            await self.probe_max_payload()
+
+        chunks = self._chunk_keys(keys)
+
+        reusable = {
+            tuple(endpoint.keys): endpoint
+            for endpoint in self._subscription_endpoints
+            if not endpoint.transport.is_closing()
+        }
+        endpoints = [reusable.pop(tuple(chunk), None) for chunk in chunks]
+        kept = {id(endpoint) for endpoint in endpoints if endpoint is not None}
+        stale = [
+            endpoint for endpoint in self._subscription_endpoints
+            if id(endpoint) not in kept
+        ]
 
-        chunks = [
-            keys[i : i + MAX_KEYS_PER_REGISTER]
-            for i in range(0, len(keys), MAX_KEYS_PER_REGISTER)
+        opened = await asyncio.gather(*(
+            self._open_endpoint(chunk)
+            for chunk, endpoint in zip(chunks, endpoints)
+            if endpoint is None
+        ))
+        opened_iter = iter(opened)
+        endpoints = [endpoint or next(opened_iter) for endpoint in endpoints]
+        self._subscription_endpoints = [endpoint for endpoint in endpoints if endpoint is not None]
+        for endpoint in self._subscription_endpoints:
+            endpoint.protocol.report_decoder = GrentonReportValueDecoder(self._value_decoders(endpoint.keys))
+
+        results = await asyncio.gather(*(
+            self._register_endpoint(endpoint, chunk)
+            for chunk, endpoint in zip(chunks, endpoints)
+        ))
+        results = [
+            endpoint.initial_values(values) if endpoint is not None else values
+            for endpoint, values in zip(endpoints, results)
         ]
 
-        results = await asyncio.gather(*(self._setup_chunk(chunk) for chunk in chunks))
+        # Break only after make: old sockets stay open until the new
+        # registrations have been answered (or timed out).
+        self._close_endpoints(stale)
+
         return [value for chunk_values in results for value in chunk_values]
 
-    async def _setup_chunk(self, chunk: list[StateKey]) -> list[GrentonValue]:
-        """Open a dedicated socket, register the chunk, return its initial values."""
+    async def renew_component_states(self, keys: list[StateKey]) -> list[GrentonValue] | None:
+        """Re-register only the chunks whose lease is about to lapse or whose reports stopped.
+
+        Falls back to a full register_component_states when the chunk layout
+        no longer matches ``keys`` (keys added or a socket went away). Returns
+        values aligned with ``keys``; positions of chunks that were not renewed
+        or failed are None. Returns None when nothing was sent.
+        """
+        if not keys:
+            return None
+
+        chunks = self._chunk_keys(keys)
+        endpoints = self._subscription_endpoints
+        if len(endpoints) != len(chunks) or any(
+            (endpoint.keys is not chunk and endpoint.keys != chunk) or endpoint.transport.is_closing()
+            for endpoint, chunk in zip(endpoints, chunks)
+        ):
+            return await self.register_component_states(keys)
+
+        now = time.monotonic()
+        due = [endpoint for endpoint in endpoints if endpoint.is_due_for_renewal(now)]
+        if not due:
+            return None
+
+        _LOGGER.debug("[%s] Renewing %d of %d subscription chunk(s)",
+                      self.clu.id, len(due), len(endpoints))
+        for endpoint in due:
+            # A chunk has to show a report rhythm again before silence counts
+            endpoint.protocol.report_interval = None
+        renewed = {
+            id(endpoint): endpoint.initial_values(values)
+            for endpoint, values in zip(
+                due,
+                await asyncio.gather(*(self._register_endpoint(endpoint, endpoint.keys) for endpoint in due)),
+            )
+        }
+        return [
+            value
+            for endpoint in endpoints
+            for value in renewed.get(id(endpoint), [None] * len(endpoint.keys))
+        ]
+
+    def _value_decoders(self, keys: list[StateKey]) -> list[GrentonValueDecoder] | None:
+        if self.value_decoder is None:
+            return None
+        return [self.value_decoder(key) for key in keys]
+
+    async def _open_endpoint(self, chunk: list[StateKey]) -> _SubscriptionEndpoint | None:
+        """Open a dedicated socket for a chunk of keys."""
         session_id = secrets.randbelow(65535) + 1  # 1..65535, avoid 0
         loop = asyncio.get_event_loop()
 
         protocol = GrentonCluApiProtocol(self)
 
         # Closure binds this chunk's keys to incoming reports on this socket.
-        async def on_report(values: list[GrentonValue]) -> None:
+        def on_report(values: list[GrentonValue]) -> None:
             if self.on_subscription_report is not None:
-                await self.on_subscription_report(chunk, values)
+                self.on_subscription_report(chunk, values)
         protocol.subscription_callback = on_report
 
         try:
@@ -162,34 +388,84 @@ class GrentonCluApi:
         except Exception as e:
             _LOGGER.error("[%s] Failed to create subscription socket (sid=%d): %s",
                           self.clu.id, session_id, e)
-            return [None] * len(chunk)
+            return None
 
-        endpoint = _SubscriptionEndpoint(transport, protocol, chunk, session_id)
-        self._subscription_endpoints.append(endpoint)
         _LOGGER.debug("[%s] Opened subscription socket sid=%d for %d key(s)",
                       self.clu.id, session_id, len(chunk))
+        return _SubscriptionEndpoint(transport, protocol, chunk, session_id)
+
+    async def _register_endpoint(
+        self,
+        endpoint: _SubscriptionEndpoint | None,
+        chunk: list[StateKey],
+    ) -> list[GrentonValue]:
+        """Send clientRegister for a chunk on its socket, return its initial values."""
+        if endpoint is None:
+            return [None] * len(chunk)
 
-        request = GrentonCluApiClientRegisterRequest(chunk, session_id, secrets.token_hex(4))
-        wire = await protocol.send_request(request)
-        if wire is None:
+        request = GrentonCluApiClientRegisterRequest(endpoint.keys, endpoint.session_id)
+        started = time.monotonic()
+        response = await endpoint.protocol.send_request(request)
+        endpoint.register_time = time.monotonic() - started
+        if response is None:
             return [None] * len(chunk)
+        endpoint.last_registered = time.monotonic()
+        decoder = endpoint.protocol.report_decoder
+        endpoint.reports_at_register = decoder.reports
         try:
-            return GrentonCluApiClientRegisterResponse(wire).values
+            return decoder.decode(response.values)
         except ValueError as e:
             _LOGGER.error("[%s] Failed to parse register response (sid=%d): %s",
-                          self.clu.id, session_id, e)
+                          self.clu.id, endpoint.session_id, e)
             return [None] * len(chunk)
 
     async def execute_action(self, action: GrentonAction) -> bool:
-        """Execute an action on the CLU via the main socket."""
+        """Execute an action on the CLU via the main socket.
+
+        Actions issued concurrently are batched into a single request.
+        """
         if not self.protocol:
             _LOGGER.warning("[%s] No protocol available for action execution", self.clu.id)
             return False
 
-        request = GrentonCluApiActionRequest.from_action(action)
-        wire_message = await self.protocol.send_request(request)
+        return await self._action_batcher.submit(action)
+
+    async def execute_actions(self, actions: list[GrentonAction]) -> bool:
+        """Execute actions on the CLU in the given order, as one request.
+
+        Returns True only if the CLU acknowledged all of them.
+        """
+        if not self.protocol:
+            _LOGGER.warning("[%s] No protocol available for action execution", self.clu.id)
+            return False
+
+        return await self._action_batcher.submit_sequence(actions)
+
+
+class _PendingRequest:
+    """In-flight request waiting for its response."""
 
-        return wire_message is not None
+    __slots__ = ("future", "encrypted", "rtt", "sent_at", "deadline", "next_at", "retransmissions", "max_retransmissions")
+
+    def __init__(
+        self,
+        future: asyncio.Future[Optional[GrentonCluApiParsedMessage]],
+        encrypted: bytes,
+        rtt: GrentonRttEstimator,
+        sent_at: float,
+        deadline: float,
+        max_retransmissions: int,
+    ):
+        self.future = future
+        self.encrypted = encrypted
+        # Estimate this request's timeouts come from and its sample goes to
+        self.rtt = rtt
+        self.sent_at = sent_at
+        self.deadline = deadline
+        # Loop time of the next retransmission or of the timeout
+        self.next_at = deadline
+        self.retransmissions = 0
+        self.max_retransmissions = max_retransmissions
 
 
 class GrentonCluApiProtocol(asyncio.DatagramProtocol):
@@ -199,17 +475,40 @@ class GrentonCluApiProtocol(asyncio.DatagramProtocol):
     incoming clientReport notifications to its ``subscription_callback``.
     Subscription sockets have a callback that knows their chunk's keys via
     closure; the main socket leaves the callback unset.
+
+    Incoming datagrams are handled synchronously inside datagram_received:
+    pending futures are resolved in place and reports are applied in arrival
+    order, so a newer report on a socket can never be overtaken by an older
+    one. All state here is touched only from the event loop, hence no locks.
+
+    Requests get msg_ids from a per-socket 32-bit counter (random start, never
+    00000000 which marks notifications, skipping IDs still in flight). All
+    retransmissions and timeouts are driven by one timer per socket over a
+    heap of deadlines, so a request costs no extra task or timer. Entries of
+    answered requests stay in the heap and are skipped when they come due;
+    the heap is cleared whenever the socket has nothing in flight.
     """
 
     def __init__(self, api: GrentonCluApi):
         self.api = api
         self.transport: Optional[asyncio.DatagramTransport] = None
-        self._pending: Dict[str, asyncio.Future[str]] = {}
-        self._pending_lock = asyncio.Lock()
+        self._pending: Dict[str, _PendingRequest] = {}
+        self._next_msg_id = secrets.randbits(32)
+        # (loop time, msg_id) entries; stale ones are skipped when popped
+        self._deadlines: list[tuple[float, str]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._timer_at = 0.0
         self._response_timeout = 5.0
+        self.decryptor = GrentonDatagramDecryptor(api.cipher)
+        # time.monotonic() of the last report on this socket, and the
+        # smoothed time between reports (None until two reports arrived)
+        self.last_report = 0.0
+        self.report_interval: Optional[float] = None
         self.subscription_callback: Optional[
-            Callable[[list[GrentonValue]], Awaitable[None]]
+            Callable[[list[GrentonValue]], None]
         ] = None
+        # Decodes this socket's reports with the decoders of its chunk's keys
+        self.report_decoder = GrentonReportValueDecoder()
 
     def connection_made(self, transport: asyncio.DatagramTransport) -> None:
         self.transport = transport
@@ -220,7 +519,13 @@ class GrentonCluApiProtocol(asyncio.DatagramProtocol):
 
     def _handle_incoming_data(self, data: bytes) -> None:
         """Handle incoming UDP data from the CLU."""
-        decrypted = self.api.cipher.decrypt(data)
+        if self.decryptor.is_duplicate(data):
+            # Same report as before (CLUs resend unchanged state): nothing to
+            # apply, but the subscription is evidently alive
+            self._note_report()
+            return
+
+        decrypted = self.decryptor.decrypt(data)
         if decrypted is None:
             _LOGGER.warning("[%s] Failed to decrypt message: %s",
                             self.api.clu.name, data.hex())
@@ -233,88 +538,178 @@ class GrentonCluApiProtocol(asyncio.DatagramProtocol):
                             self.api.clu.name, decrypted.hex())
             return
 
-        if not GrentonCluApiMessageParser.is_valid_response(plaintext):
+        parts = GrentonCluApiMessageParser.split(plaintext)
+        if parts is None:
             _LOGGER.debug("[%s] Received unsupported message: %s",
                           self.api.clu.name, plaintext)
             return
 
-        self._process_response(plaintext)
-
-    def _process_response(self, wire_message: str) -> None:
-        """Process a response message from the CLU."""
-        parts = wire_message.split(":", 3)
-        if len(parts) != 4:
-            _LOGGER.warning("[%s] Invalid wire message format", self.api.clu.name)
-            return
+        self._process_response(parts, plaintext)
 
+    def _process_response(self, parts: list[str], wire_message: str) -> None:
+        """Process a response message from the CLU, split by GrentonCluApiMessageParser.split."""
         message_id = parts[2].lower()
         _LOGGER.debug("[%s][%s] Received: %s", self.api.clu.name, message_id, wire_message)
 
-        async def _complete() -> None:
-            async with self._pending_lock:
-                fut = self._pending.pop(message_id, None)
+        pending = self._pending.pop(message_id, None)
+        if pending is not None:
+            if not pending.future.done():
+                # Karn: a retransmitted request gives no usable RTT sample
+                if not pending.retransmissions:
+                    pending.rtt.sample(asyncio.get_running_loop().time() - pending.sent_at)
+                pending.future.set_result(GrentonCluApiParsedMessage(parts, message_id, wire_message))
+            return
 
-            if fut and not fut.done():
-                fut.set_result(wire_message)
-            else:
-                if GrentonCluApiMessageParser.is_client_report(wire_message):
-                    if self.subscription_callback:
-                        try:
-                            notification = GrentonCluApiClientReportNotification(wire_message)
-                        except ValueError as e:
-                            _LOGGER.error("[%s] Failed to parse client report: %s",
-                                          self.api.clu.name, e)
-                            return
-                        await self.subscription_callback(notification.values)
-                    else:
-                        _LOGGER.debug("[%s][%s] Received report but no callback registered",
-                                      self.api.clu.name, message_id)
-                else:
-                    _LOGGER.debug("[%s][%s] Response received with no pending request",
-                                  self.api.clu.name, message_id)
-
-        asyncio.create_task(_complete())
-
-    async def send_request(self, request: Any, message_id: Optional[str] = None) -> Optional[str]:
-        """Send a request via this socket's transport and wait for a matching response."""
+        if not GrentonCluApiMessageParser.is_report(parts, message_id):
+            _LOGGER.debug("[%s][%s] Response received with no pending request",
+                          self.api.clu.name, message_id)
+            return
+
+        self._note_report()
+        if not self.subscription_callback:
+            _LOGGER.debug("[%s][%s] Received report but no callback registered",
+                          self.api.clu.name, message_id)
+            return
+
+        # Reports are routed straight from the split parts, without a message object
+        values = GrentonCluApiMessageParser.report_values(parts)
+        if values is None:
+            _LOGGER.debug("[%s][%s] Received report without a value list",
+                          self.api.clu.name, message_id)
+            return
+
+        try:
+            self.subscription_callback(self.report_decoder.decode_changes(values))
+        except Exception:
+            _LOGGER.exception("[%s] Error while applying client report", self.api.clu.name)
+
+    def _note_report(self) -> None:
+        now = time.monotonic()
+        if self.last_report:
+            gap = now - self.last_report
+            interval = self.report_interval
+            self.report_interval = gap if interval is None else interval + (gap - interval) / 8
+        self.last_report = now
+
+    def _allocate_msg_id(self) -> str:
+        """Next free 8-hex-digit msg_id; wraps around, skips 0 and IDs in flight."""
+        while True:
+            self._next_msg_id = (self._next_msg_id + 1) & 0xFFFFFFFF
+            if not self._next_msg_id:
+                continue
+            msg_id = f"{self._next_msg_id:08x}"
+            if msg_id not in self._pending:
+                return msg_id
+
+    async def send_request(self, request: Any) -> Optional[GrentonCluApiParsedMessage]:
+        """Send a request via this socket's transport and wait for a matching response.
+
+        Idempotent requests are retransmitted with the CLU's RTO and
+        exponential backoff until the response timeout. Returns None on
+        timeout or send failure.
+        """
         if not self.transport:
             _LOGGER.error("[%s] Transport not ready", self.api.clu.name)
             return None
 
-        msg_id = request.msg_id
-        payload = request.raw.encode()
-        encrypted = self.api.cipher.encrypt(payload)
+        request.msg_id = msg_id = self._allocate_msg_id()
+        encrypted = self.api.cipher.encrypt(request.raw.encode())
 
         if encrypted is None:
             _LOGGER.error("[%s] Failed to encrypt request", self.api.clu.name)
             return None
 
-        future: asyncio.Future[str] = asyncio.get_running_loop().create_future()
-
-        async with self._pending_lock:
-            self._pending[msg_id] = future
-
         try:
             self.transport.sendto(encrypted, (self.api.clu.ip, self.api.clu.port))
-            _LOGGER.debug("[%s][%s] Sent: %s", self.api.clu.name, msg_id, request.raw)
         except Exception as e:
-            async with self._pending_lock:
-                self._pending.pop(msg_id, None)
             _LOGGER.error("[%s][%s] Failed to send request: %s",
                           self.api.clu.name, msg_id, e)
             return None
+        _LOGGER.debug("[%s][%s] Sent: %s", self.api.clu.name, msg_id, request.raw)
+
+        loop = asyncio.get_running_loop()
+        now = loop.time()
+        pending = _PendingRequest(
+            future=loop.create_future(),
+            encrypted=encrypted,
+            rtt=self.api.register_rtt if isinstance(request, GrentonCluApiClientRegisterRequest) else self.api.rtt,
+            sent_at=now,
+            deadline=now + self._response_timeout,
+            max_retransmissions=MAX_RETRANSMISSIONS if request.idempotent else 0,
+        )
+        self._pending[msg_id] = pending
+        self._schedule(msg_id, pending, now)
 
         try:
-            return await asyncio.wait_for(future, timeout=self._response_timeout)
-        except asyncio.TimeoutError:
-            async with self._pending_lock:
-                self._pending.pop(msg_id, None)
-            _LOGGER.warning("[%s][%s] Request timeout", self.api.clu.name, msg_id)
-            return None
-        except Exception:
-            async with self._pending_lock:
+            return await pending.future
+        finally:
+            # Duplicate responses to retransmissions find no entry and are dropped
+            self._pending.pop(msg_id, None)
+            if not self._pending:
+                self._clear_deadlines()
+
+    def _schedule(self, msg_id: str, pending: _PendingRequest, sent_at: float) -> None:
+        """Queue the request's next retransmission or timeout on the shared timer.
+
+        ``sent_at`` is the loop time of the latest transmission; the next one
+        follows it after the current RTO.
+        """
+        if pending.retransmissions < pending.max_retransmissions:
+            pending.next_at = min(sent_at + pending.rtt.rto, pending.deadline)
+        else:
+            pending.next_at = pending.deadline
+
+        heapq.heappush(self._deadlines, (pending.next_at, msg_id))
+        if self._timer is None or pending.next_at < self._timer_at:
+            self._arm_timer()
+
+    def _clear_deadlines(self) -> None:
+        """Drop the timer and the heap once nothing is in flight.
+
+        Answered requests leave their entries in the heap, and the timer
+        would otherwise still wake up for them. With one request at a time
+        (pings, actions) that is one useless wakeup per request.
+        """
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        self._deadlines.clear()
+
+    def _arm_timer(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if self._deadlines:
+            self._timer_at = self._deadlines[0][0]
+            self._timer = asyncio.get_running_loop().call_at(self._timer_at, self._on_timer)
+
+    def _on_timer(self) -> None:
+        self._timer = None
+        now = asyncio.get_running_loop().time()
+        while self._deadlines and self._deadlines[0][0] <= now:
+            when, msg_id = heapq.heappop(self._deadlines)
+            pending = self._pending.get(msg_id)
+            if pending is None or pending.future.done() or pending.next_at != when:
+                continue  # answered, cancelled or rescheduled
+
+            if when >= pending.deadline:
                 self._pending.pop(msg_id, None)
-            raise
+                pending.rtt.backoff()
+                _LOGGER.warning("[%s][%s] Request timeout", self.api.clu.name, msg_id)
+                pending.future.set_result(None)
+                continue
+
+            pending.retransmissions += 1
+            pending.rtt.backoff()
+            try:
+                assert self.transport is not None
+                self.transport.sendto(pending.encrypted, (self.api.clu.ip, self.api.clu.port))
+                _LOGGER.debug("[%s][%s] Retransmitted (%d)", self.api.clu.name, msg_id, pending.retransmissions)
+            except Exception as e:
+                _LOGGER.debug("[%s][%s] Failed to retransmit request: %s", self.api.clu.name, msg_id, e)
+            self._schedule(msg_id, pending, now)
+
+        self._arm_timer()
 
     def error_received(self, exc: Exception) -> None:
         _LOGGER.error("[%s] UDP error: %s", self.api.clu.name, exc)
@@ -325,14 +720,12 @@ class GrentonCluApiProtocol(asyncio.DatagramProtocol):
         else:
             _LOGGER.debug("[%s] UDP connection closed", self.api.clu.name)
 
-        async def _fail_pending() -> None:
-            async with self._pending_lock:
-                futures = list(self._pending.values())
-                self._pending.clear()
+        self._clear_deadlines()
 
-            for fut in futures:
-                if not fut.done():
-                    fut.set_exception(ConnectionError(
-                        f"UDP connection closed for CLU {self.api.clu.name}"))
+        pending_requests = list(self._pending.values())
+        self._pending.clear()
 
-        asyncio.create_task(_fail_pending())
+        for pending in pending_requests:
+            if not pending.future.done():
+                pending.future.set_exception(ConnectionError(
+                    f"UDP connection closed for CLU {self.api.clu.name}"))
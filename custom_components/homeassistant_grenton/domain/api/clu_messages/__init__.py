@@ -1,14 +1,15 @@
 from .action import GrentonCluApiActionRequest, GrentonCluApiActionResponse
-from .base import GrentonCluApiRequest, GrentonCluApiResponse, GrentonCluApiNotification
+from .base import MSG_ID_PLACEHOLDER, GrentonCluApiRequest, GrentonCluApiResponse, GrentonCluApiNotification
 from .client_register import (
     GrentonCluApiClientRegisterRequest,
     GrentonCluApiClientRegisterResponse,
     GrentonCluApiClientReportNotification,
 )
-from .parser import GrentonCluApiMessageParser
-from .ping import GrentonCluApiPingRequest, GrentonCluApiPingResponse
+from .parser import GrentonCluApiMessageParser, GrentonCluApiParsedMessage
+from .ping import GrentonCluApiPingRequest, GrentonCluApiPingResponse, GrentonCluApiProbeRequest
 
 __all__ = [
+    "MSG_ID_PLACEHOLDER",
     "GrentonCluApiActionRequest",
     "GrentonCluApiActionResponse",
     "GrentonCluApiRequest",
@@ -18,6 +19,8 @@ __all__ = [
     "GrentonCluApiClientRegisterResponse",
     "GrentonCluApiClientReportNotification",
     "GrentonCluApiMessageParser",
+    "GrentonCluApiParsedMessage",
     "GrentonCluApiPingRequest",
     "GrentonCluApiPingResponse",
+    "GrentonCluApiProbeRequest",
 ]
@@ -8,6 +8,7 @@ from ...action import (
     GrentonActionScript,
 )
 from .base import GrentonCluApiRequest, GrentonCluApiResponse
+from .parser import GrentonCluApiParsedMessage
 
 
 class GrentonCluApiActionRequest(GrentonCluApiRequest):
@@ -30,23 +31,60 @@ class GrentonCluApiActionRequest(GrentonCluApiRequest):
         Returns:
             GrentonCluApiActionRequest with appropriate payload
         """
+        request = GrentonCluApiActionRequest(GrentonCluApiActionRequest.payload_for(action), msg_id)
+        request.idempotent = GrentonCluApiActionRequest.is_idempotent(action)
+        return request
+
+    @staticmethod
+    def from_payloads(
+        payloads: list[str],
+        idempotent: bool,
+        msg_id: str | None = None
+    ) -> 'GrentonCluApiActionRequest':
+        """Create one request executing several action payloads in order."""
+        request = GrentonCluApiActionRequest(GrentonCluApiActionRequest.sequence(payloads), msg_id)
+        request.idempotent = idempotent
+        return request
+
+    @staticmethod
+    def sequence(payloads: list[str]) -> str:
+        """Join Lua calls into one expression that runs them strictly in order.
+
+        Lua leaves the evaluation order of table constructor fields and
+        function arguments undefined, but ``and`` always evaluates its left
+        operand first. ``or 1`` keeps a call returning nil or false from
+        cutting the chain short. An error in one call still aborts the rest.
+        """
+        if len(payloads) == 1:
+            return payloads[0]
+        return " and ".join(f"({payload} or 1)" for payload in payloads)
+
+    @staticmethod
+    def is_idempotent(action: GrentonAction) -> bool:
+        """Setting an attribute or variable twice is harmless; methods and scripts may not be."""
+        return isinstance(action, (GrentonActionVariable, GrentonActionAttribute))
+
+    @staticmethod
+    def payload_for(action: GrentonAction) -> str:
+        """Build the Lua call for a single action.
+
+        Raises:
+            ValueError: If the action type is not supported
+        """
         if isinstance(action, GrentonActionVariable):
-            payload = f'setVar("{action.index}","{action.value}")'
+            return f'setVar("{action.index}","{action.value}")'
         elif isinstance(action, GrentonActionAttribute):
-            payload = f'{action.object_name}:set({action.index},"{action.value}")'
+            return f'{action.object_name}:set({action.index},"{action.value}")'
         elif isinstance(action, GrentonActionMethod):
-            payload = f'{action.object_name}:execute({action.index},"{action.value}")'
+            return f'{action.object_name}:execute({action.index},"{action.value}")'
         elif isinstance(action, GrentonActionScript):
-            payload = f'{action.object_name}({action.value})'
-        else:
-            raise ValueError(f"Unsupported action type: {type(action).__name__}")
-        
-        return GrentonCluApiActionRequest(payload, msg_id)
+            return f'{action.object_name}({action.value})'
+        raise ValueError(f"Unsupported action type: {type(action).__name__}")
 
 
 class GrentonCluApiActionResponse(GrentonCluApiResponse):
     """Response from action execution."""
     
-    def __init__(self, wire_message: str):
+    def __init__(self, wire_message: str | GrentonCluApiParsedMessage):
         """Initialize from wire format message."""
         super().__init__(wire_message)
@@ -1,5 +1,10 @@
 from __future__ import annotations
-import secrets
+
+from .parser import GrentonCluApiMessageParser, GrentonCluApiParsedMessage
+
+# Placeholder of the same width as a real msg_id, for sizing requests
+# before they are sent
+MSG_ID_PLACEHOLDER = "0" * 8
 
 
 class GrentonCluApiRequest:
@@ -8,20 +13,30 @@ class GrentonCluApiRequest:
     Wire format: req::{MESSAGE ID}:{PAYLOAD}
     """
     
-    msg_id: str
+    msg_id: str | None
     payload: str
-    raw: str
+
+    # Whether executing the request twice is harmless. Only idempotent
+    # requests are retransmitted when a response is late.
+    idempotent: bool = True
     
     def __init__(self, payload: str, msg_id: str | None = None):
         """Initialize with payload and optional message ID.
         
         Args:
             payload: The payload string to execute
-            msg_id: Unique message ID for tracking (defaults to random hex)
+            msg_id: Message ID for tracking. Usually left unset: the
+                protocol assigns one from its own counter on send.
         """
         self.payload = payload
-        self.msg_id = (msg_id or secrets.token_hex(4)).lower()
-        self.raw = f"req::{self.msg_id}:{self.payload}"
+        self.msg_id = msg_id.lower() if msg_id else None
+
+    @property
+    def raw(self) -> str:
+        """Wire format of the request with its current msg_id."""
+        if self.msg_id is None:
+            raise ValueError("Request has no msg_id assigned yet")
+        return f"req::{self.msg_id}:{self.payload}"
 
 
 class GrentonCluApiResponse:
@@ -32,29 +47,36 @@ class GrentonCluApiResponse:
     
     clu_ip: str
     msg_id: str
-    payload: str
     raw: str
+    message: GrentonCluApiParsedMessage
     
-    def __init__(self, wire_message: str):
+    def __init__(self, wire_message: str | GrentonCluApiParsedMessage):
         """Initialize from wire format message.
         
         Args:
-            wire_message: Wire format: resp:{CLU IP}:{MESSAGE ID}:{PAYLOAD}
+            wire_message: Wire format: resp:{CLU IP}:{MESSAGE ID}:{PAYLOAD},
+                or a message already split by GrentonCluApiMessageParser.parse
             
         Raises:
             ValueError: If wire message format is invalid
         """
-        if not wire_message.startswith("resp:"):
-            raise ValueError(f"Message does not start with 'resp:': {wire_message}")
-        
-        parts = wire_message.split(":", 3)
-        if len(parts) != 4:
-            raise ValueError(f"Invalid wire message format: {wire_message}")
-        
-        _, self.clu_ip, self.msg_id, self.payload = parts
-        self.msg_id = self.msg_id.lower()
-        self.raw = wire_message
+        if isinstance(wire_message, GrentonCluApiParsedMessage):
+            message = wire_message
+        else:
+            parsed = GrentonCluApiMessageParser.parse(wire_message)
+            if parsed is None:
+                raise ValueError(f"Invalid wire message format: {wire_message}")
+            message = parsed
+
+        self.message = message
+        self.clu_ip = message.clu_ip
+        self.msg_id = message.msg_id
+        self.raw = message.raw
 
+    @property
+    def payload(self) -> str:
+        # Only sliced out of the message when asked for
+        return self.message.payload
 
 class GrentonCluApiNotification(GrentonCluApiResponse):
     """Base class for CLU notifications.
@@ -63,6 +85,6 @@ class GrentonCluApiNotification(GrentonCluApiResponse):
     They share the same wire format as responses but are not replies to requests.
     """
     
-    def __init__(self, wire_message: str):
+    def __init__(self, wire_message: str | GrentonCluApiParsedMessage):
         """Initialize from wire format message."""
         super().__init__(wire_message)
@@ -1,43 +1,15 @@
 from __future__ import annotations
+from functools import cached_property
 
 from ....state import (
     GrentonCluStateVariableKey,
     GrentonCluStateAttributeKey,
     GrentonValue,
-    cast_string_to_grenton_value,
 )
-from .base import GrentonCluApiRequest, GrentonCluApiResponse, GrentonCluApiNotification
-
-
-def _parse_client_report(payload: str) -> tuple[int | None, list[GrentonValue]]:
-    """Parse a clientReport payload into (session_id, values).
-
-    Wire payload format: clientReport:{SESSION_ID}:{val1,val2,...}
-    Returns (None, []) when the payload does not parse.
-    """
-    if not payload.startswith("clientReport:"):
-        return None, []
-
-    parts = payload.split(":", 2)
-    if len(parts) != 3:
-        return None, []
-
-    try:
-        session_id = int(parts[1])
-    except ValueError:
-        return None, []
-
-    data_payload = parts[2]
-    if not (data_payload.startswith("{") and data_payload.endswith("}")):
-        return session_id, []
-
-    content = data_payload[1:-1].strip()
-    if not content:
-        return session_id, []
-
-    raw_values = content.split(",")
-    values = [cast_string_to_grenton_value(value.strip().strip('"')) for value in raw_values]
-    return session_id, values
+from ...cipher import GrentonCipher
+from .base import MSG_ID_PLACEHOLDER, GrentonCluApiRequest, GrentonCluApiResponse, GrentonCluApiNotification
+from .parser import GrentonCluApiParsedMessage
+from .report_values import parse_report_values
 
 
 class GrentonCluApiClientRegisterRequest(GrentonCluApiRequest):
@@ -59,37 +31,79 @@ class GrentonCluApiClientRegisterRequest(GrentonCluApiRequest):
         if not keys:
             raise ValueError("Cannot create registration request with no keys")
 
-        mapped_keys: list[str] = []
-
-        for key in keys:
-            if isinstance(key, GrentonCluStateVariableKey):
-                mapped_keys.append(f'"{key.name}"')
-            elif isinstance(key, GrentonCluStateAttributeKey): # pyright: ignore[reportUnnecessaryIsInstance]
-                mapped_keys.append(f'{{{key.object_name},{key.name}}}')
+        mapped_keys = [self.encode_key(key) for key in keys]
 
         payload = f'SYSTEM:clientRegister(0,{session_id},1,{{{",".join(mapped_keys)}}})'
         super().__init__(payload, msg_id)
 
+    @staticmethod
+    def encode_key(key: GrentonCluStateVariableKey | GrentonCluStateAttributeKey) -> str:
+        """Encode a single key the way it appears in the clientRegister table."""
+        if isinstance(key, GrentonCluStateVariableKey):
+            return f'"{key.name}"'
+        return f'{{{key.object_name},{key.name}}}'
+
+    @classmethod
+    def pack_keys(
+        cls,
+        keys: list[GrentonCluStateVariableKey | GrentonCluStateAttributeKey],
+        max_payload_bytes: int,
+    ) -> list[list[GrentonCluStateVariableKey | GrentonCluStateAttributeKey]]:
+        """Split keys into chunks whose encrypted request fits ``max_payload_bytes``.
+
+        Sizes are computed for the worst case (5-digit session id, 8-char
+        msg_id) after AES/PKCS7 padding. Order is preserved; a single key that
+        does not fit on its own still gets a chunk of its own.
+        """
+        empty = f'req::{MSG_ID_PLACEHOLDER}:SYSTEM:clientRegister(0,65535,1,{{}})'
+        overhead = len(empty.encode())
+
+        chunks: list[list[GrentonCluStateVariableKey | GrentonCluStateAttributeKey]] = []
+        chunk: list[GrentonCluStateVariableKey | GrentonCluStateAttributeKey] = []
+        size = overhead
+        for key in keys:
+            # +1 for the separating comma (over-counts the first key by one)
+            key_size = len(cls.encode_key(key).encode()) + 1
+            if chunk and GrentonCipher.encrypted_size(size + key_size) > max_payload_bytes:
+                chunks.append(chunk)
+                chunk = []
+                size = overhead
+            chunk.append(key)
+            size += key_size
+        if chunk:
+            chunks.append(chunk)
+        return chunks
+
 
 class GrentonCluApiClientRegisterResponse(GrentonCluApiResponse):
     """Response from client registration with initial values."""
 
-    session_id: int | None
     values: list[GrentonValue]
 
-    def __init__(self, wire_message: str):
+    def __init__(self, wire_message: str | GrentonCluApiParsedMessage):
         """Initialize from wire format message and parse values."""
         super().__init__(wire_message)
-        self.session_id, self.values = _parse_client_report(self.payload)
+        self.values = parse_report_values(self.message.values)
+
+    @property
+    def session_id(self) -> int | None:
+        return self.message.session_id
 
 
 class GrentonCluApiClientReportNotification(GrentonCluApiNotification):
-    """Notification with subscription report and updated values."""
+    """Notification with subscription report and updated values.
 
-    session_id: int | None
-    values: list[GrentonValue]
+    Values are decoded on first access.
+    """
 
-    def __init__(self, wire_message: str):
-        """Initialize from wire format message and parse values."""
+    def __init__(self, wire_message: str | GrentonCluApiParsedMessage):
+        """Initialize from wire format message."""
         super().__init__(wire_message)
-        self.session_id, self.values = _parse_client_report(self.payload)
+
+    @property
+    def session_id(self) -> int | None:
+        return self.message.session_id
+
+    @cached_property
+    def values(self) -> list[GrentonValue]:
+        return parse_report_values(self.message.values)
@@ -1,31 +1,123 @@
 from __future__ import annotations
 
+from typing import Literal
+
+# msg_id of unsolicited messages (clientReport notifications)
+NOTIFICATION_MSG_ID = "00000000"
+
+_RESPONSE_TAG = "resp"
+_CLIENT_REPORT_TAG = "clientReport"
+
+type GrentonCluApiMessageKind = Literal["response", "report"]
+
+
+class GrentonCluApiParsedMessage:
+    """A wire message split into its fields by GrentonCluApiMessageParser.split.
+
+    Only the msg_id is set up front; the other fields are derived from the
+    split parts when read. ``values`` is the raw text between the braces of
+    a clientReport payload (``clientReport:{SESSION_ID}:{val1,val2,...}``),
+    left unparsed so that callers only pay for decoding values they use.
+    """
+
+    __slots__ = ("msg_id", "raw", "_parts")
+
+    def __init__(self, parts: list[str], msg_id: str, raw: str):
+        self._parts = parts
+        self.msg_id = msg_id
+        self.raw = raw
+
+    @property
+    def kind(self) -> GrentonCluApiMessageKind:
+        return "report" if self.is_client_report else "response"
+
+    @property
+    def is_client_report(self) -> bool:
+        return GrentonCluApiMessageParser.is_report(self._parts, self.msg_id)
+
+    @property
+    def clu_ip(self) -> str:
+        return self._parts[1]
+
+    @property
+    def payload(self) -> str:
+        parts = self._parts
+        if len(parts) == 4:
+            return parts[3]
+        # "resp:" plus the colons after the IP and the msg_id
+        return self.raw[len(parts[1]) + len(parts[2]) + 7:]
+
+    @property
+    def session_id(self) -> int | None:
+        parts = self._parts
+        if len(parts) != 6 or parts[3] != _CLIENT_REPORT_TAG:
+            return None
+        try:
+            return int(parts[4])
+        except ValueError:
+            return None
+
+    @property
+    def values(self) -> str | None:
+        return GrentonCluApiMessageParser.report_values(self._parts)
+
 
 class GrentonCluApiMessageParser:
-    """Parser for routing messages to appropriate message classes."""
-    
+    """Parser for routing messages to appropriate message classes.
+
+    The receive path works on the parts from split() directly: it needs the
+    msg_id of every message but the value list only of reports, so a report
+    is routed without building a message object at all.
+    """
+
+    @staticmethod
+    def split(wire_message: str) -> list[str] | None:
+        """Split a wire message with one ``str.split``, None if it is not a valid response.
+
+        Wire format: resp:{CLU IP}:{MESSAGE ID}:{PAYLOAD}. The split runs on
+        into a clientReport payload, so the parts are [resp, IP, msg_id,
+        PAYLOAD] or [resp, IP, msg_id, "clientReport", SESSION_ID, {VALUES}]
+        (payloads with colons split like a report does).
+        """
+        parts = wire_message.split(":", 5)
+        if len(parts) < 4 or parts[0] != _RESPONSE_TAG:
+            return None
+        return parts
+
+    @staticmethod
+    def is_report(parts: list[str], msg_id: str) -> bool:
+        """Whether split parts with the lowercased ``msg_id`` are a clientReport notification."""
+        return msg_id == NOTIFICATION_MSG_ID and len(parts) > 4 and parts[3] == _CLIENT_REPORT_TAG
+
+    @staticmethod
+    def report_values(parts: list[str]) -> str | None:
+        """Raw text between the braces of a split clientReport payload, None if there is none."""
+        if len(parts) != 6 or parts[3] != _CLIENT_REPORT_TAG:
+            return None
+        report = parts[5]
+        # Session ids are the decimal numbers this integration registered
+        if not (report.startswith("{") and report.endswith("}") and parts[4].isdigit()):
+            return None
+        return report[1:-1]
+
+    @staticmethod
+    def parse(wire_message: str) -> GrentonCluApiParsedMessage | None:
+        """Split a wire message into its fields, None if it is not a valid response."""
+        parts = GrentonCluApiMessageParser.split(wire_message)
+        if parts is None:
+            return None
+        return GrentonCluApiParsedMessage(parts, parts[2].lower(), wire_message)
+
     @staticmethod
     def is_valid_response(wire_message: str) -> bool:
         """Check if message is a valid response format."""
-        if not wire_message.startswith("resp:"):
-            return False
-        
-        parts = wire_message.split(":", 3)
-        return len(parts) == 4
-    
+        return GrentonCluApiMessageParser.split(wire_message) is not None
+
     @staticmethod
     def is_client_report(wire_message: str) -> bool:
         """Check if wire message is a client report notification.
         
         Client reports are notifications with msg_id == "00000000" and payload starting with "clientReport:".
         """
-        if not wire_message.startswith("resp:"):
-            return False
-        
-        parts = wire_message.split(":", 3)
-        if len(parts) == 4:
-            msg_id = parts[2].lower()
-            payload = parts[3]
-            return msg_id == "00000000" and payload.startswith("clientReport:")
-        
-        return False
+        parts = GrentonCluApiMessageParser.split(wire_message)
+        return parts is not None and GrentonCluApiMessageParser.is_report(parts, parts[2].lower())
@@ -1,6 +1,6 @@
 from __future__ import annotations
-
-from .base import GrentonCluApiRequest, GrentonCluApiResponse
+from .base import MSG_ID_PLACEHOLDER, GrentonCluApiRequest, GrentonCluApiResponse
+from .parser import GrentonCluApiParsedMessage
 
 
 class GrentonCluApiPingRequest(GrentonCluApiRequest):
@@ -10,9 +10,24 @@ class GrentonCluApiPingRequest(GrentonCluApiRequest):
         super().__init__("checkAlive()", msg_id)
 
 
+class GrentonCluApiProbeRequest(GrentonCluApiRequest):
+    """Ping padded so that its encrypted datagram is exactly ``size`` bytes.
+
+    Used to find the largest datagram the CLU still answers. The padding is
+    passed as an ignored string argument, so the call stays a valid checkAlive().
+    """
+
+    def __init__(self, size: int, msg_id: str | None = None):
+        # Largest plaintext that still encrypts to ``size`` bytes; every
+        # msg_id has the placeholder's width
+        unpadded = len(f'req::{MSG_ID_PLACEHOLDER}:checkAlive("")'.encode())
+        padding = max(0, size - 1 - unpadded)
+        super().__init__(f'checkAlive("{"x" * padding}")', msg_id)
+
+
 class GrentonCluApiPingResponse(GrentonCluApiResponse):
     """Ping response from CLU."""
 
-    def __init__(self, wire_message: str):
+    def __init__(self, wire_message: str | GrentonCluApiParsedMessage):
         """Initialize from wire format message."""
         super().__init__(wire_message)
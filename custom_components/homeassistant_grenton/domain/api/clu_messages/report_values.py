@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import re
+from typing import Iterator, Sequence
+
+from ....state import GrentonValue, GrentonValueDecoder, cast_string_to_grenton_value
+
+# One value of a Lua table constructor and its separator: a quoted string
+# (commas and escaped quotes allowed inside), a flat nested table, or a bare
+# token up to the next comma (trailing blanks included, decoders strip them).
+# Scanned content gets a trailing comma appended so every value, including
+# the last, ends with one.
+_VALUE = re.compile(r'\s*(?:"([^"\\]*(?:\\.[^"\\]*)*)"|(\{[^{}]*\}|[^,]*)),', re.DOTALL)
+# Quoted strings of a value list that has no escapes
+_QUOTED = re.compile(r'"([^"]*)"')
+_ESCAPE = re.compile(r'\\(.)', re.DOTALL)
+_ESCAPES = {"n": "\n", "t": "\t", "r": "\r", "0": "\0"}
+
+
+def _unescape(value: str) -> str:
+    if "\\" not in value:
+        return value
+    return _ESCAPE.sub(lambda m: _ESCAPES.get(m.group(1), m.group(1)), value)
+
+
+def split_report_values(content: str | None) -> list[str]:
+    """Raw tokens of a clientReport value list, to be decoded per position.
+
+    Tokens may keep surrounding blanks and quotes; every decoder strips them.
+    Escaped quoted strings come out unescaped.
+    """
+    if not content or content.isspace():
+        return []
+    if "{" not in content and "\\" not in content and not any("," in quoted for quoted in _QUOTED.findall(content)):
+        # Nothing hides a comma, a plain split is the fastest scan. Quoted
+        # tokens keep their quotes; the decoders strip them.
+        return content.split(",")
+    # findall runs the whole scan in C; groups are "" (not None) when unmatched
+    return [_unescape(quoted) if quoted else bare for quoted, bare in _VALUE.findall(content + ",")]
+
+
+def _decode_all(tokens: list[str], decoders: Sequence[GrentonValueDecoder] | None) -> list[GrentonValue]:
+    if not decoders:
+        return [cast_string_to_grenton_value(token) for token in tokens]
+    values = [decode(token) for decode, token in zip(decoders, tokens)]
+    if len(tokens) > len(decoders):
+        values.extend(cast_string_to_grenton_value(token) for token in tokens[len(decoders):])
+    return values
+
+
+def parse_report_values(
+    content: str | None,
+    decoders: Sequence[GrentonValueDecoder] | None = None,
+) -> list[GrentonValue]:
+    """Decode all values of a clientReport, [] when there are none.
+
+    ``decoders`` gives the decoder per position (see decoder_for_value_type);
+    positions beyond it, or all of them when omitted, use the guessing cast.
+    """
+    return _decode_all(split_report_values(content), decoders)
+
+
+def iter_report_values(
+    tokens: Sequence[str],
+    previous: Sequence[str],
+    decoders: Sequence[GrentonValueDecoder],
+) -> Iterator[GrentonValue]:
+    """Decode ``tokens`` lazily, one position per step.
+
+    A position whose token equals the one at the same position of
+    ``previous`` is not decoded and yields None. All three sequences must
+    have the same length.
+    """
+    for token, old, decode in zip(tokens, previous, decoders, strict=True):
+        yield None if token == old else decode(token)
+
+
+class GrentonReportValueDecoder:
+    """Decodes the value lists received on one subscription socket.
+
+    A clientReport carries every value of its chunk, usually with only a few
+    of them changed. decode_changes() compares the raw tokens with the
+    previous report and decodes only the positions that differ; the others
+    come out as None, which consumers of report values already skip as "no
+    value".
+    """
+
+    __slots__ = ("decoders", "reports", "_tokens")
+
+    def __init__(self, decoders: Sequence[GrentonValueDecoder] | None = None):
+        self.decoders = decoders
+        # Reports decoded so far
+        self.reports = 0
+        self._tokens: list[str] = []
+
+    def decode(self, content: str | None) -> list[GrentonValue]:
+        """Decode every value, e.g. of a register response.
+
+        The next report is decoded in full again: the caller applies these
+        values on its own schedule, so they are no baseline to compare with.
+        """
+        self._tokens = []
+        return _decode_all(split_report_values(content), self.decoders)
+
+    def decode_changes(self, content: str | None) -> list[GrentonValue]:
+        """Decode a report, None at positions unchanged since the previous report."""
+        self.reports += 1
+        tokens = split_report_values(content)
+        previous = self._tokens
+        self._tokens = tokens
+        decoders = self.decoders
+        if len(previous) != len(tokens) or decoders is None or len(decoders) != len(tokens):
+            return _decode_all(tokens, decoders)
+        return list(iter_report_values(tokens, previous, decoders))
@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+# RFC 6298 constants
+_ALPHA = 1 / 8
+_BETA = 1 / 4
+_K = 4
+
+# Before the first sample: a LAN CLU answers in milliseconds, one second
+# still leaves room for a slow Wi-Fi bridge.
+INITIAL_RTO = 1.0
+MIN_RTO = 0.2
+MAX_RTO = 5.0
+
+# clientRegister makes the CLU read and report every key of a chunk, so it
+# answers far slower than a ping; its timeout never drops below this.
+REGISTER_MIN_RTO = 1.0
+
+
+class GrentonRttEstimator:
+    """Smoothed round-trip time and retransmission timeout for one CLU (TCP-style).
+
+    Only unambiguous samples may be fed in (Karn's algorithm): a response to
+    a request that was retransmitted cannot be attributed to one transmission.
+    Since those give no sample, every retransmission backs the timeout off
+    instead (RFC 6298 section 5.5) until an unambiguous sample resets it.
+    """
+
+    def __init__(self, min_rto: float = MIN_RTO) -> None:
+        self.srtt: float | None = None
+        self.rttvar = 0.0
+        self.min_rto = min_rto
+        self.rto = max(min_rto, INITIAL_RTO)
+
+    def sample(self, rtt: float) -> None:
+        """Fold a measured round-trip time into the estimate."""
+        if self.srtt is None:
+            self.srtt = rtt
+            self.rttvar = rtt / 2
+        else:
+            self.rttvar = (1 - _BETA) * self.rttvar + _BETA * abs(self.srtt - rtt)
+            self.srtt = (1 - _ALPHA) * self.srtt + _ALPHA * rtt
+        self.rto = min(MAX_RTO, max(self.min_rto, self.srtt + _K * self.rttvar))
+
+    def backoff(self) -> None:
+        """Double the timeout after a retransmission timer fired."""
+        self.rto = min(MAX_RTO, self.rto * 2)
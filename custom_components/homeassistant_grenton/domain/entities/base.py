@@ -3,6 +3,8 @@ from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.core import callback
 
 from ...coordinator import GrentonCoordinator
+from ..state_object import GrentonStateObject
+from ...state import GrentonStateHandle
 
 
 class BaseGrentonEntity(CoordinatorEntity[GrentonCoordinator]):
@@ -22,6 +24,41 @@ class BaseGrentonEntity(CoordinatorEntity[GrentonCoordinator]):
         self.label = label
         self._attr_unique_id = id
         self._attr_device_info = device_info
+        self._state_objects: list[GrentonStateObject] = []
+        self._state_handles: list[GrentonStateHandle] = []
+
+    def register_state_object(self, state_object: GrentonStateObject) -> GrentonStateHandle:
+        """Register a state with the coordinator and bind this entity to it.
+
+        Returns a handle whose ``value`` reads the state without going
+        through the coordinator.
+        """
+        handle = self.coordinator.register_component_state(state_object)
+        self._state_objects.append(state_object)
+        self._state_handles.append(handle)
+        return handle
+
+    @property
+    def available(self) -> bool: # pyright: ignore[reportIncompatibleVariableOverride]
+        """Unavailable until the entity's CLUs are ready.
+
+        Values restored from the last snapshot count as available, so
+        entities keep showing them while their CLU is still coming up.
+        """
+        if not super().available:
+            return False
+        return all(
+            self.coordinator.is_clu_ready(state_object.clu_id) or handle.restored
+            for state_object, handle in zip(self._state_objects, self._state_handles)
+        )
+
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to changes of the states this entity reads."""
+        await super().async_added_to_hass()
+        for state_object in self._state_objects:
+            self.async_on_remove(
+                self.coordinator.async_add_state_listener(state_object, self._handle_coordinator_update)
+            )
 
     @property
     def name(self) -> str: # pyright: ignore[reportIncompatibleVariableOverride]
@@ -32,7 +69,7 @@ class BaseGrentonEntity(CoordinatorEntity[GrentonCoordinator]):
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator.
         
-        This is called automatically by CoordinatorEntity when the coordinator
-        data is updated (either on schedule or when async_refresh is called).
+        This is called when one of the registered states changes, and by
+        CoordinatorEntity when the coordinator notifies all listeners.
         """
         self.async_write_ha_state()
\ No newline at end of file
@@ -67,12 +67,12 @@ class GrentonEntityBinarySensor( # pyright: ignore[reportIncompatibleVariableOve
         self.state_object = state_object
         
         # Register state with coordinator
-        coordinator.register_component_state(state_object)
+        self.state_handle = self.register_state_object(state_object)
 
     @property
     def is_on(self) -> bool | None: # pyright: ignore[reportIncompatibleVariableOverride]
         """Return the state of the switch."""
-        value = self.coordinator.get_value_for_component(self.state_object)
+        value = self.state_handle.value
         if value is None:
             return None
         return not bool(value) if self.reversed else bool(value)
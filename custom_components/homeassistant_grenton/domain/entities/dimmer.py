@@ -43,12 +43,12 @@ class GrentonEntityDimmer(BaseGrentonEntity, LightEntity): # pyright: ignore[rep
         self.action_set_value = action_set_value
         
         # Register state with coordinator
-        coordinator.register_component_state(state_object)
+        self.state_handle = self.register_state_object(state_object)
 
     @property
     def is_on(self) -> bool | None: # pyright: ignore[reportIncompatibleVariableOverride]
         """Return whether the light is on."""
-        value = self.coordinator.get_value_for_component(self.state_object)
+        value = self.state_handle.value
         if value is None:
             return None
         return float(value) > 0
@@ -56,7 +56,7 @@ class GrentonEntityDimmer(BaseGrentonEntity, LightEntity): # pyright: ignore[rep
     @property
     def brightness(self) -> int | None: # pyright: ignore[reportIncompatibleVariableOverride]
         """Return the brightness of the light (0-255)."""
-        value = self.coordinator.get_value_for_component(self.state_object)
+        value = self.state_handle.value
         if value is None:
             return None
         # Convert from device range to Home Assistant range (0-255)
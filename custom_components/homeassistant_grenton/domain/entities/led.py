@@ -55,15 +55,15 @@ class GrentonEntityLed(BaseGrentonEntity, LightEntity): # pyright: ignore[report
         self.brightness_range = brightness_range
         
         # Register state with coordinator
-        coordinator.register_component_state(state_object)
-        coordinator.register_component_state(hue_state_object)
-        coordinator.register_component_state(saturation_state_object)
-        coordinator.register_component_state(brightness_state_object)
+        self.state_handle = self.register_state_object(state_object)
+        self.hue_state_handle = self.register_state_object(hue_state_object)
+        self.saturation_state_handle = self.register_state_object(saturation_state_object)
+        self.brightness_state_handle = self.register_state_object(brightness_state_object)
 
     @property
     def is_on(self) -> bool | None: # pyright: ignore[reportIncompatibleVariableOverride]
         """Return whether the light is on."""
-        value = self.coordinator.get_value_for_component(self.state_object)
+        value = self.state_handle.value
         if value is None:
             return None
         return bool(value)
@@ -71,7 +71,7 @@ class GrentonEntityLed(BaseGrentonEntity, LightEntity): # pyright: ignore[report
     @property
     def brightness(self) -> int | None: # pyright: ignore[reportIncompatibleVariableOverride]
         """Return the brightness of the light (0-255)."""
-        value = self.coordinator.get_value_for_component(self.brightness_state_object)
+        value = self.brightness_state_handle.value
         if value is None:
             return None
         # Convert from device range to Home Assistant range (0-255)
@@ -79,8 +79,8 @@ class GrentonEntityLed(BaseGrentonEntity, LightEntity): # pyright: ignore[report
     
     @property
     def hs_color(self) -> tuple[float, float] | None: # pyright: ignore[reportIncompatibleVariableOverride]
-        hue_value = self.coordinator.get_value_for_component(self.hue_state_object)
-        saturation_value = self.coordinator.get_value_for_component(self.saturation_state_object)
+        hue_value = self.hue_state_handle.value
+        saturation_value = self.saturation_state_handle.value
         if hue_value is None or saturation_value is None:
             return None
         hue = map_range(self.hue_range, (0, 360), float(hue_value))
@@ -88,7 +88,11 @@ class GrentonEntityLed(BaseGrentonEntity, LightEntity): # pyright: ignore[report
         return (hue, saturation)
 
     async def async_turn_on(self, **kwargs: Any):
-        """Turn the light on."""
+        """Turn the light on.
+
+        Color and brightness are set before switching on, all in one request.
+        """
+        actions: list[GrentonAction] = []
         if ATTR_HS_COLOR in kwargs:
             hs_color: tuple[float, float] = kwargs[ATTR_HS_COLOR]
             hue, saturation = hs_color
@@ -97,16 +101,16 @@ class GrentonEntityLed(BaseGrentonEntity, LightEntity): # pyright: ignore[report
             saturation_device_value = map_range((0, 100), self.saturation_range, saturation)
             self.hue_action.value = str(round(hue_device_value, 2))
             self.saturation_action.value = str(round(saturation_device_value, 2))
-            await self.coordinator.execute_action(self.hue_action)
-            await self.coordinator.execute_action(self.saturation_action)
+            actions.extend((self.hue_action, self.saturation_action))
         if ATTR_BRIGHTNESS in kwargs:
             # Convert from HA range (0-255) to device range
             brightness: int = kwargs[ATTR_BRIGHTNESS]
             device_value = map_range((0, 255), self.brightness_range, brightness)
             self.brightness_action.value = str(round(device_value, 2))
-            await self.coordinator.execute_action(self.brightness_action)
+            actions.append(self.brightness_action)
 
-        await self.coordinator.execute_action(self.action_on)
+        actions.append(self.action_on)
+        await self.coordinator.execute_actions(actions)
 
     async def async_turn_off(self, **kwargs: Any):
         """Turn the light off."""
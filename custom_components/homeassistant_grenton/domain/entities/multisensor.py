@@ -29,11 +29,11 @@ class GrentonEntityMultisensor( # pyright: ignore[reportIncompatibleVariableOver
         self.state_object = state_object
         
         # Register state with coordinator
-        coordinator.register_component_state(state_object)
+        self.state_handle = self.register_state_object(state_object)
 
     @property
     def native_value(self): # pyright: ignore[reportIncompatibleVariableOverride]
-        return self.coordinator.get_value_for_component(self.state_object)
+        return self.state_handle.value
 
     @property
     def device_class(self) -> SensorDeviceClass | None:  # pyright: ignore[reportIncompatibleVariableOverride]
@@ -28,11 +28,11 @@ class GrentonEntityRollerShutterSensor( # pyright: ignore[reportIncompatibleVari
         self.state_object = state_object
         
         # Register state with coordinator
-        coordinator.register_component_state(state_object)
+        self.state_handle = self.register_state_object(state_object)
 
     @property
     def native_value(self): # pyright: ignore[reportIncompatibleVariableOverride]
-        state = self.coordinator.get_value_for_component(self.state_object)
+        state = self.state_handle.value
         if state == 0:
             return "stopped"
         elif state == 1:
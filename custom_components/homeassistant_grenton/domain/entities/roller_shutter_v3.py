@@ -37,23 +37,24 @@ class GrentonEntityRollerShutterV3(BaseGrentonEntity, CoverEntity): # pyright: i
         self.stop = stop
 
         # Register state with coordinator
-        coordinator.register_component_state(cover_state)
-        coordinator.register_component_state(cover_position)
-        if cover_tilt_position:
-            coordinator.register_component_state(cover_tilt_position)
+        self.cover_state_handle = self.register_state_object(cover_state)
+        self.cover_position_handle = self.register_state_object(cover_position)
+        self.cover_tilt_position_handle = (
+            self.register_state_object(cover_tilt_position) if cover_tilt_position else None
+        )
 
     @property
     def current_cover_position(self) -> int | None:  # pyright: ignore[reportIncompatibleVariableOverride]
-        value = self.coordinator.get_value_for_component(self.cover_position)
+        value = self.cover_position_handle.value
         if value is None:
             return None
         return int(value)
     
     @property
     def current_cover_tilt_position(self) -> int | None:  # pyright: ignore[reportIncompatibleVariableOverride]
-        if not self.cover_tilt_position:
+        if not self.cover_tilt_position_handle:
             return None
-        value = self.coordinator.get_value_for_component(self.cover_tilt_position)
+        value = self.cover_tilt_position_handle.value
         if value is None:
             return None
         value = map_range((0, 90), (0, 100), int(value))
@@ -61,17 +62,17 @@ class GrentonEntityRollerShutterV3(BaseGrentonEntity, CoverEntity): # pyright: i
 
     @property
     def is_closed(self) -> bool | None:  # pyright: ignore[reportIncompatibleVariableOverride]
-        value = self.coordinator.get_value_for_component(self.cover_position)
+        value = self.cover_position_handle.value
         return value == 0
     
     @property
     def is_closing(self) -> bool | None:  # pyright: ignore[reportIncompatibleVariableOverride]
-        value = self.coordinator.get_value_for_component(self.cover_state)
+        value = self.cover_state_handle.value
         return value == 2
     
     @property
     def is_opening(self) -> bool | None:  # pyright: ignore[reportIncompatibleVariableOverride]
-        value = self.coordinator.get_value_for_component(self.cover_state)
+        value = self.cover_state_handle.value
         return value == 1
     
     async def async_open_cover(self, **kwargs: Any) -> None:  # pyright: ignore[reportIncompatibleVariableOverride]
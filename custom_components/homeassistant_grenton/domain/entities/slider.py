@@ -143,7 +143,7 @@ class GrentonEntitySlider( # pyright: ignore[reportIncompatibleVariableOverride]
         self.action_set_value = action_set_value
         
         # Register state with coordinator
-        coordinator.register_component_state(state_object)
+        self.state_handle = self.register_state_object(state_object)
 
     @property
     def native_min_value(self): # pyright: ignore[reportIncompatibleVariableOverride]
@@ -159,7 +159,7 @@ class GrentonEntitySlider( # pyright: ignore[reportIncompatibleVariableOverride]
 
     @property
     def native_value(self): # pyright: ignore[reportIncompatibleVariableOverride]
-        return self.coordinator.get_value_for_component(self.state_object)
+        return self.state_handle.value
     
     async def async_set_native_value(self, value: float) -> None:  # pyright: ignore[reportIncompatibleVariableOverride]
         self.action_set_value.value = str(round(value, self.precision))
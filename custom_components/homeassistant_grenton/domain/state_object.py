@@ -1,42 +1,50 @@
+import sys
 from abc import ABC
 from dataclasses import dataclass
 from typing import Literal
 
+from .enums import GrentonValueType
 from ..dto.value import GrentonValueUnionDto, GrentonValueAttributeDto, GrentonValueVariableDto
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class GrentonStateObject(ABC):
     clu_id: str
     object_name: str
     index: str
+    # Declared type of the reported value (VALUE widgets), None if unknown
+    value_type: GrentonValueType | None = None
 
     @staticmethod
-    def from_dto(dto: GrentonValueUnionDto) -> "GrentonStateObject":
+    def from_dto(dto: GrentonValueUnionDto, value_type: GrentonValueType | None = None) -> "GrentonStateObject":
         if isinstance(dto, GrentonValueAttributeDto):
-            return GrentonAttributeValueObject.create(dto)
+            return GrentonAttributeValueObject.create(dto, value_type)
         elif isinstance(dto, GrentonValueVariableDto): # type: ignore
-            return GrentonVariableValueObject.create(dto)
+            return GrentonVariableValueObject.create(dto, value_type)
         
         raise ValueError()
     
 class GrentonAttributeValueObject(GrentonStateObject):
+    __slots__ = ()
     call_type: Literal["ATTRIBUTE"] = "ATTRIBUTE"
 
     @staticmethod
-    def create(dto: GrentonValueAttributeDto) -> "GrentonAttributeValueObject":
+    def create(dto: GrentonValueAttributeDto, value_type: GrentonValueType | None = None) -> "GrentonAttributeValueObject":
         return GrentonAttributeValueObject(
-            clu_id=dto.cluId,
-            object_name=dto.objectName,
-            index=dto.index,
+            clu_id=sys.intern(dto.cluId),
+            object_name=sys.intern(dto.objectName),
+            index=sys.intern(dto.index),
+            value_type=value_type,
         )
 
 class GrentonVariableValueObject(GrentonStateObject):
+    __slots__ = ()
     call_type: Literal["VARIABLE"] = "VARIABLE"
 
     @staticmethod
-    def create(dto: GrentonValueVariableDto) -> "GrentonVariableValueObject":
+    def create(dto: GrentonValueVariableDto, value_type: GrentonValueType | None = None) -> "GrentonVariableValueObject":
         return GrentonVariableValueObject(
-            clu_id=dto.cluId,
-            object_name=dto.objectName,
-            index=dto.index,
+            clu_id=sys.intern(dto.cluId),
+            object_name=sys.intern(dto.objectName),
+            index=sys.intern(dto.index),
+            value_type=value_type,
         )
\ No newline at end of file
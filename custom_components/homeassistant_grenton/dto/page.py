@@ -3,10 +3,14 @@ import logging
 from typing import List, Any
 from pydantic import BaseModel, TypeAdapter, field_validator, ValidationError
 
-from .widgets.union import GrentonWidgetUnionDto
+from .widgets.union import GrentonWidgetUnionDto, SUPPORTED_WIDGET_TYPES
 
 _LOGGER = logging.getLogger(__name__)
 
+# Built once: constructing an adapter compiles the whole widget union schema
+_WIDGET_ADAPTER: TypeAdapter[GrentonWidgetUnionDto] = TypeAdapter(GrentonWidgetUnionDto)
+_WIDGET_LIST_ADAPTER: TypeAdapter[List[GrentonWidgetUnionDto]] = TypeAdapter(List[GrentonWidgetUnionDto])
+
 class GrentonPageDto(BaseModel):
     name: str
     icon: str
@@ -16,12 +20,26 @@ class GrentonPageDto(BaseModel):
     @field_validator("widgets", mode="before")
     @classmethod
     def skip_unsupported_widgets(cls, v: List[Any]) -> List[GrentonWidgetUnionDto]:
-        widget_adapter: TypeAdapter[GrentonWidgetUnionDto] = TypeAdapter(GrentonWidgetUnionDto)
-        result: List[GrentonWidgetUnionDto] = []
-
+        # Unknown widget types are dropped by their discriminator alone,
+        # without paying for a ValidationError
+        supported: List[Any] = []
         for item in v:
+            widget_type = item.get("type") if isinstance(item, dict) else None
+            if widget_type in SUPPORTED_WIDGET_TYPES:
+                supported.append(item)
+            else:
+                _LOGGER.debug("Skipping unsupported widget type %s", widget_type)
+
+        # Usually every remaining widget is valid: validate them in one call
+        try:
+            return _WIDGET_LIST_ADAPTER.validate_python(supported)
+        except ValidationError:
+            pass
+
+        result: List[GrentonWidgetUnionDto] = []
+        for item in supported:
             try:
-                widget: GrentonWidgetUnionDto = widget_adapter.validate_python(item)
+                widget: GrentonWidgetUnionDto = _WIDGET_ADAPTER.validate_python(item)
                 result.append(widget)
             except ValidationError as error:
                 _LOGGER.debug("Skipping widget %s, error: %s", item.get("type"), error)
@@ -1,6 +1,6 @@
 from __future__ import annotations
 from pydantic import Field
-from typing import Union, Annotated
+from typing import Union, Annotated, get_args
 
 from .value_v2 import GrentonWidgetValueV2Dto
 from .value_double import GrentonWidgetValueDoubleDto
@@ -36,4 +36,10 @@ GrentonWidgetUnionDto = Annotated[
         GrentonWidgetSceneDto,
     ],
     Field(discriminator="type"),
-]
\ No newline at end of file
+]
+
+# Discriminator values of all union members; anything else is skipped unvalidated
+SUPPORTED_WIDGET_TYPES: frozenset[str] = frozenset(
+    member.model_fields["type"].default
+    for member in get_args(get_args(GrentonWidgetUnionDto)[0])
+)
@@ -0,0 +1,35 @@
+"""Entry point of the gateway process, run as a script by GrentonGatewayProcess.
+
+Importing any module of the integration would run its package __init__,
+which imports Home Assistant, and a multiprocessing spawn would re-import
+Home Assistant's __main__ as well. This script imports only the standard
+library: it registers the integration as a bare package first, and only
+then unpickles the worker arguments (they reference the integration's
+classes) and imports gateway_worker, which depends on nothing from Home
+Assistant.
+"""
+from multiprocessing.connection import Connection
+import importlib
+import pickle
+import sys
+import types
+
+
+def main() -> None:
+    # The coordinator's end of the pipe is inherited as this file descriptor
+    conn = Connection(int(sys.argv[1]))
+    package_name, package_path, sys_path = conn.recv()
+    # Home Assistant may have added paths (e.g. its deps directory) at runtime
+    sys.path[:] = sys_path
+
+    package = types.ModuleType(package_name)
+    package.__path__ = package_path
+    sys.modules[package_name] = package
+
+    arguments = pickle.loads(conn.recv_bytes())
+    worker = importlib.import_module(package_name + ".gateway_worker")
+    worker.run_gateway_worker(conn, *arguments)
+
+
+if __name__ == "__main__":
+    main()
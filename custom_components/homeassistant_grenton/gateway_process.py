@@ -0,0 +1,313 @@
+from __future__ import annotations
+from dataclasses import replace
+from multiprocessing.connection import Connection
+from typing import Any, Callable, Optional
+import asyncio
+import logging
+import multiprocessing
+import os
+import pickle
+import sys
+import time
+
+from .domain.clu import GrentonClu
+from .domain.encryption import GrentonEncryption
+from .domain.action import GrentonAction
+from .state import GrentonValue
+from .shared_state import GrentonSharedStateRegion
+from .gateway_worker import GrentonGatewayLayout
+
+_LOGGER = logging.getLogger(__name__)
+
+# Restart backoff after a crash. It doubles per crash and is reset once a
+# worker stayed up for STABLE_WORKER_AFTER.
+MIN_RESTART_DELAY = 1.0
+MAX_RESTART_DELAY = 60.0
+STABLE_WORKER_AFTER = 60.0
+
+# Time a worker gets to disconnect cleanly before it is terminated
+STOP_TIMEOUT = 5.0
+
+# Script the worker process runs; see its docstring
+_BOOTSTRAP = os.path.join(os.path.dirname(__file__), "gateway_bootstrap.py")
+
+
+class GrentonGatewayProcess:
+    """Coordinator side of the optional gateway process.
+
+    The worker process owns every CLU socket, cipher and subscription: it
+    connects, pings, registers and renews on its own, decodes reports and
+    publishes changed values into a GrentonSharedStateRegion. Home
+    Assistant's process only walks the change ring when the worker signals
+    new entries, so receiving and decrypting traffic runs on another core.
+
+    Commands (layouts, actions, stop) and the few messages that do not fit
+    shared memory travel over a duplex pipe. A worker that exits without
+    being asked to is restarted with backoff; the shared region outlives it,
+    so values stay readable while it is down.
+    """
+
+    def __init__(
+        self,
+        clus: list[GrentonClu],
+        encryption: GrentonEncryption,
+        probe_payload_size: bool,
+        on_values: Callable[[list[int], list[GrentonValue]], None],
+        on_ready: Callable[[str], None],
+        on_timing: Callable[[str, str, float, dict[str, Any]], None],
+    ):
+        self._clus = clus
+        self._encryption = encryption
+        self._probe_payload_size = probe_payload_size
+        # Invoked on the HA loop with shared slots and their new values
+        self._on_values = on_values
+        # Invoked on the HA loop once a CLU answered its first registration
+        self._on_ready = on_ready
+        # Invoked with (CLU ID, phase, seconds, details) for startup phases
+        self._on_timing = on_timing
+
+        self._layouts: dict[str, GrentonGatewayLayout] = {}
+        self._region: Optional[GrentonSharedStateRegion] = None
+        # Change ring position read up to
+        self._position = 0
+
+        self._process: Optional[asyncio.subprocess.Process] = None
+        self._conn: Optional[Connection] = None
+        self._exit_task: Optional[asyncio.Task[None]] = None
+        self._started_at = 0.0
+        self._stopping = False
+        self._restart_delay = MIN_RESTART_DELAY
+        self._restart_task: Optional[asyncio.Task[None]] = None
+
+        self._next_request_id = 0
+        self._pending_actions: dict[int, asyncio.Future[bool]] = {}
+
+        # Metrics
+        self.restarts = 0
+        self.resyncs = 0
+
+    @property
+    def is_running(self) -> bool:
+        return self._process is not None and self._process.returncode is None
+
+    async def start(self, layouts: dict[str, GrentonGatewayLayout]) -> None:
+        """Create the shared region for ``layouts`` and start the worker."""
+        self._layouts = dict(layouts)
+        slot_count = max((layout.base + len(layout.keys) for layout in layouts.values()), default=0)
+        self._region = GrentonSharedStateRegion.create(slot_count)
+        await self._start_worker()
+
+    async def _start_worker(self) -> None:
+        assert self._region is not None
+        # A fresh interpreter, not a fork: Home Assistant's process runs many threads
+        conn, child_conn = multiprocessing.Pipe()
+        try:
+            # -P: the integration's directory must not shadow standard modules
+            process = await asyncio.create_subprocess_exec(
+                sys.executable, "-P", _BOOTSTRAP, str(child_conn.fileno()),
+                pass_fds=(child_conn.fileno(),),
+            )
+        except Exception:
+            conn.close()
+            raise
+        finally:
+            child_conn.close()
+        # Both fit the pipe's buffer, the worker reads them before anything else
+        conn.send((__package__, [os.path.dirname(__file__)], sys.path))
+        conn.send_bytes(pickle.dumps((
+            self._region.name,
+            self._region.slot_count,
+            self._clus,
+            self._encryption,
+            self._probe_payload_size,
+            _LOGGER.getEffectiveLevel(),
+        )))
+
+        self._process = process
+        self._conn = conn
+        self._started_at = time.monotonic()
+        loop = asyncio.get_running_loop()
+        loop.add_reader(conn.fileno(), self._on_readable)
+        self._exit_task = asyncio.create_task(self._wait_for_exit(process))
+        _LOGGER.debug("Started gateway process pid=%s", process.pid)
+
+        if self._stopping:
+            self._send(("stop",))
+            return
+        for clu_id, layout in self._layouts.items():
+            self._send(("layout", clu_id, layout))
+
+    def _send(self, message: tuple[Any, ...]) -> bool:
+        if self._conn is None:
+            return False
+        try:
+            self._conn.send(message)
+            return True
+        except (OSError, ValueError) as e:
+            # The worker is gone; its sentinel reports the exit
+            _LOGGER.debug("Failed to send %s to gateway process: %s", message[0], e)
+            return False
+
+    def _on_readable(self) -> None:
+        conn = self._conn
+        region = self._region
+        if conn is None or region is None:
+            return
+
+        # Latest ring position announced in this batch of messages
+        changed_until: Optional[int] = None
+        try:
+            while conn.poll():
+                message = conn.recv()
+                kind = message[0]
+                if kind == "changed":
+                    changed_until = message[1]
+                elif kind == "value":
+                    _, slot, sequence, value = message
+                    # A newer write to the slot supersedes the piped value
+                    if region.sequence(slot) == sequence:
+                        self._on_values([slot], [value])
+                elif kind == "timing":
+                    self._on_timing(*message[1:])
+                elif kind == "ready":
+                    self._on_ready(message[1])
+                elif kind == "action_done":
+                    _, request_id, success = message
+                    future = self._pending_actions.pop(request_id, None)
+                    if future is not None and not future.done():
+                        future.set_result(success)
+        except (EOFError, OSError):
+            asyncio.get_running_loop().remove_reader(conn.fileno())
+
+        if changed_until is not None:
+            self._read_changes(changed_until)
+
+    def _read_changes(self, end: int) -> None:
+        """Apply every slot written up to the announced ring position ``end``."""
+        region = self._region
+        assert region is not None
+        slots = region.read_changes(self._position, end)
+        self._position = end
+        if slots is None:
+            self.resyncs += 1
+            _LOGGER.debug("Change ring overran, re-reading all %d slot(s)", region.slot_count)
+            slots = list(range(region.slot_count))
+        else:
+            slots = list(dict.fromkeys(slot for slot in slots if slot < region.slot_count))
+        if slots:
+            self._on_values(slots, [region.read(slot) for slot in slots])
+
+    async def _wait_for_exit(self, process: asyncio.subprocess.Process) -> None:
+        await process.wait()
+        self._on_worker_exit(process)
+
+    def _on_worker_exit(self, process: asyncio.subprocess.Process) -> None:
+        conn = self._conn
+        if self._process is not process or conn is None:
+            return
+
+        loop = asyncio.get_running_loop()
+        # Pick up what the worker published before it went away
+        self._on_readable()
+        loop.remove_reader(conn.fileno())
+        conn.close()
+        self._process = None
+        self._conn = None
+        self._exit_task = None
+
+        for future in self._pending_actions.values():
+            if not future.done():
+                future.set_result(False)
+        self._pending_actions.clear()
+
+        if self._stopping:
+            _LOGGER.debug("Gateway process exited with code %s", process.returncode)
+            return
+
+        if time.monotonic() - self._started_at >= STABLE_WORKER_AFTER:
+            self._restart_delay = MIN_RESTART_DELAY
+        delay = self._restart_delay
+        self._restart_delay = min(MAX_RESTART_DELAY, delay * 2)
+        _LOGGER.error("Gateway process exited unexpectedly (exit code %s), restarting in %.0f s",
+                      process.returncode, delay)
+        self._restart_task = asyncio.create_task(self._restart_after(delay))
+
+    async def _restart_after(self, delay: float) -> None:
+        await asyncio.sleep(delay)
+        if self._stopping:
+            return
+        self.restarts += 1
+        try:
+            await self._start_worker()
+        except Exception as e:
+            _LOGGER.error("Failed to restart gateway process: %s", e)
+            delay = self._restart_delay
+            self._restart_delay = min(MAX_RESTART_DELAY, delay * 2)
+            self._restart_task = asyncio.create_task(self._restart_after(delay))
+
+    def update_order(self, clu_id: str, order: list[int]) -> None:
+        """Change a CLU's subscription order; the worker re-registers the affected chunks."""
+        layout = self._layouts.get(clu_id)
+        if layout is None:
+            return
+        self._layouts[clu_id] = layout = replace(layout, order=list(order))
+        self._send(("layout", clu_id, layout))
+
+    async def execute_action(self, action: GrentonAction) -> bool:
+        """Run an action in the worker; False if it failed or the worker is down."""
+        return await self.execute_actions([action])
+
+    async def execute_actions(self, actions: list[GrentonAction]) -> bool:
+        """Run actions of one CLU in order in the worker, as one request."""
+        if self._conn is None:
+            return False
+
+        self._next_request_id += 1
+        request_id = self._next_request_id
+        future: asyncio.Future[bool] = asyncio.get_running_loop().create_future()
+        self._pending_actions[request_id] = future
+        if not self._send(("action", request_id, actions)):
+            self._pending_actions.pop(request_id, None)
+            return False
+        try:
+            return await future
+        finally:
+            self._pending_actions.pop(request_id, None)
+
+    async def stop(self) -> None:
+        """Ask the worker to disconnect and exit, then release the shared region."""
+        self._stopping = True
+        if self._restart_task is not None:
+            self._restart_task.cancel()
+            try:
+                await self._restart_task
+            except asyncio.CancelledError:
+                pass
+            self._restart_task = None
+
+        process = self._process
+        if process is not None:
+            self._send(("stop",))
+            try:
+                await asyncio.wait_for(process.wait(), STOP_TIMEOUT)
+            except TimeoutError:
+                _LOGGER.warning("Gateway process did not stop in time, terminating it")
+                process.terminate()
+                await process.wait()
+            # The exit task may not have run yet
+            self._on_worker_exit(process)
+
+        if self._region is not None:
+            self._region.close()
+            self._region.unlink()
+            self._region = None
+        _LOGGER.debug("Stopped gateway process")
+
+    def metrics(self) -> dict[str, Any]:
+        return {
+            "running": self.is_running,
+            "pid": self._process.pid if self._process is not None else None,
+            "restarts": self.restarts,
+            "resyncs": self.resyncs,
+            "ring_position": self._position,
+        }
@@ -0,0 +1,345 @@
+"""Gateway process side of the optional gateway mode.
+
+Imported by the spawned gateway process, so neither this module nor anything
+it imports may depend on Home Assistant. See GrentonGatewayProcess.
+"""
+from __future__ import annotations
+from dataclasses import dataclass
+from functools import partial
+from multiprocessing.connection import Connection
+from typing import Any, Coroutine, Optional
+import asyncio
+import logging
+import signal
+import time
+
+from .domain.clu import GrentonClu
+from .domain.encryption import GrentonEncryption
+from .domain.action import GrentonAction
+from .domain.enums import GrentonValueType
+from .domain.api.clu import GrentonCluApi
+from .state import GrentonCluState, GrentonCluStateVariableKey, GrentonCluStateAttributeKey, GrentonValue
+from .shared_state import GrentonSharedStateRegion
+
+_LOGGER = logging.getLogger(__name__)
+
+# Ping and subscription renewal cadence inside the worker, same as the coordinator's
+PING_INTERVAL = 5
+RENEWAL_CHECK_INTERVAL = 5
+# Backoff between attempts to open a CLU's socket, same as the coordinator's
+MIN_CONNECT_RETRY_DELAY = 5.0
+MAX_CONNECT_RETRY_DELAY = 60.0
+
+
+@dataclass(slots=True)
+class GrentonGatewayLayout:
+    """Slots one CLU owns in the shared region and the order they are subscribed in.
+
+    ``keys`` and ``value_types`` are in the coordinator's slot order, the
+    shared slot of ``keys[i]`` is ``base + i``. ``order`` lists those local
+    slots in subscription order (hot keys first).
+    """
+    base: int
+    keys: list[GrentonCluStateVariableKey | GrentonCluStateAttributeKey]
+    value_types: list[GrentonValueType | None]
+    order: list[int]
+
+    @staticmethod
+    def from_clu_state(base: int, clu_state: GrentonCluState) -> GrentonGatewayLayout:
+        keys = clu_state.get_keys()
+        return GrentonGatewayLayout(
+            base=base,
+            keys=keys,
+            value_types=[clu_state.get_value_type(key) for key in keys],
+            order=list(clu_state.get_slots(clu_state.get_subscription_order())),
+        )
+
+
+def run_gateway_worker(
+    conn: Connection,
+    region_name: str,
+    slot_count: int,
+    clus: list[GrentonClu],
+    encryption: GrentonEncryption,
+    probe_payload_size: bool,
+    log_level: int,
+) -> None:
+    """Entry point of the gateway process."""
+    # Shutdown is driven by the coordinator, not by Ctrl+C on the process group
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    logging.basicConfig(format="%(asctime)s %(levelname)s (grenton gateway) [%(name)s] %(message)s")
+    logging.getLogger(__package__).setLevel(log_level)
+
+    region = GrentonSharedStateRegion.attach(region_name, slot_count)
+    region.repair()
+    try:
+        asyncio.run(_GatewayWorker(conn, region, clus, encryption, probe_payload_size).run())
+    finally:
+        region.close()
+        conn.close()
+
+
+class _GatewayWorker:
+    """Runs the CLU APIs inside the gateway process.
+
+    Keeps a GrentonCluState per CLU built from the coordinator's layout, so
+    report decoding and change detection happen here and only changed
+    values are written to shared memory.
+    """
+
+    def __init__(
+        self,
+        conn: Connection,
+        region: GrentonSharedStateRegion,
+        clus: list[GrentonClu],
+        encryption: GrentonEncryption,
+        probe_payload_size: bool,
+    ):
+        self._conn = conn
+        self._region = region
+        self._apis: dict[str, GrentonCluApi] = {
+            clu.id: GrentonCluApi(clu, encryption, probe_payload_size=probe_payload_size)
+            for clu in clus
+        }
+        self._states: dict[str, GrentonCluState] = {}
+        self._bases: dict[str, int] = {}
+        self._orders: dict[str, list[GrentonCluStateVariableKey | GrentonCluStateAttributeKey]] = {}
+        self._ready: set[str] = set()
+        # CLUs whose first ping and registration are still running, left
+        # alone by the renewal loop until then
+        self._starting: set[str] = set()
+        # CLUs with a clientRegister in flight; another one for the same
+        # chunks would race it on the subscription endpoints
+        self._registering: set[str] = set()
+        self._tasks: set[asyncio.Task[None]] = set()
+        self._announce_scheduled = False
+        self._stopped: Optional[asyncio.Future[None]] = None
+
+    async def run(self) -> None:
+        loop = asyncio.get_running_loop()
+        self._stopped = loop.create_future()
+
+        # Each CLU is connected, pinged and registered once its layout
+        # arrives, so an unreachable CLU does not delay the others
+        loop.add_reader(self._conn.fileno(), self._on_command)
+        background = [
+            asyncio.create_task(self._ping_loop()),
+            asyncio.create_task(self._renewal_loop()),
+        ]
+        try:
+            await self._stopped
+        finally:
+            loop.remove_reader(self._conn.fileno())
+            tasks = background + list(self._tasks)
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            await asyncio.gather(*(api.disconnect() for api in self._apis.values()), return_exceptions=True)
+
+    def _stop(self) -> None:
+        if self._stopped is not None and not self._stopped.done():
+            self._stopped.set_result(None)
+
+    def _spawn(self, coro: Coroutine[Any, Any, None]) -> None:
+        task = asyncio.create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    def _send(self, message: tuple[Any, ...]) -> None:
+        try:
+            self._conn.send(message)
+        except (OSError, ValueError):
+            # Coordinator is gone, nobody is left to report to
+            self._stop()
+
+    def _on_command(self) -> None:
+        try:
+            while self._conn.poll():
+                message = self._conn.recv()
+                kind = message[0]
+                if kind == "layout":
+                    self._set_layout(message[1], message[2])
+                elif kind == "action":
+                    self._spawn(self._execute_actions(message[1], message[2]))
+                elif kind == "stop":
+                    self._stop()
+                    return
+        except (EOFError, OSError):
+            asyncio.get_running_loop().remove_reader(self._conn.fileno())
+            self._stop()
+
+    async def _connect(self, api: GrentonCluApi) -> None:
+        """Open the CLU's main socket, retrying with backoff until it opens."""
+        delay = MIN_CONNECT_RETRY_DELAY
+        first = True
+        while True:
+            started = time.monotonic()
+            success = False
+            try:
+                success = await api.connect()
+                if not success:
+                    _LOGGER.error("Failed to connect API for CLU %s", api.clu.id)
+            except Exception as e:
+                _LOGGER.error("Error connecting API for CLU %s: %s", api.clu.id, e)
+            if first:
+                first = False
+                self._send(("timing", api.clu.id, "connect", time.monotonic() - started, {"success": success}))
+            if success:
+                api.on_subscription_report = partial(self._apply, api.clu.id)
+                return
+            _LOGGER.warning("[%s] Socket not open, retrying in %.0f s", api.clu.id, delay)
+            await asyncio.sleep(delay)
+            delay = min(MAX_CONNECT_RETRY_DELAY, delay * 2)
+
+    async def _ping(self, api: GrentonCluApi) -> bool:
+        try:
+            success = await api.ping()
+            if not success:
+                _LOGGER.warning("[%s] Ping failed", api.clu.id)
+            return success
+        except Exception as e:
+            _LOGGER.error("[%s] Error during ping: %s", api.clu.id, e)
+            return False
+
+    async def _ping_loop(self) -> None:
+        while True:
+            await asyncio.sleep(PING_INTERVAL)
+            # CLUs still connecting are pinged by their bring-up
+            await asyncio.gather(*(self._ping(api) for api in self._apis.values() if api.protocol is not None))
+
+    async def _renewal_loop(self) -> None:
+        while True:
+            await asyncio.sleep(RENEWAL_CHECK_INTERVAL)
+            # Includes CLUs whose first registration failed, this is their retry
+            await asyncio.gather(*(
+                self._register(clu_id, renew=True)
+                for clu_id in list(self._orders)
+                if clu_id not in self._starting
+            ))
+
+    def _set_layout(self, clu_id: str, layout: GrentonGatewayLayout) -> None:
+        api = self._apis.get(clu_id)
+        if api is None:
+            return
+
+        clu_state = self._states.get(clu_id)
+        if clu_state is None:
+            # Keys are added in the coordinator's slot order, so local slots match
+            clu_state = GrentonCluState()
+            for key, value_type in zip(layout.keys, layout.value_types):
+                if isinstance(key, GrentonCluStateVariableKey):
+                    clu_state.add_variable(key.name, value_type=value_type)
+                else:
+                    clu_state.add_attribute(key.object_name, key.name, value_type=value_type)
+            self._states[clu_id] = clu_state
+            api.value_decoder = clu_state.get_value_decoder
+
+        first = clu_id not in self._orders
+        self._bases[clu_id] = layout.base
+        self._orders[clu_id] = [layout.keys[slot] for slot in layout.order]
+        if first:
+            self._starting.add(clu_id)
+            self._spawn(self._bring_up(clu_id))
+        elif clu_id not in self._starting:
+            self._spawn(self._register(clu_id, renew=True))
+
+    async def _bring_up(self, clu_id: str) -> None:
+        api = self._apis[clu_id]
+        try:
+            await self._connect(api)
+
+            started = time.monotonic()
+            success = await self._ping(api)
+            self._send(("timing", clu_id, "ping", time.monotonic() - started, {"success": success}))
+
+            # Registers the order current by now, layouts may have changed during the ping
+            started = time.monotonic()
+            success = await self._register(clu_id, renew=False)
+            self._send((
+                "timing", clu_id, "register", time.monotonic() - started,
+                {"success": success, "chunks": api.register_timings()},
+            ))
+        finally:
+            # A failed registration is retried by the renewal loop from now on
+            self._starting.discard(clu_id)
+
+    async def _register(self, clu_id: str, renew: bool) -> bool:
+        """Register or renew a CLU's keys; False if it answered no chunk.
+
+        Skipped while an earlier registration of the CLU is still running;
+        the next renewal check picks up whatever changed meanwhile.
+        """
+        if clu_id in self._registering:
+            return False
+        api = self._apis[clu_id]
+        keys = self._orders[clu_id]
+        self._registering.add(clu_id)
+        try:
+            if renew:
+                values = await api.renew_component_states(keys)
+            else:
+                values = await api.register_component_states(keys)
+            if not values:
+                return False
+            # Publish unchanged values too: they confirm restored ones
+            self._apply(clu_id, keys, values, publish_all=True)
+            success = any(value is not None for value in values)
+            if success and clu_id not in self._ready:
+                self._ready.add(clu_id)
+                self._send(("ready", clu_id))
+            return success
+        except Exception as e:
+            _LOGGER.error("[%s] Error during %s: %s", clu_id, "subscription renewal" if renew else "registration", e)
+            return False
+        finally:
+            self._registering.discard(clu_id)
+
+    def _apply(
+        self,
+        clu_id: str,
+        keys: list[GrentonCluStateVariableKey | GrentonCluStateAttributeKey],
+        values: list[GrentonValue],
+        publish_all: bool = False,
+    ) -> None:
+        """Publish the values that changed (or all given ones) to the shared region."""
+        clu_state = self._states.get(clu_id)
+        if clu_state is None:
+            return
+
+        base = self._bases[clu_id]
+        region = self._region
+        changed = clu_state.update_keys(keys, values)
+        if publish_all:
+            published = [key for key, value in zip(keys, values) if value is not None]
+        else:
+            published = changed
+        for key in published:
+            slot = clu_state.get_slot(key)
+            value = clu_state.get_slot_value(slot)
+            sequence = region.write(base + slot, value)
+            if sequence is not None:
+                self._send(("value", base + slot, sequence, value))
+            elif not self._announce_scheduled:
+                # One wakeup per loop iteration, however many reports arrived
+                self._announce_scheduled = True
+                asyncio.get_running_loop().call_soon(self._announce_changes)
+
+    def _announce_changes(self) -> None:
+        self._announce_scheduled = False
+        # Everything written up to this position is visible to the reader
+        # once it received the message
+        self._send(("changed", self._region.position))
+
+    async def _execute_actions(self, request_id: int, actions: list[GrentonAction]) -> None:
+        clu_id = actions[0].clu_id
+        success = False
+        try:
+            api = self._apis.get(clu_id)
+            if api is None:
+                _LOGGER.warning("[%s] No API found for CLU during action execution", clu_id)
+            else:
+                success = await api.execute_actions(actions)
+        except Exception as e:
+            _LOGGER.error("[%s] Error executing action: %s", clu_id, e)
+        finally:
+            self._send(("action_done", request_id, success))
@@ -0,0 +1,125 @@
+"""Cache of the validated mobile interface model."""
+from __future__ import annotations
+from contextlib import suppress
+from functools import cache
+from typing import Any
+import hashlib
+import logging
+import os
+import pickle
+
+import orjson
+import pydantic
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import STORAGE_DIR
+from homeassistant.loader import async_get_integration
+
+from .const import DOMAIN
+from .dto.mobile_interface import GrentonMobileInterfaceDto
+
+_LOGGER = logging.getLogger(__name__)
+
+# Bump when the cache file layout changes
+INTERFACE_CACHE_VERSION = 1
+
+
+def interface_cache_path(hass: HomeAssistant, entry_id: str) -> str:
+    return hass.config.path(STORAGE_DIR, f"{DOMAIN}.{entry_id}.interface")
+
+
+@cache
+def _dto_schema_digest() -> str:
+    """Hash of the DTO classes' JSON schema, computed once per process."""
+    schema = GrentonMobileInterfaceDto.model_json_schema()
+    return hashlib.sha256(orjson.dumps(schema, option=orjson.OPT_SORT_KEYS)).hexdigest()
+
+
+def interface_fingerprint(interface: dict[str, Any], integration_version: str) -> bytes:
+    """Identity of a validated model: interface id, version and content hash.
+
+    The DTO schema, integration and pydantic versions are part of it, so a
+    model pickled with other DTO classes is never reused, even when a DTO
+    changed without a version bump.
+    """
+    digest = hashlib.sha256(orjson.dumps(interface, option=orjson.OPT_SORT_KEYS)).hexdigest()
+    return (
+        f"{INTERFACE_CACHE_VERSION}:{interface.get('id')}:{interface.get('version')}:{digest}"
+        f":{integration_version}:{pydantic.VERSION}:{_dto_schema_digest()}"
+    ).encode()
+
+
+def _read_cached(path: str, fingerprint: bytes) -> GrentonMobileInterfaceDto | None:
+    try:
+        with open(path, "rb") as file:
+            # Fingerprint line first, so a stale file is rejected unread
+            if file.readline().rstrip(b"\n") != fingerprint:
+                return None
+            model = pickle.load(file)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        _LOGGER.warning("Ignoring unreadable interface cache %s: %s", path, e)
+        return None
+    return model if isinstance(model, GrentonMobileInterfaceDto) else None
+
+
+def _write_cached(path: str, fingerprint: bytes, model: GrentonMobileInterfaceDto) -> None:
+    temp_path = f"{path}.tmp"
+    try:
+        with open(temp_path, "wb") as file:
+            file.write(fingerprint + b"\n")
+            pickle.dump(model, file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_path, path)
+    except OSError as e:
+        _LOGGER.warning("Failed to write interface cache %s: %s", path, e)
+    finally:
+        # Left behind only when writing or replacing failed
+        with suppress(OSError):
+            os.remove(temp_path)
+
+
+def _load_or_validate(
+    path: str,
+    interface: dict[str, Any],
+    integration_version: str,
+) -> tuple[GrentonMobileInterfaceDto, bool]:
+    fingerprint = interface_fingerprint(interface, integration_version)
+    model = _read_cached(path, fingerprint)
+    if model is not None:
+        return model, True
+
+    model = GrentonMobileInterfaceDto(**interface)
+    _write_cached(path, fingerprint, model)
+    return model, False
+
+
+async def async_load_mobile_interface(
+    hass: HomeAssistant,
+    entry_id: str,
+    interface: dict[str, Any],
+) -> tuple[GrentonMobileInterfaceDto, bool]:
+    """Validated interface model and whether it came from the cache.
+
+    Pydantic validation of a large interface dominates setup, so the model
+    is pickled next to HA's other storage files, keyed by
+    interface_fingerprint. It is only validated again when the interface or
+    the integration changed. Runs in the executor.
+
+    The file is written by this integration only, into Home Assistant's
+    private storage directory, which is what makes unpickling it acceptable.
+    """
+    integration = await async_get_integration(hass, DOMAIN)
+    return await hass.async_add_executor_job(
+        _load_or_validate,
+        interface_cache_path(hass, entry_id),
+        interface,
+        str(integration.version),
+    )
+
+
+def remove_interface_cache(path: str) -> None:
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
@@ -0,0 +1,61 @@
+from __future__ import annotations
+from typing import Any, Callable, Coroutine, TypeVar
+import logging
+import asyncio
+import threading
+
+_LOGGER = logging.getLogger(__name__)
+
+_T = TypeVar("_T")
+
+
+class GrentonIoThread:
+    """Event loop on a dedicated thread that owns all CLU networking.
+
+    Sockets, AES work and report decoding then run off Home Assistant's
+    loop. Coroutines are submitted with ``run`` (run_coroutine_threadsafe)
+    and awaited from the HA loop; results travel back the same way.
+    """
+
+    def __init__(self, name: str = "grenton_io"):
+        self.loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread.is_alive()
+
+    def start(self) -> None:
+        self._thread.start()
+        _LOGGER.debug("Started I/O thread %s", self._thread.name)
+
+    def _run(self) -> None:
+        asyncio.set_event_loop(self.loop)
+        try:
+            self.loop.run_forever()
+        finally:
+            tasks = asyncio.all_tasks(self.loop)
+            for task in tasks:
+                task.cancel()
+            if tasks:
+                self.loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+            self.loop.close()
+
+    async def run(self, coro: Coroutine[Any, Any, _T]) -> _T:
+        """Run ``coro`` on the I/O loop and await its result from the calling loop.
+
+        Cancelling the caller cancels the coroutine on the I/O loop too.
+        """
+        return await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(coro, self.loop))
+
+    def call_soon(self, callback: Callable[..., Any], *args: Any) -> None:
+        """Schedule a plain callback on the I/O loop from any thread."""
+        self.loop.call_soon_threadsafe(callback, *args)
+
+    async def stop(self) -> None:
+        """Stop the loop, cancel what is left on it and join the thread."""
+        if not self._thread.is_alive():
+            return
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        await asyncio.get_running_loop().run_in_executor(None, self._thread.join)
+        _LOGGER.debug("Stopped I/O thread %s", self._thread.name)
@@ -23,7 +23,7 @@ class DeviceValueDoubleMapper:
             coordinator=coordinator,
             id=f"{dto.id}_0",
             label=dto.componentLeft.label,
-            state_object=GrentonStateObject.from_dto(dto.componentLeft.object.value),
+            state_object=GrentonStateObject.from_dto(dto.componentLeft.object.value, dto.componentLeft.valueType),
             device_info=device.device_info,
         )
 
@@ -31,7 +31,7 @@ class DeviceValueDoubleMapper:
             coordinator=coordinator,
             id=f"{dto.id}_1",
             label=dto.componentRight.label,
-            state_object=GrentonStateObject.from_dto(dto.componentRight.object.value),
+            state_object=GrentonStateObject.from_dto(dto.componentRight.object.value, dto.componentRight.valueType),
             device_info=device.device_info,
         )
 
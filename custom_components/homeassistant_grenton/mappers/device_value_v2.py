@@ -23,7 +23,7 @@ class DeviceValueV2Mapper:
             coordinator=coordinator,
             id=f"{dto.id}_0",
             label=dto.label,
-            state_object=GrentonStateObject.from_dto(dto.object.value),
+            state_object=GrentonStateObject.from_dto(dto.object.value, dto.valueType),
             device_info=device.device_info,
         )
         
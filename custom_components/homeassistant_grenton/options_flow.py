@@ -6,6 +6,8 @@ import voluptuous as vol
 from homeassistant.config_entries import ConfigFlowResult, OptionsFlow
 from homeassistant.helpers import selector
 
+from .const import CONF_SETTINGS, CONF_PROBE_PAYLOAD_SIZE, CONF_IO_THREAD, CONF_GATEWAY_PROCESS
+
 class GrentonOptionsFlow(OptionsFlow):
     """Handle options flow for Grenton integration."""
 
@@ -25,8 +27,38 @@ class GrentonOptionsFlow(OptionsFlow):
         raise AttributeError(name)
 
     async def async_step_init(self, user_input: dict[str, Any] | None = None) -> ConfigFlowResult:
-        """Manage the options - show list of entities to configure."""
-        return await self.async_step_entity_list(user_input)
+        """Manage the options - choose between entity and integration settings."""
+        return self.async_show_menu(
+            step_id="init",
+            menu_options=["entity_list", "settings"],
+        )
+
+    async def async_step_settings(self, user_input: dict[str, Any] | None = None) -> ConfigFlowResult:
+        """Integration-wide settings, applied by reloading the entry."""
+        options = dict(self.config_entry.options)
+        current: dict[str, Any] = options.get(CONF_SETTINGS, {})
+
+        if user_input is not None:
+            options[CONF_SETTINGS] = user_input
+            return self.async_create_entry(title="", data=options)
+
+        return self.async_show_form(
+            step_id="settings",
+            data_schema=vol.Schema({
+                vol.Required(
+                    CONF_PROBE_PAYLOAD_SIZE,
+                    default=current.get(CONF_PROBE_PAYLOAD_SIZE, False),
+                ): selector.BooleanSelector(),
+                vol.Required(
+                    CONF_IO_THREAD,
+                    default=current.get(CONF_IO_THREAD, False),
+                ): selector.BooleanSelector(),
+                vol.Required(
+                    CONF_GATEWAY_PROCESS,
+                    default=current.get(CONF_GATEWAY_PROCESS, False),
+                ): selector.BooleanSelector(),
+            }),
+        )
 
     async def async_step_entity_list(self, user_input: dict[str, Any] | None = None) -> ConfigFlowResult:
         """Show list of configurable entities."""
@@ -0,0 +1,115 @@
+from __future__ import annotations
+from typing import Callable, Optional
+import asyncio
+
+from .state import GrentonCluStateVariableKey, GrentonCluStateAttributeKey, GrentonValue
+
+type GrentonReport = tuple[
+    list[GrentonCluStateVariableKey | GrentonCluStateAttributeKey],
+    list[GrentonValue],
+]
+
+# Loop lag above which the event loop counts as busy and the window grows
+REPORT_LAG_THRESHOLD = 0.01
+# Smallest non-zero window and the ceiling it can grow to
+MIN_REPORT_WINDOW = 0.005
+MAX_REPORT_WINDOW = 0.1
+# A CLU quiet for this long starts its next burst with a zero window
+REPORT_IDLE_RESET = 1.0
+
+
+class GrentonReportBatcher:
+    """Collects clientReports of one CLU and applies them once per window.
+
+    A scene change makes the CLU fire reports on many chunk sockets at once.
+    Instead of applying and notifying per report, reports are queued in
+    arrival order and handed to ``apply`` together, so each burst costs one
+    state application and one notification pass.
+
+    The window adapts to event loop lag measured at each flush: it doubles
+    while the loop runs late and halves back to zero once it keeps up. At
+    zero, reports are still batched within one loop iteration (call_soon).
+    """
+
+    def __init__(self, apply: Callable[[list[GrentonReport]], None]):
+        self._apply = apply
+        self._pending: list[GrentonReport] = []
+        self._flush_handle: Optional[asyncio.TimerHandle | asyncio.Handle] = None
+        self._flush_due = 0.0
+        self._last_flush = 0.0
+
+        # Metrics
+        self.window = 0.0
+        self.last_lag = 0.0
+        self.last_batch_size = 0
+        self.max_batch_size = 0
+        self.batches = 0
+        self.reports = 0
+
+    def submit(
+        self,
+        keys: list[GrentonCluStateVariableKey | GrentonCluStateAttributeKey],
+        values: list[GrentonValue],
+    ) -> None:
+        """Queue a report for the next flush."""
+        self._pending.append((keys, values))
+        if self._flush_handle is not None:
+            return
+
+        loop = asyncio.get_running_loop()
+        now = loop.time()
+        if now - self._last_flush > REPORT_IDLE_RESET:
+            self.window = 0.0
+        self._flush_due = now + self.window
+        if self.window:
+            self._flush_handle = loop.call_later(self.window, self._on_flush)
+        else:
+            self._flush_handle = loop.call_soon(self._on_flush)
+
+    def _on_flush(self) -> None:
+        self._flush_handle = None
+        now = asyncio.get_running_loop().time()
+        self._last_flush = now
+        self._adapt(max(0.0, now - self._flush_due))
+        self.flush()
+
+    def _adapt(self, lag: float) -> None:
+        self.last_lag = lag
+        if lag > REPORT_LAG_THRESHOLD:
+            self.window = min(MAX_REPORT_WINDOW, max(MIN_REPORT_WINDOW, self.window * 2))
+        elif self.window > MIN_REPORT_WINDOW:
+            self.window /= 2
+        else:
+            self.window = 0.0
+
+    def flush(self) -> None:
+        """Apply all queued reports now (e.g. before applying a register response)."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if not self._pending:
+            return
+
+        batch, self._pending = self._pending, []
+        self.batches += 1
+        self.reports += len(batch)
+        self.last_batch_size = len(batch)
+        self.max_batch_size = max(self.max_batch_size, len(batch))
+        self._apply(batch)
+
+    def cancel(self) -> None:
+        """Drop queued reports, used on shutdown."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        self._pending = []
+
+    def metrics(self) -> dict[str, float | int]:
+        return {
+            "window": self.window,
+            "last_lag": self.last_lag,
+            "last_batch_size": self.last_batch_size,
+            "max_batch_size": self.max_batch_size,
+            "batches": self.batches,
+            "reports": self.reports,
+        }
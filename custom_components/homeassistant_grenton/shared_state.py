@@ -0,0 +1,247 @@
+from __future__ import annotations
+from multiprocessing import resource_tracker, shared_memory
+from typing import Optional
+import struct
+import sys
+import zlib
+
+from .state import GrentonValue
+
+# Region layout, all offsets 64-byte aligned:
+#   header  write counter of the change ring
+#   ring    (position, slot number) in the order slots were written
+#   slots   one fixed-size record per state slot
+_ALIGN = 64
+_HEADER = struct.Struct("<Q")
+# The position is stored truncated to 32 bits, enough to tell a current
+# entry from one left over from an earlier lap
+_RING_ENTRY = struct.Struct("<II")
+
+# Slot record: sequence counter, value tag, payload length, checksum, then
+# the payload. The sequence is odd while the record is being written
+# (seqlock); the checksum covers sequence, tag, length and payload.
+SLOT_SIZE = 64
+_SEQ = struct.Struct("<I")
+_SLOT_HEADER = struct.Struct("<IBxHI")
+_CHECKED_HEADER = struct.Struct("<IBxH")
+SLOT_PAYLOAD_SIZE = SLOT_SIZE - _SLOT_HEADER.size
+_INT = struct.Struct("<q")
+_FLOAT = struct.Struct("<d")
+
+_TAG_EMPTY = 0
+_TAG_BOOL = 1
+_TAG_INT = 2
+_TAG_FLOAT = 3
+_TAG_STRING = 4
+# Value did not fit the record and travels over the pipe instead
+_TAG_PIPED = 5
+
+# Ring capacity per slot; a reader further behind than the ring re-reads every slot
+RING_ENTRIES_PER_SLOT = 4
+MIN_RING_ENTRIES = 1024
+
+# Attempts to read a record that keeps changing underneath the reader
+_READ_RETRIES = 100
+
+
+def _aligned(size: int) -> int:
+    return -(-size // _ALIGN) * _ALIGN
+
+
+def _encode(value: GrentonValue) -> Optional[tuple[int, bytes]]:
+    """Tag and payload of a value, None if it does not fit a slot record."""
+    if isinstance(value, bool):
+        return _TAG_BOOL, b"\x01" if value else b"\x00"
+    if isinstance(value, int):
+        if -(1 << 63) <= value < (1 << 63):
+            return _TAG_INT, _INT.pack(value)
+        return None
+    if isinstance(value, float):
+        return _TAG_FLOAT, _FLOAT.pack(value)
+    if isinstance(value, str):
+        data = value.encode()
+        if len(data) <= SLOT_PAYLOAD_SIZE:
+            return _TAG_STRING, data
+    return None
+
+
+def _decode(tag: int, payload: bytes) -> GrentonValue:
+    if tag == _TAG_BOOL:
+        return payload == b"\x01"
+    if tag == _TAG_INT:
+        return _INT.unpack(payload)[0]
+    if tag == _TAG_FLOAT:
+        return _FLOAT.unpack(payload)[0]
+    if tag == _TAG_STRING:
+        return payload.decode()
+    return None
+
+
+def _checksum(seq: int, tag: int, payload: bytes) -> int:
+    return zlib.crc32(payload, zlib.crc32(_CHECKED_HEADER.pack(seq, tag, len(payload))))
+
+
+class GrentonSharedStateRegion:
+    """Slot-indexed state values in shared memory plus a ring of changed slots.
+
+    Written by the gateway process only, read by the coordinator. Every slot
+    is a 64-byte record guarded by a seqlock, so the reader never blocks the
+    writer and retries the rare read that overlaps a write. Each write also
+    appends the slot to the change ring; the reader walks the ring from its
+    last position and only decodes slots that changed.
+
+    Nothing here relies on the order in which another core observes the
+    plain memoryview stores, which weakly ordered CPUs (the ARM boards Home
+    Assistant often runs on) do not preserve:
+
+    - The writer announces the ring position it reached over the pipe, and
+      the reader walks the ring only up to an announced position. The pipe
+      round trip through the kernel orders everything written before it.
+    - Records may still be rewritten while they are read. A record is only
+      accepted when its checksum matches, so a mix of two writes is retried.
+    - Ring entries carry their position, so an entry overwritten by a later
+      lap is detected and the reader re-reads every slot instead.
+
+    Values that do not fit a record (long strings, huge integers) are marked
+    piped: the writer sends them over the pipe together with the record's
+    sequence, and the reader accepts them only while that sequence is current.
+    """
+
+    def __init__(self, memory: shared_memory.SharedMemory, slot_count: int, ring_size: int):
+        self._memory = memory
+        self._buf = memory.buf
+        self.slot_count = slot_count
+        self.ring_size = ring_size
+        self._ring_offset = _ALIGN
+        self._slots_offset = self._ring_offset + _aligned(ring_size * _RING_ENTRY.size)
+
+    @property
+    def name(self) -> str:
+        return self._memory.name
+
+    @staticmethod
+    def _ring_size_for(slot_count: int) -> int:
+        return max(MIN_RING_ENTRIES, slot_count * RING_ENTRIES_PER_SLOT)
+
+    @classmethod
+    def create(cls, slot_count: int) -> GrentonSharedStateRegion:
+        ring_size = cls._ring_size_for(slot_count)
+        size = _ALIGN + _aligned(ring_size * _RING_ENTRY.size) + max(1, slot_count) * SLOT_SIZE
+        region = cls(shared_memory.SharedMemory(create=True, size=size), slot_count, ring_size)
+        # Zeroed memory does not match its checksum; start from valid empty records
+        empty = _checksum(0, _TAG_EMPTY, b"")
+        for slot in range(slot_count):
+            _SLOT_HEADER.pack_into(region._buf, region._slot_offset(slot), 0, _TAG_EMPTY, 0, empty)
+        return region
+
+    @classmethod
+    def attach(cls, name: str, slot_count: int) -> GrentonSharedStateRegion:
+        # The creating process owns the segment and unlinks it
+        if sys.version_info >= (3, 13):
+            memory = shared_memory.SharedMemory(name=name, track=False)
+        else:
+            # Before 3.13 attaching always registers the segment with this
+            # process' resource tracker, which would unlink it on exit
+            memory = shared_memory.SharedMemory(name=name)
+            resource_tracker.unregister(memory._name, "shared_memory")  # type: ignore[attr-defined]
+        return cls(memory, slot_count, cls._ring_size_for(slot_count))
+
+    def close(self) -> None:
+        self._buf = None  # type: ignore[assignment]
+        self._memory.close()
+
+    def unlink(self) -> None:
+        self._memory.unlink()
+
+    def _slot_offset(self, slot: int) -> int:
+        return self._slots_offset + slot * SLOT_SIZE
+
+    # Writer side
+
+    def repair(self) -> None:
+        """Finish records left half-written by a writer that died mid-write."""
+        buf = self._buf
+        for slot in range(self.slot_count):
+            offset = self._slot_offset(slot)
+            seq = _SEQ.unpack_from(buf, offset)[0]
+            if seq & 1:
+                seq = (seq + 1) & 0xFFFFFFFF
+                _SLOT_HEADER.pack_into(buf, offset, seq, _TAG_EMPTY, 0, _checksum(seq, _TAG_EMPTY, b""))
+
+    def write(self, slot: int, value: GrentonValue) -> Optional[int]:
+        """Store a value and log the slot in the change ring.
+
+        Returns None, or the record's sequence if the value must be piped.
+        """
+        buf = self._buf
+        offset = self._slot_offset(slot)
+        seq = _SEQ.unpack_from(buf, offset)[0]
+        encoded = _encode(value)
+        tag, payload = (_TAG_PIPED, b"") if encoded is None else encoded
+
+        # Odd sequence first: readers retry until the record is complete
+        _SEQ.pack_into(buf, offset, (seq + 1) & 0xFFFFFFFF)
+        start = offset + _SLOT_HEADER.size
+        buf[start:start + len(payload)] = payload
+        seq = (seq + 2) & 0xFFFFFFFF
+        _SLOT_HEADER.pack_into(buf, offset, seq, tag, len(payload), _checksum(seq, tag, payload))
+
+        if encoded is None:
+            return seq
+
+        position = _HEADER.unpack_from(buf, 0)[0]
+        _RING_ENTRY.pack_into(
+            buf,
+            self._ring_offset + (position % self.ring_size) * _RING_ENTRY.size,
+            position & 0xFFFFFFFF,
+            slot,
+        )
+        _HEADER.pack_into(buf, 0, position + 1)
+        return None
+
+    @property
+    def position(self) -> int:
+        """Ring position after the last write; the writer announces it to the reader."""
+        return _HEADER.unpack_from(self._buf, 0)[0]
+
+    # Reader side
+
+    def sequence(self, slot: int) -> int:
+        return _SEQ.unpack_from(self._buf, self._slot_offset(slot))[0]
+
+    def read(self, slot: int) -> GrentonValue:
+        """Current value of a slot; None if empty, piped or not readable."""
+        buf = self._buf
+        offset = self._slot_offset(slot)
+        for _ in range(_READ_RETRIES):
+            # One copy, then validated as a whole
+            record = bytes(buf[offset:offset + SLOT_SIZE])
+            seq, tag, length, checksum = _SLOT_HEADER.unpack_from(record)
+            if seq & 1 or length > SLOT_PAYLOAD_SIZE:
+                continue
+            payload = record[_SLOT_HEADER.size:_SLOT_HEADER.size + length]
+            if _checksum(seq, tag, payload) == checksum:
+                return _decode(tag, payload)
+        return None
+
+    def read_changes(self, position: int, end: int) -> Optional[list[int]]:
+        """Slots written between ring positions ``position`` and ``end``.
+
+        ``end`` must be a position announced by the writer. Returns None when
+        the writer lapped the reader; the caller then has to re-read every
+        slot.
+        """
+        if end - position > self.ring_size:
+            return None
+
+        buf = self._buf
+        ring_offset = self._ring_offset
+        size = self.ring_size
+        slots: list[int] = []
+        for index in range(position, end):
+            tag, slot = _RING_ENTRY.unpack_from(buf, ring_offset + (index % size) * _RING_ENTRY.size)
+            # Overwritten by a later lap while it was waiting to be read
+            if tag != index & 0xFFFFFFFF:
+                return None
+            slots.append(slot)
+        return slots
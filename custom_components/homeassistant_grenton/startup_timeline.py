@@ -0,0 +1,87 @@
+from __future__ import annotations
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Iterator, Optional
+import logging
+import time
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class GrentonTimelineEntry:
+    """One measured startup phase, times in seconds since the timeline started."""
+    phase: str
+    start: float
+    duration: float
+    clu_id: Optional[str] = None
+    details: dict[str, Any] = field(default_factory=dict)
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "phase": self.phase,
+            "clu_id": self.clu_id,
+            "start_ms": round(self.start * 1000, 1),
+            "duration_ms": round(self.duration * 1000, 1),
+            **self.details,
+        }
+
+
+class GrentonStartupTimeline:
+    """Durations of the phases of one config entry setup.
+
+    Setup itself returns before the CLUs are up, so the timeline also waits
+    for milestones: platform forwarding and the first bring-up attempt of
+    every CLU. Once all expected milestones completed, a one-line summary
+    is logged. The entries are exposed through diagnostics.
+    """
+
+    def __init__(self) -> None:
+        self._started = time.monotonic()
+        self.entries: list[GrentonTimelineEntry] = []
+        self._pending: set[str] = set()
+        self.completed_after: Optional[float] = None
+
+    def add(self, phase: str, duration: float, clu_id: Optional[str] = None, **details: Any) -> None:
+        """Record a phase that ended just now and took ``duration`` seconds."""
+        start = time.monotonic() - self._started - duration
+        self.entries.append(GrentonTimelineEntry(phase, start, duration, clu_id, details))
+
+    @contextmanager
+    def measure(self, phase: str, clu_id: Optional[str] = None, **details: Any) -> Iterator[dict[str, Any]]:
+        """Time the block; details added to the yielded dict are recorded too."""
+        started = time.monotonic()
+        try:
+            yield details
+        finally:
+            self.add(phase, time.monotonic() - started, clu_id, **details)
+
+    def expect(self, *milestones: str) -> None:
+        if self.completed_after is None:
+            self._pending.update(milestones)
+
+    def is_pending(self, milestone: str) -> bool:
+        return milestone in self._pending
+
+    def complete(self, milestone: str) -> None:
+        """Mark a milestone; the summary is logged when the last one completes."""
+        if self.completed_after is not None or milestone not in self._pending:
+            return
+        self._pending.discard(milestone)
+        if not self._pending:
+            self.completed_after = time.monotonic() - self._started
+            _LOGGER.info("Startup finished in %.0f ms: %s", self.completed_after * 1000, self.summary())
+
+    def summary(self) -> str:
+        parts = []
+        for entry in self.entries:
+            label = f"{entry.clu_id} {entry.phase}" if entry.clu_id else entry.phase
+            parts.append(f"{label} {entry.duration * 1000:.1f} ms")
+        return ", ".join(parts)
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "completed_ms": round(self.completed_after * 1000, 1) if self.completed_after is not None else None,
+            "pending": sorted(self._pending),
+            "entries": [entry.as_dict() for entry in self.entries],
+        }
@@ -1,27 +1,48 @@
 from __future__ import annotations
-from typing import Union, Any
+from collections.abc import Iterator, Mapping
+from typing import Union, Any, Callable
 from dataclasses import dataclass
+from .domain.enums import GrentonValueType
 from .domain.state_object import GrentonStateObject, GrentonAttributeValueObject, GrentonVariableValueObject
 
 # Type alias for Grenton values (string, boolean, number, or None)
 GrentonValue = Union[str, bool, int, float, None]
 
+# Converts one raw value token of a clientReport to a GrentonValue
+GrentonValueDecoder = Callable[[str], GrentonValue]
+
+# Smoothed changes per minute above which a key counts as hot, and below
+# which a hot key falls back to cold. The gap keeps keys near the threshold
+# from flapping between chunks.
+HOT_KEY_CHANGES_PER_MINUTE = 1.0
+COLD_KEY_CHANGES_PER_MINUTE = 0.5
+
+
+_LITERALS: dict[str, GrentonValue] = {"nil": None, "true": True, "false": False}
+_NUMBER_START = frozenset("0123456789+-.")
+
 
 def cast_string_to_grenton_value(value: str) -> GrentonValue:
     """Cast string value to appropriate Python type."""
     stripped_value = value.strip().strip('"')  # Remove surrounding quotes
-    
-    # Handle nil/None values
-    if stripped_value.lower() == 'nil':
-        return None
-    
-    # Handle boolean values
-    if stripped_value.lower() == 'true':
-        return True
-    if stripped_value.lower() == 'false':
-        return False
-    
-    # Handle numeric values
+    if not stripped_value:
+        return stripped_value
+
+    # Handle nil/None and boolean values
+    if len(stripped_value) <= 5:
+        lowered = stripped_value.lower()
+        if lowered in _LITERALS:
+            return _LITERALS[lowered]
+
+    # Plain integers are by far the most common value
+    if stripped_value.isdecimal():
+        return int(stripped_value)
+
+    # Only attempt numeric parsing when the text can be a number, so plain
+    # strings don't pay for two failed conversions
+    if stripped_value[0] not in _NUMBER_START and stripped_value[:3].lower() not in ("inf", "nan"):
+        return stripped_value
+
     try:
         # Try to convert to int first
         return int(stripped_value)
@@ -34,93 +55,334 @@ def cast_string_to_grenton_value(value: str) -> GrentonValue:
             return stripped_value
 
 
-@dataclass(frozen=True)
+def _decode_string(value: str) -> GrentonValue:
+    stripped_value = value.strip()
+    if stripped_value == "nil":
+        return None
+    return stripped_value.strip('"')
+
+
+def _decode_float(value: str) -> GrentonValue:
+    try:
+        return float(value)
+    except ValueError:
+        # nil, booleans or a mistyped value
+        return cast_string_to_grenton_value(value)
+
+
+def _decode_integer(value: str) -> GrentonValue:
+    try:
+        return int(value)
+    except ValueError:
+        return cast_string_to_grenton_value(value)
+
+
+_VALUE_DECODERS: dict[GrentonValueType, GrentonValueDecoder] = {
+    GrentonValueType.STRING: _decode_string,
+    GrentonValueType.FLOAT: _decode_float,
+    GrentonValueType.INTEGER: _decode_integer,
+}
+
+
+def decoder_for_value_type(value_type: GrentonValueType | None) -> GrentonValueDecoder:
+    """Decoder for a declared value type; the guessing cast when it is unknown."""
+    if value_type is None:
+        return cast_string_to_grenton_value
+    return _VALUE_DECODERS.get(value_type, cast_string_to_grenton_value)
+
+
+@dataclass(frozen=True, slots=True)
 class GrentonCluStateVariableKey:
     """Key for identifying a CLU state variable."""
     name: str
 
+    def serialize(self) -> list[str]:
+        """JSON-friendly form, see deserialize_state_key."""
+        return [self.name]
+
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GrentonCluStateAttributeKey:
     """Key for identifying a CLU state attribute."""
     object_name: str
     name: str
 
+    def serialize(self) -> list[str]:
+        """JSON-friendly form, see deserialize_state_key."""
+        return [self.object_name, self.name]
 
-@dataclass
+
+def deserialize_state_key(data: list[str]) -> GrentonCluStateVariableKey | GrentonCluStateAttributeKey:
+    """Inverse of the keys' serialize()."""
+    if len(data) == 1:
+        return GrentonCluStateVariableKey(data[0])
+    return GrentonCluStateAttributeKey(data[0], data[1])
+
+
+@dataclass(frozen=True, slots=True)
 class GrentonCluStateVariable:
-    """Represents a CLU state variable."""
+    """Represents a CLU state variable.
+
+    Read-only: values are changed through GrentonCluState.update_*.
+    """
     name: str
     value: GrentonValue
     
     def __init__(self, name: str, value: GrentonValue | None = None):
-        self.name = name
-        self.value = value if value is not None else ""
+        object.__setattr__(self, "name", name)
+        object.__setattr__(self, "value", value if value is not None else "")
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class GrentonCluStateAttribute:
-    """Represents a CLU state attribute."""
+    """Represents a CLU state attribute.
+
+    Read-only: values are changed through GrentonCluState.update_*.
+    """
     object_name: str
     name: str
     value: GrentonValue
     
     def __init__(self, object_name: str, name: str, value: GrentonValue | None = None):
-        self.object_name = object_name
-        self.name = name
-        self.value = value if value is not None else ""
+        object.__setattr__(self, "object_name", object_name)
+        object.__setattr__(self, "name", name)
+        object.__setattr__(self, "value", value if value is not None else "")
     
     @property
     def key(self) -> GrentonCluStateAttributeKey:
         """Get the key for this attribute."""
         return GrentonCluStateAttributeKey(self.object_name, self.name)
 
+class GrentonStateHandle:
+    """Read access to one registered state, resolved once at registration.
+
+    Holds the CLU state's value list and the key's slot, so reading
+    ``value`` is a single list index with no key lookup or allocation.
+    """
+
+    __slots__ = ("_values", "_restored", "_slot")
+
+    def __init__(self, values: list[GrentonValue], restored: list[bool], slot: int):
+        self._values = values
+        self._restored = restored
+        self._slot = slot
+
+    @property
+    def value(self) -> GrentonValue | None:
+        return self._values[self._slot]
+
+    @property
+    def restored(self) -> bool:
+        """Whether the value comes from the snapshot and no live value confirmed it yet."""
+        return self._restored[self._slot]
+
+
+# Handle for states that cannot be tracked (e.g. unknown CLU); always None
+_UNTRACKED_STATE_HANDLE = GrentonStateHandle([None], [False], 0)
+
+
+def _variable_entry(key: GrentonCluStateVariableKey, value: GrentonValue) -> GrentonCluStateVariable:
+    return GrentonCluStateVariable(key.name, value)
+
+
+def _attribute_entry(key: GrentonCluStateAttributeKey, value: GrentonValue) -> GrentonCluStateAttribute:
+    return GrentonCluStateAttribute(key.object_name, key.name, value)
+
+
+class _GrentonCluStateView(Mapping[Any, Any]):
+    """Read-only live view of a CLU state's variables or attributes.
+
+    Shares the state's key list, slot map and value list, which are only
+    ever mutated in place, so nothing is copied when the view is read. An
+    entry is built from the current value when it is looked up.
+    """
+
+    __slots__ = ("_keys", "_slots", "_values", "_key_type", "_entry")
+
+    def __init__(
+        self,
+        keys: list[GrentonCluStateVariableKey | GrentonCluStateAttributeKey],
+        slots: dict[GrentonCluStateVariableKey | GrentonCluStateAttributeKey, int],
+        values: list[GrentonValue],
+        key_type: type,
+        entry: Callable[[Any, GrentonValue], Any],
+    ):
+        self._keys = keys
+        self._slots = slots
+        self._values = values
+        self._key_type = key_type
+        self._entry = entry
+
+    def __getitem__(self, key: Any) -> Any:
+        if not isinstance(key, self._key_type):
+            raise KeyError(key)
+        return self._entry(key, self._values[self._slots[key]])
+
+    def __contains__(self, key: object) -> bool:
+        return isinstance(key, self._key_type) and key in self._slots
+
+    def __iter__(self) -> Iterator[Any]:
+        key_type = self._key_type
+        return (key for key in self._keys if isinstance(key, key_type))
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+
 class GrentonCluState:
-    """State management for a single CLU with efficient dictionary-based storage."""
-    
+    """State management for a single CLU with array-backed storage.
+
+    Every registered key owns an integer slot; values live in one flat list
+    indexed by slot. Reports arrive as (chunk keys, values) with the same
+    chunk list object every time, so the slots of a key list are resolved
+    once and cached, and update_keys is a positional write loop.
+    """
+
     def __init__(self):
-        # Variables: dict[variable_name, GrentonCluStateVariable]
-        self.variables: dict[GrentonCluStateVariableKey, GrentonCluStateVariable] = {}
-        
-        # Attributes: dict[(object_name, attribute_name), GrentonCluStateAttribute]
-        self.attributes: dict[GrentonCluStateAttributeKey, GrentonCluStateAttribute] = {}
-        
-        # Maintain subscription order
-        self._subscription_order: list[GrentonCluStateVariableKey | GrentonCluStateAttributeKey] = []
-    
-    def add_variable(self, name: str, initial_value: GrentonValue | None = None) -> None:
+        # slot -> key / value / change count since the last tier update.
+        # _keys, _values and _slots are only ever mutated in place: handles
+        # and the variables/attributes views keep references to them.
+        self._keys: list[GrentonCluStateVariableKey | GrentonCluStateAttributeKey] = []
+        self._values: list[GrentonValue] = []
+        self._change_counts: list[int] = []
+        # Slot holds a value restored from the snapshot, not confirmed by the CLU yet
+        self._restored: list[bool] = []
+        # Slots changed since the last snapshot
+        self._dirty: set[int] = set()
+        self._slots: dict[GrentonCluStateVariableKey | GrentonCluStateAttributeKey, int] = {}
+        self._variables = _GrentonCluStateView(
+            self._keys, self._slots, self._values, GrentonCluStateVariableKey, _variable_entry
+        )
+        self._attributes = _GrentonCluStateView(
+            self._keys, self._slots, self._values, GrentonCluStateAttributeKey, _attribute_entry
+        )
+
+        # id(key list) -> (key list, slots). The list is kept referenced so its
+        # id cannot be reused while cached; identity is checked on lookup.
+        self._slot_vectors: dict[
+            int,
+            tuple[list[GrentonCluStateVariableKey | GrentonCluStateAttributeKey], list[int]],
+        ] = {}
+
+        # Change-rate tiers. Every report carries all values of its chunk, so
+        # keys that change often are grouped together at the front of the
+        # subscription order; chunks of cold keys then rarely report at all.
+        self._change_rates: dict[GrentonCluStateVariableKey | GrentonCluStateAttributeKey, float] = {}
+        self._hot_keys: set[GrentonCluStateVariableKey | GrentonCluStateAttributeKey] = set()
+        self._tiered_order: list[GrentonCluStateVariableKey | GrentonCluStateAttributeKey] | None = None
+
+        # Declared value types; None marks keys registered with conflicting types
+        self._value_types: dict[GrentonCluStateVariableKey | GrentonCluStateAttributeKey, GrentonValueType | None] = {}
+
+    @property
+    def variables(self) -> Mapping[GrentonCluStateVariableKey, GrentonCluStateVariable]:
+        """Read-only live view of all variables and their current values."""
+        return self._variables
+
+    @property
+    def attributes(self) -> Mapping[GrentonCluStateAttributeKey, GrentonCluStateAttribute]:
+        """Read-only live view of all attributes and their current values."""
+        return self._attributes
+
+    def add_variable(
+        self,
+        name: str,
+        initial_value: GrentonValue | None = None,
+        value_type: GrentonValueType | None = None,
+    ) -> None:
         """Add a variable to the state if it doesn't exist."""
         key = GrentonCluStateVariableKey(name)
-        if key not in self.variables:
-            self.variables[key] = GrentonCluStateVariable(name, initial_value)
-            self._subscription_order.append(key)
+        self._add_key(key, initial_value)
+        self._add_value_type(key, value_type)
     
-    def add_attribute(self, object_name: str, name: str, initial_value: GrentonValue | None = None) -> None:
+    def add_attribute(
+        self,
+        object_name: str,
+        name: str,
+        initial_value: GrentonValue | None = None,
+        value_type: GrentonValueType | None = None,
+    ) -> None:
         """Add an attribute to the state if it doesn't exist."""
         key = GrentonCluStateAttributeKey(object_name, name)
-        if key not in self.attributes:
-            self.attributes[key] = GrentonCluStateAttribute(object_name, name, initial_value)
-            self._subscription_order.append(key)
+        self._add_key(key, initial_value)
+        self._add_value_type(key, value_type)
+
+    def _add_key(
+        self,
+        key: GrentonCluStateVariableKey | GrentonCluStateAttributeKey,
+        initial_value: GrentonValue | None,
+    ) -> None:
+        if key in self._slots:
+            return
+        self._slots[key] = len(self._keys)
+        self._keys.append(key)
+        self._values.append(initial_value if initial_value is not None else "")
+        self._change_counts.append(0)
+        self._restored.append(False)
+        self._tiered_order = None
+        # Lists cached before may contain this key at an unresolved position
+        self._slot_vectors.clear()
+
+    def _add_value_type(
+        self,
+        key: GrentonCluStateVariableKey | GrentonCluStateAttributeKey,
+        value_type: GrentonValueType | None,
+    ) -> None:
+        if value_type is None:
+            return
+        if key not in self._value_types:
+            self._value_types[key] = value_type
+        elif self._value_types[key] != value_type:
+            self._value_types[key] = None
+
+    def get_handle(self, key: GrentonCluStateVariableKey | GrentonCluStateAttributeKey) -> GrentonStateHandle:
+        """Handle for reading a registered key's value."""
+        slot = self._slots.get(key)
+        if slot is None:
+            return _UNTRACKED_STATE_HANDLE
+        return GrentonStateHandle(self._values, self._restored, slot)
+
+    def get_value_decoder(self, key: GrentonCluStateVariableKey | GrentonCluStateAttributeKey) -> GrentonValueDecoder:
+        """Decoder for report values of a key, chosen from its declared type."""
+        return decoder_for_value_type(self._value_types.get(key))
+
+    def get_value_type(self, key: GrentonCluStateVariableKey | GrentonCluStateAttributeKey) -> GrentonValueType | None:
+        """Declared value type of a key, None if unknown or conflicting."""
+        return self._value_types.get(key)
+
+    def get_keys(self) -> list[GrentonCluStateVariableKey | GrentonCluStateAttributeKey]:
+        """All registered keys in slot order."""
+        return list(self._keys)
+
+    def get_slot(self, key: GrentonCluStateVariableKey | GrentonCluStateAttributeKey) -> int:
+        """Slot of a registered key, -1 if it is unknown."""
+        return self._slots.get(key, -1)
+
+    def get_slot_value(self, slot: int) -> GrentonValue:
+        """Value stored in a slot."""
+        return self._values[slot]
     
     def get_variable(self, key: GrentonCluStateVariableKey) -> GrentonValue | None:
         """Get a variable value by key."""
-        var = self.variables.get(key)
-        return var.value if var else None
+        slot = self._slots.get(key)
+        return self._values[slot] if slot is not None else None
     
     def get_attribute(self, key: GrentonCluStateAttributeKey) -> GrentonValue | None:
         """Get an attribute value by key."""
-        attr = self.attributes.get(key)
-        return attr.value if attr else None
+        slot = self._slots.get(key)
+        return self._values[slot] if slot is not None else None
     
     def set_variable(self, key: GrentonCluStateVariableKey, value: GrentonValue) -> None:
         """Set a variable value by key."""
-        if key in self.variables:
-            self.variables[key].value = self._cast_value(value)
+        slot = self._slots.get(key)
+        if slot is not None:
+            self._values[slot] = self._cast_value(value)
     
     def set_attribute(self, key: GrentonCluStateAttributeKey, value: GrentonValue) -> None:
         """Set an attribute value by key."""
-        if key in self.attributes:
-            self.attributes[key].value = self._cast_value(value)
+        slot = self._slots.get(key)
+        if slot is not None:
+            self._values[slot] = self._cast_value(value)
     
     def _cast_value(self, value: Any) -> GrentonValue:
         """Cast raw string values to appropriate Python types."""
@@ -141,34 +403,153 @@ class GrentonCluState:
     
     def has_states_to_register(self) -> bool:
         """Check if there are any states to register."""
-        return bool(self._subscription_order)
+        return bool(self._keys)
     
     def get_subscription_order(self) -> list[GrentonCluStateVariableKey | GrentonCluStateAttributeKey]:
-        """Get the order for subscription registration."""
-        return self._subscription_order
+        """Get the order for subscription registration: hot keys first, then cold.
+
+        Within a tier keys keep their registration order, so the order (and
+        therefore chunk membership) only changes when a key changes tier.
+        """
+        if self._tiered_order is None:
+            self._tiered_order = [
+                key for key in self._keys if key in self._hot_keys
+            ] + [
+                key for key in self._keys if key not in self._hot_keys
+            ]
+        return self._tiered_order
+
+    def get_hot_keys(self) -> set[GrentonCluStateVariableKey | GrentonCluStateAttributeKey]:
+        """Get the keys currently in the hot tier."""
+        return set(self._hot_keys)
+
+    def set_hot_keys(self, keys: set[GrentonCluStateVariableKey | GrentonCluStateAttributeKey]) -> None:
+        """Restore a previously learned hot tier (e.g. after a restart)."""
+        self._hot_keys = set(keys)
+        self._tiered_order = None
+
+    def update_key_tiers(self, elapsed: float) -> bool:
+        """Fold change counts from the last ``elapsed`` seconds into the tiers.
+
+        Rates are smoothed across calls. Returns True if any key changed tier,
+        i.e. the subscription order (and its chunks) changed.
+        """
+        if elapsed <= 0:
+            return False
+
+        hot_keys: set[GrentonCluStateVariableKey | GrentonCluStateAttributeKey] = set()
+        for key, count in zip(self._keys, self._change_counts):
+            rate = count * 60.0 / elapsed
+            rate = (self._change_rates.get(key, rate) + rate) / 2
+            self._change_rates[key] = rate
+            if rate >= HOT_KEY_CHANGES_PER_MINUTE or (
+                key in self._hot_keys and rate >= COLD_KEY_CHANGES_PER_MINUTE
+            ):
+                hot_keys.add(key)
+        self._change_counts = [0] * len(self._keys)
+
+        if hot_keys == self._hot_keys:
+            return False
+        self.set_hot_keys(hot_keys)
+        return True
     
-    def update_state(self, values: list[GrentonValue]) -> None:
+    def update_state(self, values: list[GrentonValue]) -> set[GrentonCluStateVariableKey | GrentonCluStateAttributeKey]:
         """Update state with report values in subscription order."""
-        self.update_keys(self.get_subscription_order(), values)
+        return self.update_keys(self.get_subscription_order(), values)
+
+    def get_slots(
+        self,
+        keys: list[GrentonCluStateVariableKey | GrentonCluStateAttributeKey],
+    ) -> list[int]:
+        """Slots of ``keys`` (-1 for unknown keys), cached per list object."""
+        cached = self._slot_vectors.get(id(keys))
+        if cached is not None and cached[0] is keys:
+            return cached[1]
+
+        slots = [self._slots.get(key, -1) for key in keys]
+        # Live chunk lists never outnumber the keys; anything beyond that is
+        # left over from an earlier chunk layout
+        if len(self._slot_vectors) > len(self._keys) + 1:
+            self._slot_vectors.clear()
+        self._slot_vectors[id(keys)] = (keys, slots)
+        return slots
 
     def update_keys(
         self,
         keys: list[GrentonCluStateVariableKey | GrentonCluStateAttributeKey],
         values: list[GrentonValue],
-    ) -> None:
+    ) -> set[GrentonCluStateVariableKey | GrentonCluStateAttributeKey]:
         """Update state for the given keys with the matching values.
 
         Positions where value is None are skipped — a None marks a failed chunk
-        in register_component_states, not an actual nil value from the CLU.
+        in register_component_states or a report position whose value did
+        not change, not an actual nil value from the CLU.
+
+        Returns the keys whose stored value actually changed, or whose
+        restored value was just confirmed, so callers only have to notify
+        entities bound to those keys.
+
+        ``keys`` must not be mutated after the first call with it: its slots
+        are cached by list identity.
+        """
+        return self.update_slots(self.get_slots(keys), values)
+
+    def update_slots(
+        self,
+        slots: list[int],
+        values: list[GrentonValue],
+    ) -> set[GrentonCluStateVariableKey | GrentonCluStateAttributeKey]:
+        """update_keys for callers that already know the slots."""
+        stored = self._values
+        counts = self._change_counts
+        restored = self._restored
+        dirty = self._dirty
+        changed: set[GrentonCluStateVariableKey | GrentonCluStateAttributeKey] = set()
+        for slot, value in zip(slots, values):
+            if value is None or slot < 0:
+                continue
+            current = stored[slot]
+            # Compare types too — True == 1 in Python, but the entity still
+            # renders them differently.
+            if current != value or type(current) is not type(value):
+                stored[slot] = value
+                counts[slot] += 1
+                dirty.add(slot)
+                restored[slot] = False
+                changed.add(self._keys[slot])
+            elif restored[slot]:
+                # Live value confirms the restored one; listeners re-render it
+                restored[slot] = False
+                changed.add(self._keys[slot])
+        return changed
+
+    def restore_values(
+        self,
+        values: dict[GrentonCluStateVariableKey | GrentonCluStateAttributeKey, GrentonValue],
+    ) -> int:
+        """Seed registered keys with values from a snapshot, marked as restored.
+
+        Unknown keys are ignored. Returns the number of restored keys.
         """
-        for key, value in zip(keys, values):
-            if value is None:
+        restored = 0
+        for key, value in values.items():
+            slot = self._slots.get(key)
+            if slot is None or value is None:
                 continue
-            if isinstance(key, GrentonCluStateVariableKey):
-                if key in self.variables:
-                    self.variables[key].value = value
-            elif key in self.attributes:
-                self.attributes[key].value = value
+            self._values[slot] = value
+            self._restored[slot] = True
+            restored += 1
+        return restored
+
+    def is_restored(self, key: GrentonCluStateVariableKey | GrentonCluStateAttributeKey) -> bool:
+        """Whether a key still holds a restored value no live value confirmed."""
+        slot = self._slots.get(key)
+        return slot is not None and self._restored[slot]
+
+    def pop_dirty(self) -> list[tuple[GrentonCluStateVariableKey | GrentonCluStateAttributeKey, GrentonValue]]:
+        """Keys changed since the previous call, with their current values."""
+        dirty, self._dirty = self._dirty, set()
+        return [(self._keys[slot], self._values[slot]) for slot in dirty]
 
 
 @dataclass
@@ -178,18 +559,30 @@ class GrentonState:
     def __init__(self, clus: dict[str, GrentonCluState] | None = None):
         self.clus = clus if clus is not None else {}
     
-    def register_state(self, state: GrentonStateObject) -> None:
-        """Register a state for tracking."""
+    def register_state(self, state: GrentonStateObject) -> GrentonStateHandle:
+        """Register a state for tracking and return a handle for reading it."""
         # Get or create CLU state
         clu_state = self.clus.get(state.clu_id)
         if not clu_state:
-            return None
+            return _UNTRACKED_STATE_HANDLE
 
         if isinstance(state, GrentonVariableValueObject):
-            clu_state.add_variable(state.index)
+            clu_state.add_variable(state.index, value_type=state.value_type)
+            return clu_state.get_handle(GrentonCluStateVariableKey(state.index))
         elif isinstance(state, GrentonAttributeValueObject):
-            clu_state.add_attribute(state.object_name, state.index)
+            clu_state.add_attribute(state.object_name, state.index, value_type=state.value_type)
+            return clu_state.get_handle(GrentonCluStateAttributeKey(state.object_name, state.index))
+        return _UNTRACKED_STATE_HANDLE
     
+    @staticmethod
+    def get_key_for_component(state: GrentonStateObject) -> GrentonCluStateVariableKey | GrentonCluStateAttributeKey | None:
+        """Get the CLU state key a component is stored under."""
+        if isinstance(state, GrentonVariableValueObject):
+            return GrentonCluStateVariableKey(state.index)
+        elif isinstance(state, GrentonAttributeValueObject):
+            return GrentonCluStateAttributeKey(state.object_name, state.index)
+        return None
+
     def get_value_for_component(self, state: GrentonStateObject) -> GrentonValue | None:
         """Get the value for a component from the appropriate CLU state."""
         clu_state = self.clus.get(state.clu_id)
@@ -0,0 +1,176 @@
+"""Home Assistant loop lag under a report storm, with and without the I/O thread.
+
+A fake CLU runs on its own thread and event loop, so sending the storm
+costs the Home Assistant loop nothing. The coordinator subscribes 1,000
+keys from it, once with the sockets on the Home Assistant loop and once
+with them on the I/O thread. While every subscription socket receives
+reports, a 5 ms sleeper on the Home Assistant loop measures its lag. Both
+threads share the GIL, so the I/O thread moves work off the loop but does
+not make it free.
+"""
+import asyncio
+import base64
+import re
+import statistics
+import tempfile
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Coroutine
+
+import pytest
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import frame
+
+from custom_components.homeassistant_grenton.const import CONF_IO_THREAD, CONF_SETTINGS
+from custom_components.homeassistant_grenton.coordinator import GrentonCoordinator
+from custom_components.homeassistant_grenton.domain.cipher import GrentonCipher
+from custom_components.homeassistant_grenton.domain.clu import GrentonClu
+from custom_components.homeassistant_grenton.domain.encryption import GrentonEncryption
+from custom_components.homeassistant_grenton.domain.state_object import GrentonAttributeValueObject
+
+pytestmark = pytest.mark.benchmark
+
+ENCRYPTION = GrentonEncryption(
+    key=base64.b64encode(bytes(range(16))).decode(),
+    iv=base64.b64encode(bytes(range(16, 32))).decode(),
+)
+KEY_COUNT = 1000
+ROUNDS = 1000
+
+_REGISTER = re.compile(r"SYSTEM:clientRegister\(0,(\d+),1,\{(.*)\}\)$")
+_REGISTER_KEY = re.compile(r'"[^"]*"|\{[^}]*\}')
+
+
+class _FakeClu(asyncio.DatagramProtocol):
+    """Answers pings and clientRegister, and sends reports to every subscriber."""
+
+    def __init__(self) -> None:
+        self.cipher = GrentonCipher(ENCRYPTION)
+        self.transport: asyncio.DatagramTransport | None = None
+        # session id -> (client address, key count)
+        self.clients: dict[int, tuple[Any, int]] = {}
+
+    def connection_made(self, transport: asyncio.BaseTransport) -> None:
+        self.transport = transport  # type: ignore[assignment]
+
+    def datagram_received(self, data: bytes, addr: Any) -> None:
+        decrypted = self.cipher.decrypt(data)
+        assert decrypted is not None and self.transport is not None
+        _, _, msg_id, payload = decrypted.decode().split(":", 3)
+        match = _REGISTER.match(payload)
+        if match:
+            session_id = int(match.group(1))
+            key_count = len(_REGISTER_KEY.findall(match.group(2)))
+            self.clients[session_id] = (addr, key_count)
+            response = f"resp:127.0.0.1:{msg_id}:clientReport:{session_id}:{{{','.join(['0'] * key_count)}}}"
+        else:
+            response = f"resp:127.0.0.1:{msg_id}:ok"
+        self.transport.sendto(self.cipher.encrypt(response.encode()), addr)  # type: ignore[arg-type]
+
+    def report(self, value: int) -> None:
+        assert self.transport is not None
+        for session_id, (addr, key_count) in self.clients.items():
+            report = f"resp:127.0.0.1:00000000:clientReport:{session_id}:{{{','.join([str(value)] * key_count)}}}"
+            self.transport.sendto(self.cipher.encrypt(report.encode()), addr)  # type: ignore[arg-type]
+
+    async def storm(self, rounds: int) -> None:
+        for value in range(1, rounds + 1):
+            self.report(value)
+            await asyncio.sleep(0.0005)
+        # Socket buffers may have dropped some of the storm; the final
+        # values must arrive for the run to end
+        await asyncio.sleep(0.1)
+        self.report(rounds)
+
+
+class _FakeCluThread:
+    def __init__(self) -> None:
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(target=self.loop.run_forever, daemon=True)
+        self.thread.start()
+        self.clu: _FakeClu
+        self.port = self.run(self._open()).result()
+
+    def run(self, coro: Coroutine[Any, Any, Any]) -> Future[Any]:
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    async def _open(self) -> int:
+        transport, self.clu = await self.loop.create_datagram_endpoint(_FakeClu, local_addr=("127.0.0.1", 0))
+        return transport.get_extra_info("sockname")[1]
+
+    def stop(self) -> None:
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join()
+        self.loop.close()
+
+
+class _ConfigEntry:
+    entry_id = "benchmark"
+
+    def __init__(self, io_thread: bool):
+        self.options = {CONF_SETTINGS: {CONF_IO_THREAD: io_thread}}
+
+    def async_create_background_task(self, hass: HomeAssistant, coro: Coroutine[Any, Any, Any], name: str) -> Any:
+        return hass.async_create_background_task(coro, name)
+
+
+async def _run(io_thread: bool) -> dict[str, float]:
+    fake = _FakeCluThread()
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        frame.async_setup(hass)
+        clu = GrentonClu(id="CLU1", serial_number="1", name="CLU1", ip="127.0.0.1", port=fake.port)
+        coordinator = GrentonCoordinator(hass, _ConfigEntry(io_thread), [clu], ENCRYPTION)  # type: ignore[arg-type]
+        states = [GrentonAttributeValueObject("CLU1", f"DOU{index}", "0") for index in range(KEY_COUNT)]
+        handles = [coordinator.register_component_state(state) for state in states]
+        notified = 0
+
+        def listener() -> None:
+            nonlocal notified
+            notified += 1
+
+        for state in states:
+            # One callback per key, as every entity registers its own
+            coordinator.async_add_state_listener(state, lambda: listener())
+
+        await coordinator.async_setup()
+        try:
+            while not coordinator.is_clu_ready("CLU1"):
+                await asyncio.sleep(0.01)
+
+            loop = asyncio.get_running_loop()
+            lags: list[float] = []
+            storm = fake.run(fake.clu.storm(ROUNDS))
+            started = time.perf_counter()
+            while not storm.done() or any(handle.value != ROUNDS for handle in handles):
+                expected = loop.time() + 0.005
+                await asyncio.sleep(0.005)
+                lags.append((loop.time() - expected) * 1000)
+                if time.perf_counter() - started > 30:
+                    raise TimeoutError("storm was not applied")
+            elapsed = time.perf_counter() - started
+            chunks = len(fake.clu.clients)
+        finally:
+            await coordinator.async_shutdown()
+            await hass.async_stop(force=True)
+            fake.stop()
+
+    return {
+        "reports": ROUNDS * chunks,
+        "seconds to apply": elapsed,
+        "entity updates": notified,
+        "lag p50 ms": statistics.median(lags),
+        "lag p99 ms": statistics.quantiles(lags, n=100)[98],
+        "lag max ms": max(lags),
+    }
+
+
+def test_io_thread_benchmark() -> None:
+    print(f"\n{KEY_COUNT} keys, {ROUNDS} reports per chunk")
+    for name, io_thread in (("HA loop", False), ("I/O thread", True)):
+        result = asyncio.run(_run(io_thread))
+        print(f"  {name:<11}" + ", ".join(
+            f"{key} {value:.0f}" if isinstance(value, int) else f"{key} {value:.2f}"
+            for key, value in result.items()
+        ))
@@ -0,0 +1,13 @@
+"""Bytes kept per entity, against the baseline's unslotted, uninterned objects."""
+import pytest
+
+from ..test_memory import ENTITY_COUNT, _build_baseline_entity, _build_entity, _bytes_per_entity
+
+pytestmark = pytest.mark.benchmark
+
+
+def test_memory_benchmark() -> None:
+    baseline = _bytes_per_entity(_build_baseline_entity)
+    current = _bytes_per_entity(_build_entity)
+    print(f"\n{ENTITY_COUNT} entities: baseline {baseline:.0f} bytes each, "
+          f"now {current:.0f} bytes each ({current / baseline:.2f} of the baseline)")
@@ -0,0 +1,54 @@
+"""Validating the pages of a 5,000-widget interface, before and after batching.
+
+Before, every page built its own TypeAdapter for the widget union and
+validated its widgets one by one, so each unsupported widget cost a
+ValidationError. Now the adapters are built once, unsupported widget types
+are dropped by their discriminator, and the rest of a page is validated in
+one call.
+"""
+from typing import Any, List
+
+import pytest
+from pydantic import BaseModel, TypeAdapter, ValidationError, field_validator
+
+from custom_components.homeassistant_grenton.dto.mobile_interface import GrentonMobileInterfaceDto
+from custom_components.homeassistant_grenton.dto.page import GrentonPageDto
+from custom_components.homeassistant_grenton.dto.widgets.union import GrentonWidgetUnionDto
+
+from ..test_page_dto import _interface
+from . import measure
+
+pytestmark = pytest.mark.benchmark
+
+
+class _PageBefore(BaseModel):
+    """Copy of GrentonPageDto before batching."""
+
+    name: str
+    icon: str
+    isFullscreenWidget: bool
+    widgets: List[GrentonWidgetUnionDto]
+
+    @field_validator("widgets", mode="before")
+    @classmethod
+    def skip_unsupported_widgets(cls, v: List[Any]) -> List[GrentonWidgetUnionDto]:
+        widget_adapter: TypeAdapter[GrentonWidgetUnionDto] = TypeAdapter(GrentonWidgetUnionDto)
+        result: List[GrentonWidgetUnionDto] = []
+        for item in v:
+            try:
+                result.append(widget_adapter.validate_python(item))
+            except ValidationError:
+                pass
+        return result
+
+
+def test_page_dto_benchmark() -> None:
+    interface = _interface(5000, unsupported_every=5)
+    pages = interface["pages"]
+    assert [len(_PageBefore.model_validate(page).widgets) for page in pages] == \
+        [len(GrentonPageDto.model_validate(page).widgets) for page in pages]
+
+    print(f"\n5,000 widgets on 20 pages, a fifth unsupported: "
+          f"pages before {measure(lambda: [_PageBefore.model_validate(page) for page in pages], 5) / 1000:.1f} ms, "
+          f"pages after {measure(lambda: [GrentonPageDto.model_validate(page) for page in pages], 5) / 1000:.1f} ms, "
+          f"whole interface after {measure(lambda: GrentonMobileInterfaceDto.model_validate(interface), 5) / 1000:.1f} ms")
@@ -0,0 +1,51 @@
+"""Routing a decrypted clientReport, before and after the single-split parser.
+
+Before, a report was split by is_valid_response, again by the protocol to
+read its msg_id, again by is_client_report, and twice more while building
+the notification (header, then session id and values). Now one
+``split(":", 5)`` yields all of those fields, and the protocol routes a
+report from the split parts without building a message object.
+"""
+import pytest
+
+from custom_components.homeassistant_grenton.domain.api.clu_messages import GrentonCluApiMessageParser
+
+from . import measure
+
+pytestmark = pytest.mark.benchmark
+
+
+def _route_before(wire_message: str) -> str | None:
+    # is_valid_response
+    if not wire_message.startswith("resp:") or len(wire_message.split(":", 3)) != 4:
+        return None
+    # msg_id lookup in _process_response
+    message_id = wire_message.split(":", 3)[2].lower()
+    # is_client_report
+    parts = wire_message.split(":", 3)
+    if not (message_id == "00000000" and parts[3].startswith("clientReport:")):
+        return None
+    # GrentonCluApiClientReportNotification and _parse_client_report
+    _, _, _, payload = wire_message.split(":", 3)
+    _, session, values = payload.split(":", 2)
+    int(session)
+    return values[1:-1]
+
+
+def _route_after(wire_message: str) -> str | None:
+    # As GrentonCluApiProtocol._process_response routes a report
+    parts = GrentonCluApiMessageParser.split(wire_message)
+    if parts is None or not GrentonCluApiMessageParser.is_report(parts, parts[2].lower()):
+        return None
+    return GrentonCluApiMessageParser.report_values(parts)
+
+
+@pytest.mark.parametrize("value_count", [30, 200])
+def test_parse_benchmark(value_count: int) -> None:
+    wire_message = f'resp:192.168.0.10:00000000:clientReport:123:{{{",".join(["1000"] * value_count)}}}'
+    assert _route_before(wire_message) == _route_after(wire_message)
+
+    print(f"\n{value_count}-value report: "
+          f"parse into a message object {measure(lambda: GrentonCluApiMessageParser.parse(wire_message), 100000):.2f} us, "
+          f"routed before {measure(lambda: _route_before(wire_message), 100000):.2f} us, "
+          f"routed after {measure(lambda: _route_after(wire_message), 100000):.2f} us")
@@ -0,0 +1,159 @@
+"""Report datagrams on a subscription socket, before and after synchronous handling.
+
+Before, datagram_received spawned a task per datagram, which took the
+socket's lock to look up pending requests and then awaited the report
+callback. Now the datagram is handled in place. Both designs decrypt and
+decode with the current code, so they differ only in the task and the
+lock. The benchmark delivers a report storm, 100 datagrams per loop
+iteration, and measures datagrams and tasks per second plus the lag of a
+1 ms sleeper sharing the loop.
+"""
+import asyncio
+import statistics
+import time
+from typing import Any, Optional
+
+import pytest
+
+from custom_components.homeassistant_grenton.domain.api.clu import GrentonCluApi, GrentonCluApiProtocol
+from custom_components.homeassistant_grenton.domain.api.clu_messages import GrentonCluApiMessageParser
+from custom_components.homeassistant_grenton.domain.api.clu_messages.report_values import GrentonReportValueDecoder
+from custom_components.homeassistant_grenton.domain.clu import GrentonClu
+from custom_components.homeassistant_grenton.state import decoder_for_value_type
+
+from ..test_cipher import ENCRYPTION, _report
+
+pytestmark = pytest.mark.benchmark
+
+_VALUE_COUNT = 30
+_DATAGRAMS = 20000
+_PER_ITERATION = 100
+
+
+class _BeforeProtocol(GrentonCluApiProtocol):
+    """Copy of the task-per-datagram handling with the pending-request lock."""
+
+    def __init__(self, api: GrentonCluApi):
+        super().__init__(api)
+        self._pending_lock = asyncio.Lock()
+        self.async_callback: Optional[Any] = None
+
+    def _process_response(self, parts: list[str], wire_message: str) -> None:
+        message_id = parts[2].lower()
+
+        async def _complete() -> None:
+            async with self._pending_lock:
+                pending = self._pending.pop(message_id, None)
+            if pending is not None:
+                return
+            if not GrentonCluApiMessageParser.is_report(parts, message_id):
+                return
+            self._note_report()
+            values = GrentonCluApiMessageParser.report_values(parts)
+            if values is None or self.async_callback is None:
+                return
+            await self.async_callback(self.report_decoder.decode_changes(values))
+
+        asyncio.create_task(_complete())
+
+
+async def _run(protocol_class: type[GrentonCluApiProtocol], datagrams: list[bytes]) -> dict[str, float]:
+    api = GrentonCluApi(GrentonClu("CLU1", "0", "CLU1", "192.168.0.10", 1234), ENCRYPTION)
+    protocol = protocol_class(api)
+    protocol.report_decoder = GrentonReportValueDecoder([decoder_for_value_type(None)] * _VALUE_COUNT)
+
+    applied = 0
+
+    def on_report(values: list[Any]) -> None:
+        nonlocal applied
+        applied += 1
+
+    async def on_report_async(values: list[Any]) -> None:
+        on_report(values)
+
+    if isinstance(protocol, _BeforeProtocol):
+        protocol.async_callback = on_report_async
+    else:
+        protocol.subscription_callback = on_report
+
+    loop = asyncio.get_running_loop()
+    tasks = 0
+    default_factory = loop.get_task_factory()
+
+    def counting_factory(loop: asyncio.AbstractEventLoop, coro: Any, **kwargs: Any) -> asyncio.Task[Any]:
+        nonlocal tasks
+        tasks += 1
+        if default_factory is not None:
+            return default_factory(loop, coro, **kwargs)  # type: ignore[return-value]
+        return asyncio.Task(coro, loop=loop, **kwargs)
+
+    loop.set_task_factory(counting_factory)
+
+    delivered = asyncio.Event()
+    addr = ("192.168.0.10", 1234)
+
+    def deliver(start: int) -> None:
+        # Like a readable socket with a backlog: a burst of datagrams per
+        # loop iteration, then back to the other callbacks
+        for data in datagrams[start:start + _PER_ITERATION]:
+            protocol.datagram_received(data, addr)
+        if start + _PER_ITERATION < len(datagrams):
+            loop.call_soon(deliver, start + _PER_ITERATION)
+        else:
+            delivered.set()
+
+    lags: list[float] = []
+
+    async def sleeper() -> None:
+        while not delivered.is_set():
+            expected = loop.time() + 0.001
+            await asyncio.sleep(0.001)
+            lags.append((loop.time() - expected) * 1000)
+
+    started = time.perf_counter()
+    loop.call_soon(deliver, 0)
+    await asyncio.gather(sleeper(), delivered.wait())
+    # Tasks spawned for the last datagrams still have to run
+    while applied < len(datagrams):
+        await asyncio.sleep(0)
+    elapsed = time.perf_counter() - started
+    loop.set_task_factory(default_factory)
+
+    # The sleeper and gather's wrappers are tasks too
+    tasks -= 2
+    return {
+        "datagrams/s": len(datagrams) / elapsed,
+        "tasks/s": tasks / elapsed,
+        "lag p50 ms": statistics.median(lags) if lags else 0.0,
+        "lag max ms": max(lags) if lags else 0.0,
+    }
+
+
+async def _idle_lag() -> float:
+    loop = asyncio.get_running_loop()
+    lags = []
+    for _ in range(200):
+        expected = loop.time() + 0.001
+        await asyncio.sleep(0.001)
+        lags.append((loop.time() - expected) * 1000)
+    return statistics.median(lags)
+
+
+def test_report_pipeline_benchmark() -> None:
+    cipher = GrentonCluApi(GrentonClu("CLU1", "0", "CLU1", "192.168.0.10", 1234), ENCRYPTION).cipher
+    values = list(range(_VALUE_COUNT))
+    datagrams = []
+    for step in range(_DATAGRAMS):
+        values[step % _VALUE_COUNT] += 1
+        encrypted = cipher.encrypt(_report(values))
+        assert encrypted is not None
+        datagrams.append(encrypted)
+
+    print(f"\n{_DATAGRAMS} {_VALUE_COUNT}-value reports, {_PER_ITERATION} per loop iteration, "
+          f"idle lag p50 {asyncio.run(_idle_lag()):.2f} ms")
+    for name, design in (("before", _BeforeProtocol), ("after", GrentonCluApiProtocol)):
+        result = asyncio.run(_run(design, datagrams))
+        print(f"  {name:<7}" + ", ".join(
+            f"{key} {value:.0f}" if key.endswith("/s") else f"{key} {value:.2f}"
+            for key, value in result.items()
+        ))
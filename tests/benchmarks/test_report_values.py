@@ -0,0 +1,56 @@
+"""Decoding clientReport value lists of 30 and 200 values.
+
+Before, the list was split on commas and every token went through strip()
+and the guessing cast. Now a report is tokenized once and only positions
+whose token changed since the previous report are decoded.
+"""
+import pytest
+
+from custom_components.homeassistant_grenton.domain.api.clu_messages.report_values import (
+    GrentonReportValueDecoder,
+    parse_report_values,
+)
+from custom_components.homeassistant_grenton.state import cast_string_to_grenton_value, decoder_for_value_type
+
+from . import measure
+
+pytestmark = pytest.mark.benchmark
+
+
+def _parse_before(content: str) -> list:
+    content = content.strip()
+    if not content:
+        return []
+    return [cast_string_to_grenton_value(value.strip().strip('"')) for value in content.split(",")]
+
+
+def _content(value_count: int, step: int) -> str:
+    # Mixed integers, floats and strings; one value changes per step
+    values = [str(index) if index % 3 else f"{index}.5" for index in range(value_count)]
+    values[1::10] = ['"on"'] * len(values[1::10])
+    values[-1] = str(step)
+    return ",".join(values)
+
+
+@pytest.mark.parametrize("value_count", [30, 200])
+def test_report_values_benchmark(value_count: int) -> None:
+    reports = [_content(value_count, step) for step in range(100)]
+    decoder = GrentonReportValueDecoder([decoder_for_value_type(None)] * value_count)
+    assert parse_report_values(reports[0]) == _parse_before(reports[0])
+
+    def before() -> None:
+        for content in reports:
+            _parse_before(content)
+
+    def full() -> None:
+        for content in reports:
+            parse_report_values(content)
+
+    def changes() -> None:
+        for content in reports:
+            decoder.decode_changes(content)
+
+    count = len(reports)
+    print(f"\n{value_count}-value report: before {measure(before, 20) / count:.1f} us, "
+          f"full decode {measure(full, 20) / count:.1f} us, "
+          f"changed positions only {measure(changes, 20) / count:.1f} us")
@@ -0,0 +1,202 @@
+"""Request round trips on one socket, before and after the shared deadline timer.
+
+Before, every request drew a random msg_id and waited in asyncio.wait with a
+timeout, so each transmission scheduled (and on a response cancelled) its
+own loop timer. Now msg_ids come from a counter and one timer per socket
+walks a heap of deadlines. Answered requests leave stale heap entries
+behind; the benchmark counts how often the timer wakes up for nothing but
+those, with and without clearing the heap when the socket goes idle.
+"""
+import asyncio
+import secrets
+import time
+from typing import Any, Optional
+
+import pytest
+
+from custom_components.homeassistant_grenton.domain.api.clu import GrentonCluApi, GrentonCluApiProtocol, MAX_RETRANSMISSIONS
+from custom_components.homeassistant_grenton.domain.api.clu_messages import GrentonCluApiPingRequest
+from custom_components.homeassistant_grenton.domain.clu import GrentonClu
+
+from ..test_cipher import ENCRYPTION
+
+pytestmark = pytest.mark.benchmark
+
+
+class _Transport:
+    """Answers every request after ``delay`` seconds, like a CLU on the LAN."""
+
+    def __init__(self, protocol: GrentonCluApiProtocol, delay: float):
+        self.protocol = protocol
+        self.delay = delay
+
+    def sendto(self, data: bytes, addr: Any) -> None:
+        cipher = self.protocol.api.cipher
+        decrypted = cipher.decrypt(data)
+        assert decrypted is not None
+        msg_id = decrypted.decode().split(":", 3)[2]
+        response = cipher.encrypt(f"resp:192.168.0.10:{msg_id}:1".encode())
+        loop = asyncio.get_running_loop()
+        if self.delay:
+            loop.call_later(self.delay, self.protocol.datagram_received, response, addr)
+        else:
+            loop.call_soon(self.protocol.datagram_received, response, addr)
+
+
+class _CountingProtocol(GrentonCluApiProtocol):
+    """Counts timer wakeups, and those that found only answered requests due."""
+
+    def __init__(self, api: GrentonCluApi):
+        super().__init__(api)
+        self.wakeups = 0
+        self.stale_wakeups = 0
+
+    def _on_timer(self) -> None:
+        now = asyncio.get_running_loop().time()
+        self.wakeups += 1
+        if not any(
+            (pending := self._pending.get(msg_id)) is not None and pending.next_at == when
+            for when, msg_id in self._deadlines if when <= now
+        ):
+            self.stale_wakeups += 1
+        super()._on_timer()
+
+
+class _NoClearProtocol(_CountingProtocol):
+    """The shared timer without clearing the heap when the socket goes idle."""
+
+    def _clear_deadlines(self) -> None:
+        pass
+
+
+class _BeforeProtocol(_CountingProtocol):
+    """Copy of the per-request asyncio.wait design the shared timer replaced."""
+
+    def __init__(self, api: GrentonCluApi):
+        super().__init__(api)
+        self._futures: dict[str, asyncio.Future[str]] = {}
+
+    def _process_response(self, parts: list[str], wire_message: str) -> None:
+        future = self._futures.pop(parts[2].lower(), None)
+        if future is not None and not future.done():
+            future.set_result(wire_message)
+
+    async def send_request(self, request: Any) -> Optional[str]:  # type: ignore[override]
+        assert self.transport is not None
+        request.msg_id = msg_id = secrets.token_hex(4)
+        encrypted = self.api.cipher.encrypt(request.raw.encode())
+        assert encrypted is not None
+
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[str] = loop.create_future()
+        self._futures[msg_id] = future
+
+        rtt = self.api.rtt
+        sent_at = loop.time()
+        deadline = sent_at + self._response_timeout
+        retransmissions = 0
+        max_retransmissions = MAX_RETRANSMISSIONS if request.idempotent else 0
+        try:
+            while True:
+                self.transport.sendto(encrypted, (self.api.clu.ip, self.api.clu.port))
+                remaining = deadline - loop.time()
+                if retransmissions < max_retransmissions:
+                    wait = min(rtt.rto * 2 ** retransmissions, remaining)
+                else:
+                    wait = remaining
+                await asyncio.wait((future,), timeout=max(wait, 0))
+                if future.done():
+                    if not retransmissions:
+                        rtt.sample(loop.time() - sent_at)
+                    return future.result()
+                if loop.time() >= deadline or retransmissions >= max_retransmissions:
+                    rtt.backoff()
+                    return None
+                retransmissions += 1
+        finally:
+            self._futures.pop(msg_id, None)
+
+
+async def _run(
+    protocol_class: type[_CountingProtocol],
+    requests: int,
+    concurrency: int,
+    delay: float,
+    pause: float,
+    rto: float,
+) -> dict[str, float]:
+    api = GrentonCluApi(GrentonClu("CLU1", "0", "CLU1", "192.168.0.10", 1234), ENCRYPTION)
+    api.rtt.min_rto = api.rtt.rto = rto
+    protocol = protocol_class(api)
+    protocol.connection_made(_Transport(protocol, delay))  # type: ignore[arg-type]
+
+    loop = asyncio.get_running_loop()
+    timers = 0
+    call_at = loop.call_at
+
+    def counting_call_at(when: float, callback: Any, *args: Any, **kwargs: Any) -> asyncio.TimerHandle:
+        nonlocal timers
+        # The fake CLU's delayed responses are not request timers
+        if getattr(callback, "__name__", "") != "datagram_received":
+            timers += 1
+        return call_at(when, callback, *args, **kwargs)
+
+    loop.call_at = counting_call_at  # type: ignore[method-assign]
+
+    async def worker() -> None:
+        for _ in range(requests // concurrency):
+            assert await protocol.send_request(GrentonCluApiPingRequest()) is not None
+            if pause:
+                await asyncio.sleep(pause)
+
+    try:
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+        # Let wakeups already scheduled for the last requests happen
+        await asyncio.sleep(rto * 2)
+    finally:
+        loop.call_at = call_at  # type: ignore[method-assign]
+
+    # Sleeps of the workers and the final one are loop timers too
+    timers -= (requests if pause else 0) + 1
+    return {
+        "requests/s": requests / elapsed,
+        "timers/request": timers / requests,
+        "wakeups/request": protocol.wakeups / requests,
+        "stale wakeups/request": protocol.stale_wakeups / requests,
+    }
+
+
+def _print(title: str, results: dict[str, dict[str, float]]) -> None:
+    print(f"\n{title}")
+    for name, result in results.items():
+        print(f"  {name:<20}" + ", ".join(
+            f"{key} {value:.0f}" if key == "requests/s" else f"{key} {value:.2f}"
+            for key, value in result.items()
+        ))
+
+
+_DESIGNS = {"before": _BeforeProtocol, "after, no clearing": _NoClearProtocol, "after": _CountingProtocol}
+
+
+@pytest.mark.parametrize("concurrency", [1, 20])
+def test_request_throughput_benchmark(concurrency: int) -> None:
+    # Responses in the next loop iteration: the cost of the request path itself
+    results = {
+        name: asyncio.run(_run(design, requests=20000, concurrency=concurrency, delay=0, pause=0, rto=0.2))
+        for name, design in _DESIGNS.items()
+    }
+    _print(f"{concurrency} request(s) in flight, instant responses", results)
+
+
+@pytest.mark.parametrize("concurrency", [1, 4])
+def test_request_timer_wakeups_benchmark(concurrency: int) -> None:
+    # Requests spaced wider than the RTO, as pings and actions are, so the
+    # deadlines of answered requests come due between them
+    results = {
+        name: asyncio.run(_run(design, requests=200, concurrency=concurrency, delay=0.0005, pause=0.01, rto=0.003))
+        for name, design in _DESIGNS.items()
+    }
+    _print(f"{concurrency} worker(s) pausing past the RTO between requests", results)
+    assert results["after"]["stale wakeups/request"] <= results["after, no clearing"]["stale wakeups/request"]
@@ -0,0 +1,135 @@
+"""A full async_write_ha_state pass over 2,000 LED entities, before and after state handles.
+
+Before, every state property went through
+coordinator.get_value_for_component, which dispatched on the state object's
+type and built a state key for the slot lookup. Now entities read the
+GrentonStateHandle they got at registration. The benchmark writes every
+entity's state into a real Home Assistant state machine, and also times
+the property reads on their own.
+"""
+import asyncio
+import tempfile
+import time
+from typing import Any
+
+import pytest
+from homeassistant.core import HomeAssistant
+
+from custom_components.homeassistant_grenton.domain.action import GrentonActionAttribute
+from custom_components.homeassistant_grenton.domain.entities.led import GrentonEntityLed
+from custom_components.homeassistant_grenton.domain.enums import GrentonActionEventType
+from custom_components.homeassistant_grenton.domain.state_object import GrentonAttributeValueObject, GrentonStateObject
+from custom_components.homeassistant_grenton.domain.utils.ranges import map_range
+from custom_components.homeassistant_grenton.state import GrentonCluState, GrentonState, GrentonStateHandle, GrentonValue
+
+pytestmark = pytest.mark.benchmark
+
+ENTITY_COUNT = 2000
+
+
+class _Coordinator:
+    """What the entities use of GrentonCoordinator, over a real GrentonState."""
+
+    last_update_success = True
+
+    def __init__(self) -> None:
+        self.state = GrentonState({"CLU1": GrentonCluState()})
+
+    def register_component_state(self, state: GrentonStateObject) -> GrentonStateHandle:
+        return self.state.register_state(state)
+
+    def get_value_for_component(self, state: GrentonStateObject) -> GrentonValue | None:
+        return self.state.get_value_for_component(state)
+
+    def is_clu_ready(self, clu_id: str) -> bool:
+        return True
+
+
+class _LedBefore(GrentonEntityLed):
+    """Copy of the LED properties before state handles."""
+
+    @property
+    def is_on(self) -> bool | None:  # type: ignore[override]
+        value = self.coordinator.get_value_for_component(self.state_object)
+        if value is None:
+            return None
+        return bool(value)
+
+    @property
+    def brightness(self) -> int | None:  # type: ignore[override]
+        value = self.coordinator.get_value_for_component(self.brightness_state_object)
+        if value is None:
+            return None
+        return int(map_range(self.brightness_range, (0, 255), float(value)))
+
+    @property
+    def hs_color(self) -> tuple[float, float] | None:  # type: ignore[override]
+        hue_value = self.coordinator.get_value_for_component(self.hue_state_object)
+        saturation_value = self.coordinator.get_value_for_component(self.saturation_state_object)
+        if hue_value is None or saturation_value is None:
+            return None
+        hue = map_range(self.hue_range, (0, 360), float(hue_value))
+        saturation = map_range(self.saturation_range, (0, 100), float(saturation_value))
+        return (hue, saturation)
+
+
+def _entities(hass: HomeAssistant, coordinator: _Coordinator, led_class: type[GrentonEntityLed]) -> list[GrentonEntityLed]:
+    action = GrentonActionAttribute("CLU1", "LED", GrentonActionEventType.CLICK, "0", "0")
+    entities = []
+    for index in range(ENTITY_COUNT):
+        object_name = f"LED{index}"
+        states = [GrentonAttributeValueObject("CLU1", object_name, str(attribute)) for attribute in range(4)]
+        entity = led_class(
+            coordinator, f"led_{index}", f"LED {index}",  # type: ignore[arg-type]
+            states[0], action, action,
+            action, states[1], (0, 360),
+            action, states[2], (0, 1),
+            action, states[3], (0, 255),
+        )
+        entity.hass = hass
+        entity.entity_id = f"light.led_{index}"
+        # Added without an entity platform; skip the warning about it
+        entity._no_platform_reported = True
+        entities.append(entity)
+
+    clu_state = coordinator.state.clus["CLU1"]
+    keys = clu_state.get_keys()
+    clu_state.update_keys(keys, [1, 120, 0.5, 200] * ENTITY_COUNT)
+    return entities
+
+
+def _best(function: Any, rounds: int = 5) -> float:
+    """Milliseconds of the fastest of ``rounds`` calls."""
+    best = float("inf")
+    for _ in range(rounds):
+        started = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - started)
+    return best * 1000
+
+
+async def _run() -> None:
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        print(f"\n{ENTITY_COUNT} LED entities, 4 states each")
+        for name, led_class in (("before", _LedBefore), ("after", GrentonEntityLed)):
+            coordinator = _Coordinator()
+            entities = _entities(hass, coordinator, led_class)
+
+            def write_all() -> None:
+                for entity in entities:
+                    entity.async_write_ha_state()
+
+            def read_all() -> None:
+                for entity in entities:
+                    entity.is_on, entity.brightness, entity.hs_color
+
+            write_all()
+            assert hass.states.get("light.led_0").attributes["brightness"] == 200  # type: ignore[union-attr]
+            print(f"  {name:<7}async_write_ha_state pass {_best(write_all):.2f} ms, "
+                  f"property reads alone {_best(read_all):.2f} ms")
+        await hass.async_stop(force=True)
+
+
+def test_state_handles_benchmark() -> None:
+    asyncio.run(_run())
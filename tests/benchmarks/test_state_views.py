@@ -0,0 +1,103 @@
+"""Reading the variables and attributes of a CLU state with 10,000 keys.
+
+The baseline kept a dict of entry objects per kind and updated the
+entries in place. The array-backed state first rebuilt those dicts on every
+property access. Now the properties return read-only views over the
+state's slots, and an entry is built only when it is looked up.
+"""
+import tracemalloc
+from typing import Any, Callable
+
+import pytest
+
+from custom_components.homeassistant_grenton.state import (
+    GrentonCluState,
+    GrentonCluStateAttribute,
+    GrentonCluStateAttributeKey,
+    GrentonCluStateVariable,
+    GrentonCluStateVariableKey,
+)
+
+from . import measure
+
+pytestmark = pytest.mark.benchmark
+
+KEY_COUNT = 10000
+
+
+class _BaselineState:
+    """Copy of the baseline's dict-of-entries storage."""
+
+    def __init__(self) -> None:
+        self.variables: dict[GrentonCluStateVariableKey, GrentonCluStateVariable] = {}
+        self.attributes: dict[GrentonCluStateAttributeKey, GrentonCluStateAttribute] = {}
+
+
+class _SnapshotState(GrentonCluState):
+    """The array-backed state with the properties that copied on every access."""
+
+    @property
+    def variables(self) -> dict[GrentonCluStateVariableKey, GrentonCluStateVariable]:  # type: ignore[override]
+        return {
+            key: GrentonCluStateVariable(key.name, self._values[slot])
+            for key, slot in self._slots.items()
+            if isinstance(key, GrentonCluStateVariableKey)
+        }
+
+    @property
+    def attributes(self) -> dict[GrentonCluStateAttributeKey, GrentonCluStateAttribute]:  # type: ignore[override]
+        return {
+            key: GrentonCluStateAttribute(key.object_name, key.name, self._values[slot])
+            for key, slot in self._slots.items()
+            if isinstance(key, GrentonCluStateAttributeKey)
+        }
+
+
+def _fill(state: Any) -> None:
+    # A tenth variables, the rest attributes
+    for index in range(KEY_COUNT):
+        if index % 10:
+            if isinstance(state, _BaselineState):
+                key = GrentonCluStateAttributeKey(f"DOU{index}", "0")
+                state.attributes[key] = GrentonCluStateAttribute(key.object_name, key.name, index)
+            else:
+                state.add_attribute(f"DOU{index}", "0", initial_value=index)
+        elif isinstance(state, _BaselineState):
+            key_variable = GrentonCluStateVariableKey(f"var{index}")
+            state.variables[key_variable] = GrentonCluStateVariable(key_variable.name, index)
+        else:
+            state.add_variable(f"var{index}", initial_value=index)
+
+
+def _allocated(function: Callable[[], object]) -> int:
+    """Peak bytes allocated while running ``function`` once."""
+    tracemalloc.start()
+    try:
+        function()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def test_state_views_benchmark() -> None:
+    key = GrentonCluStateAttributeKey("DOU5001", "0")
+    print(f"\n{KEY_COUNT} keys")
+    for name, factory in (("baseline", _BaselineState), ("snapshot", _SnapshotState), ("view", GrentonCluState)):
+        tracemalloc.start()
+        state = factory()
+        _fill(state)
+        held = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        assert state.attributes[key].value == 5001
+
+        def lookup() -> object:
+            return state.attributes[key].value
+
+        def iterate() -> object:
+            return sum(1 for _ in state.attributes.items())
+
+        print(f"  {name:<9}state {held / 1024:.0f} KiB, "
+              f"lookup {measure(lookup, 20 if name == 'snapshot' else 100000):.2f} us "
+              f"allocating {_allocated(lookup) / 1024:.1f} KiB, "
+              f"iteration {measure(iterate, 20) / 1000:.2f} ms "
+              f"allocating {_allocated(iterate) / 1024:.1f} KiB")
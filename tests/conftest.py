@@ -0,0 +1,25 @@
+"""Shared pytest configuration.
+
+Timing benchmarks live in tests/benchmarks and carry the ``benchmark``
+marker. They are skipped unless pytest runs with ``--benchmark``:
+
+    python -m pytest -q -s --benchmark tests/benchmarks
+"""
+import pytest
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    parser.addoption("--benchmark", action="store_true", default=False, help="run the timing benchmarks")
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    config.addinivalue_line("markers", "benchmark: timing measurement, skipped unless --benchmark is given")
+
+
+def pytest_collection_modifyitems(config: pytest.Config, items: list[pytest.Item]) -> None:
+    if config.getoption("--benchmark"):
+        return
+    skip = pytest.mark.skip(reason="benchmark, run with --benchmark")
+    for item in items:
+        if "benchmark" in item.keywords:
+            item.add_marker(skip)
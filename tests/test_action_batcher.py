@@ -0,0 +1,75 @@
+"""Tests for ordered action batching."""
+import asyncio
+from types import SimpleNamespace
+
+from custom_components.homeassistant_grenton.domain.action import GrentonActionAttribute, GrentonActionMethod
+from custom_components.homeassistant_grenton.domain.api.action_batcher import GrentonCluActionBatcher
+from custom_components.homeassistant_grenton.domain.api.clu_messages import GrentonCluApiActionRequest
+from custom_components.homeassistant_grenton.domain.enums import GrentonActionEventType
+
+
+def _set(object_name: str, value: str) -> GrentonActionAttribute:
+    return GrentonActionAttribute("CLU1", object_name, GrentonActionEventType.CLICK, value, "0")
+
+
+class _Protocol:
+    def __init__(self, failing: str | None = None):
+        self.failing = failing
+        self.payloads: list[str] = []
+
+    async def send_request(self, request: GrentonCluApiActionRequest) -> object | None:
+        self.payloads.append(request.payload)
+        if self.failing is not None and self.failing in request.payload:
+            return None
+        return object()
+
+
+def _batcher(protocol: _Protocol) -> GrentonCluActionBatcher:
+    return GrentonCluActionBatcher(SimpleNamespace(protocol=protocol, max_payload_bytes=1024, clu=SimpleNamespace(id="CLU1")))  # type: ignore[arg-type]
+
+
+def test_sequence_chains_calls_in_order() -> None:
+    assert GrentonCluApiActionRequest.sequence(["a()"]) == "a()"
+    assert GrentonCluApiActionRequest.sequence(["a()", "b()", "c()"]) == "(a() or 1) and (b() or 1) and (c() or 1)"
+
+
+def test_submit_sequence_sends_one_ordered_request() -> None:
+    async def run() -> None:
+        protocol = _Protocol()
+        batcher = _batcher(protocol)
+        on = GrentonActionMethod("CLU1", "LED", GrentonActionEventType.CLICK, "0", "1")
+        assert await batcher.submit_sequence([_set("LED", "h"), _set("LED", "s"), on])
+        assert protocol.payloads == [
+            '(LED:set(0,"h") or 1) and (LED:set(0,"s") or 1) and (LED:execute(1,"0") or 1)'
+        ]
+
+    asyncio.run(run())
+
+
+def test_failed_idempotent_batch_resends_per_caller() -> None:
+    async def run() -> None:
+        protocol = _Protocol(failing="BAD")
+        batcher = _batcher(protocol)
+        results = await asyncio.gather(
+            batcher.submit(_set("A", "1")),
+            batcher.submit(_set("BAD", "1")),
+            batcher.submit(_set("C", "1")),
+        )
+        assert results == [True, False, True]
+        assert len(protocol.payloads) == 4
+
+    asyncio.run(run())
+
+
+def test_failed_non_idempotent_batch_is_not_resent() -> None:
+    async def run() -> None:
+        protocol = _Protocol(failing="BAD")
+        batcher = _batcher(protocol)
+        results = await asyncio.gather(
+            batcher.submit(_set("A", "1")),
+            batcher.submit(GrentonActionMethod("CLU1", "BAD", GrentonActionEventType.CLICK, "0", "0")),
+        )
+        assert results == [False, False]
+        assert len(protocol.payloads) == 1
+
+    asyncio.run(run())
@@ -0,0 +1,61 @@
+"""Tests for the AES-CBC cipher and the duplicate-dropping datagram decryptor."""
+import base64
+
+from custom_components.homeassistant_grenton.domain.cipher import GrentonCipher, GrentonDatagramDecryptor
+from custom_components.homeassistant_grenton.domain.encryption import GrentonEncryption
+
+ENCRYPTION = GrentonEncryption(
+    key=base64.b64encode(bytes(range(16))).decode(),
+    iv=base64.b64encode(bytes(range(16, 32))).decode(),
+)
+
+
+def _report(values: list[int]) -> bytes:
+    return f'resp:192.168.0.10:00000000:clientReport:1:{{{",".join(map(str, values))}}}'.encode()
+
+
+def test_encrypt_decrypt_roundtrip() -> None:
+    cipher = GrentonCipher(ENCRYPTION)
+    for length in (0, 1, 15, 16, 17, 200):
+        data = bytes(range(256))[:length]
+        encrypted = cipher.encrypt(data)
+        assert encrypted is not None
+        assert len(encrypted) == GrentonCipher.encrypted_size(length)
+        assert cipher.decrypt(encrypted) == data
+
+
+def test_decrypt_rejects_bad_padding() -> None:
+    cipher = GrentonCipher(ENCRYPTION)
+    encrypted = cipher.encrypt(b"x" * 16)
+    assert encrypted is not None
+    # Dropping the padding block leaves a last block without valid PKCS7 padding
+    assert cipher.decrypt(encrypted[:16]) is None
+
+
+def test_decryptor_matches_full_decryption() -> None:
+    cipher = GrentonCipher(ENCRYPTION)
+    decryptor = GrentonDatagramDecryptor(cipher)
+    values = list(range(100))
+    for step in range(50):
+        values[(step * 7) % len(values)] += 1
+        if step % 10 == 9:
+            # Lengths change too, e.g. a value gaining a digit
+            values.append(step)
+        plaintext = _report(values)
+        encrypted = cipher.encrypt(plaintext)
+        assert encrypted is not None
+        assert not decryptor.is_duplicate(encrypted)
+        assert decryptor.decrypt(encrypted) == plaintext
+
+
+def test_decryptor_detects_duplicates() -> None:
+    cipher = GrentonCipher(ENCRYPTION)
+    decryptor = GrentonDatagramDecryptor(cipher)
+    encrypted = cipher.encrypt(_report([1, 2, 3]))
+    assert encrypted is not None
+    assert not decryptor.is_duplicate(encrypted)
+    decryptor.decrypt(encrypted)
+    assert decryptor.is_duplicate(encrypted)
+    assert decryptor.datagrams == 2
+    assert decryptor.duplicates == 1
+
@@ -0,0 +1,114 @@
+"""Memory budget of the objects kept per entity."""
+import gc
+import tracemalloc
+from dataclasses import dataclass
+from typing import Any, Callable
+
+from custom_components.homeassistant_grenton.domain.action import GrentonAction
+from custom_components.homeassistant_grenton.domain.enums import GrentonActionEventType
+from custom_components.homeassistant_grenton.domain.state_object import GrentonStateObject
+from custom_components.homeassistant_grenton.dto.action import GrentonActionAttributeDto
+from custom_components.homeassistant_grenton.dto.value import GrentonValueAttributeDto
+from custom_components.homeassistant_grenton.state import GrentonCluStateAttributeKey
+
+ENTITY_COUNT = 5000
+
+# State object, two actions and a state key per entity, containers included,
+# must take at most this share of what the baseline's unslotted, uninterned
+# objects take. Measured about 0.72 (around 420 against 580 bytes).
+BUDGET_OF_BASELINE = 0.85
+
+
+@dataclass
+class _BaselineStateObject:
+    clu_id: str
+    object_name: str
+    index: str
+
+
+@dataclass
+class _BaselineAction:
+    clu_id: str
+    object_name: str
+    event: GrentonActionEventType
+    value: str
+    index: str
+
+
+@dataclass(frozen=True)
+class _BaselineKey:
+    object_name: str
+    name: str
+
+
+def _dtos(index: int) -> tuple[GrentonValueAttributeDto, list[GrentonActionAttributeDto]]:
+    # Names are built per DTO, as parsing the interface JSON does
+    object_name = "".join(("DOU", str(index)))
+    state = GrentonValueAttributeDto(cluId="CLU221000001", objectName=object_name, index="0")
+    actions = [
+        GrentonActionAttributeDto(event=event, cluId="CLU221000001", objectName="".join(("DOU", str(index))),
+                                  value=value, index="0")
+        for event, value in ((GrentonActionEventType.ON, "1"), (GrentonActionEventType.OFF, "0"))
+    ]
+    return state, actions
+
+
+def test_entity_objects_are_slotted() -> None:
+    state_dto, action_dtos = _dtos(1)
+    state = GrentonStateObject.from_dto(state_dto)
+    action = GrentonAction.from_dto(action_dtos[0])
+    key = GrentonCluStateAttributeKey(object_name=state.object_name, name=state.index)
+
+    for item in (state, action, key):
+        assert not hasattr(item, "__dict__")
+
+
+def test_names_are_interned() -> None:
+    state_dto, action_dtos = _dtos(1)
+    state = GrentonStateObject.from_dto(state_dto)
+    actions = [GrentonAction.from_dto(dto) for dto in action_dtos]
+
+    assert state_dto.objectName is not action_dtos[0].objectName
+    for action in actions:
+        assert action.object_name is state.object_name
+        assert action.clu_id is state.clu_id
+
+
+def _build_entity(state_dto: GrentonValueAttributeDto, action_dtos: list[GrentonActionAttributeDto]) -> tuple[Any, ...]:
+    state = GrentonStateObject.from_dto(state_dto)
+    return (
+        state,
+        [GrentonAction.from_dto(dto) for dto in action_dtos],
+        GrentonCluStateAttributeKey(object_name=state.object_name, name=state.index),
+    )
+
+
+def _build_baseline_entity(state_dto: GrentonValueAttributeDto, action_dtos: list[GrentonActionAttributeDto]) -> tuple[Any, ...]:
+    state = _BaselineStateObject(clu_id=state_dto.cluId, object_name=state_dto.objectName, index=state_dto.index)
+    return (
+        state,
+        [_BaselineAction(clu_id=dto.cluId, object_name=dto.objectName, event=dto.event, value=dto.value, index=dto.index)
+         for dto in action_dtos],
+        _BaselineKey(object_name=state.object_name, name=state.index),
+    )
+
+
+def _bytes_per_entity(build: Callable[[GrentonValueAttributeDto, list[GrentonActionAttributeDto]], tuple[Any, ...]]) -> float:
+    """Bytes allocated per entity by ``build``, containers included."""
+    dtos = [_dtos(index) for index in range(ENTITY_COUNT)]
+    gc.collect()
+
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        entities = [build(state_dto, action_dtos) for state_dto, action_dtos in dtos]
+        used = tracemalloc.get_traced_memory()[0] - before
+    finally:
+        tracemalloc.stop()
+
+    assert len(entities) == ENTITY_COUNT
+    return used / ENTITY_COUNT
+
+
+def test_entity_memory_budget() -> None:
+    assert _bytes_per_entity(_build_entity) <= BUDGET_OF_BASELINE * _bytes_per_entity(_build_baseline_entity)
@@ -0,0 +1,88 @@
+"""Tests for the wire message parser."""
+import pytest
+
+from custom_components.homeassistant_grenton.domain.api.clu_messages import (
+    GrentonCluApiClientRegisterResponse,
+    GrentonCluApiClientReportNotification,
+    GrentonCluApiMessageParser,
+    GrentonCluApiPingResponse,
+)
+
+
+def test_parse_response() -> None:
+    message = GrentonCluApiMessageParser.parse("resp:192.168.0.10:1A2B3C4D:checkAlive()")
+    assert message is not None
+    assert message.kind == "response"
+    assert message.clu_ip == "192.168.0.10"
+    assert message.msg_id == "1a2b3c4d"
+    assert message.payload == "checkAlive()"
+    assert message.session_id is None
+    assert message.values is None
+    assert not message.is_client_report
+
+
+def test_parse_payload_with_colons() -> None:
+    message = GrentonCluApiMessageParser.parse('resp:192.168.0.10:1a2b3c4d:"a:b:c"')
+    assert message is not None
+    assert message.payload == '"a:b:c"'
+
+
+def test_parse_client_report() -> None:
+    message = GrentonCluApiMessageParser.parse('resp:192.168.0.10:00000000:clientReport:123:{1,"x:y",nil}')
+    assert message is not None
+    assert message.kind == "report"
+    assert message.is_client_report
+    assert message.session_id == 123
+    assert message.values == '1,"x:y",nil'
+
+    notification = GrentonCluApiClientReportNotification(message)
+    assert notification.session_id == 123
+    assert notification.values == [1, "x:y", None]
+
+
+def test_parse_register_response() -> None:
+    # The answer to a clientRegister request carries its own msg_id
+    message = GrentonCluApiMessageParser.parse("resp:192.168.0.10:1a2b3c4d:clientReport:7:{1,2}")
+    assert message is not None
+    assert message.kind == "response"
+    response = GrentonCluApiClientRegisterResponse(message)
+    assert response.msg_id == "1a2b3c4d"
+    assert response.session_id == 7
+    assert response.values == [1, 2]
+
+
+@pytest.mark.parametrize(
+    "wire_message",
+    [
+        "",
+        "req:192.168.0.10:1a2b3c4d:checkAlive()",
+        "resp:192.168.0.10",
+        "resp:192.168.0.10:1a2b3c4d",
+    ],
+)
+def test_parse_invalid(wire_message: str) -> None:
+    assert GrentonCluApiMessageParser.parse(wire_message) is None
+    assert not GrentonCluApiMessageParser.is_valid_response(wire_message)
+    assert not GrentonCluApiMessageParser.is_client_report(wire_message)
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [
+        "clientReport:abc:{1,2}",
+        "clientReport:5:1,2",
+        "clientReport:5",
+    ],
+)
+def test_parse_malformed_report(payload: str) -> None:
+    message = GrentonCluApiMessageParser.parse(f"resp:192.168.0.10:00000000:{payload}")
+    assert message is not None
+    assert message.is_client_report
+    assert message.values is None
+
+
+def test_response_accepts_wire_message() -> None:
+    response = GrentonCluApiPingResponse("resp:192.168.0.10:1a2b3c4d:checkAlive()")
+    assert response.msg_id == "1a2b3c4d"
+    assert response.payload == "checkAlive()"
+
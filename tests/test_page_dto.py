@@ -0,0 +1,86 @@
+"""Tests for page widget validation."""
+from typing import Any
+from unittest.mock import patch
+
+from custom_components.homeassistant_grenton.dto import page
+from custom_components.homeassistant_grenton.dto.mobile_interface import GrentonMobileInterfaceDto
+from custom_components.homeassistant_grenton.dto.page import GrentonPageDto
+
+
+def _widget(index: int) -> dict[str, Any]:
+    return {
+        "id": f"w{index}",
+        "type": "ON_OFF",
+        "components": [{
+            "label": f"Light {index}",
+            "rowId": 0,
+            "unit": "UNKNOWN",
+            "type": "BUTTON_BISTABLE",
+            "state": {"cluId": "clu1", "objectName": f"DOU{index}", "index": "0", "callType": "ATTRIBUTE"},
+            "actions": [
+                {"event": "ON", "cluId": "clu1", "objectName": f"DOU{index}", "value": "1",
+                 "callType": "METHOD", "index": "1"},
+                {"event": "OFF", "cluId": "clu1", "objectName": f"DOU{index}", "value": "0",
+                 "callType": "METHOD", "index": "2"},
+            ],
+            "onIndication": "ON_OFF",
+            "offIndication": "ON_OFF",
+        }],
+    }
+
+
+def _unsupported_widget(index: int) -> dict[str, Any]:
+    return {"id": f"w{index}", "type": "CLOCK"}
+
+
+def _page(widgets: list[dict[str, Any]]) -> dict[str, Any]:
+    return {"name": "Page", "icon": "icon", "isFullscreenWidget": False, "widgets": widgets}
+
+
+def _interface(widget_count: int, unsupported_every: int) -> dict[str, Any]:
+    widgets = [
+        _unsupported_widget(index) if index % unsupported_every == 0 else _widget(index)
+        for index in range(widget_count)
+    ]
+    return {
+        "id": "123",
+        "version": 7,
+        "name": "Interface",
+        "icon": "icon",
+        "theme": "GRENTON",
+        "encryption": {"key": "a", "iv": "b"},
+        "clus": [{"id": "clu1", "serialNumber": "1", "name": "CLU", "ip": "127.0.0.1", "port": 1234,
+                  "connectionType": "LOCAL_ONLY"}],
+        "pages": [_page(widgets[start::20]) for start in range(20)],
+        "pushNotifications": [],
+    }
+
+
+def test_unsupported_widgets_skipped_before_validation() -> None:
+    with patch.object(page, "_WIDGET_LIST_ADAPTER", wraps=page._WIDGET_LIST_ADAPTER) as adapter:
+        dto = GrentonPageDto.model_validate(_page([_widget(1), _unsupported_widget(2), "junk", _widget(3)]))
+
+    assert [widget.id for widget in dto.widgets] == ["w1", "w3"]
+    validated = adapter.validate_python.call_args.args[0]
+    assert [item["id"] for item in validated] == ["w1", "w3"]
+
+
+def test_malformed_widget_skipped() -> None:
+    malformed = _widget(2)
+    del malformed["components"][0]["state"]
+
+    dto = GrentonPageDto.model_validate(_page([_widget(1), malformed, _widget(3)]))
+
+    assert [widget.id for widget in dto.widgets] == ["w1", "w3"]
+
+
+def test_adapters_not_built_per_page() -> None:
+    with patch.object(page, "TypeAdapter", side_effect=AssertionError("adapter built per page")):
+        dto = GrentonMobileInterfaceDto.model_validate(_interface(200, unsupported_every=5))
+
+    assert sum(len(page_dto.widgets) for page_dto in dto.pages) == 160
+
+
+def test_interface_keeps_supported_widgets() -> None:
+    dto = GrentonMobileInterfaceDto.model_validate(_interface(5000, unsupported_every=5))
+    assert sum(len(page_dto.widgets) for page_dto in dto.pages) == 4000
@@ -0,0 +1,101 @@
+"""Tests for the clientReport value list tokenizer."""
+import pytest
+
+from custom_components.homeassistant_grenton.domain.api.clu_messages import (
+    GrentonCluApiClientReportNotification,
+)
+from custom_components.homeassistant_grenton.domain.api.clu_messages.report_values import (
+    GrentonReportValueDecoder,
+    iter_report_values,
+    parse_report_values,
+)
+from custom_components.homeassistant_grenton.domain.enums import GrentonValueType
+from custom_components.homeassistant_grenton.state import decoder_for_value_type
+
+
+@pytest.mark.parametrize(
+    ("content", "expected"),
+    [
+        ("", []),
+        ("   ", []),
+        ("1", [1]),
+        ("1,0,255", [1, 0, 255]),
+        ("-5,-0.5,3.25,1e3", [-5, -0.5, 3.25, 1000.0]),
+        ("nil,true,false", [None, True, False]),
+        ("1, nil ,2", [1, None, 2]),
+        ('"abc",7', ["abc", 7]),
+        ('"a,b,c",7', ["a,b,c", 7]),
+        ('"",1', ["", 1]),
+        ('"say \\"hi\\", bye",2', ['say "hi", bye', 2]),
+        ('"back\\\\slash",3', ["back\\slash", 3]),
+        ('"line\\nbreak"', ["line\nbreak"]),
+        ('"12",x', [12, "x"]),
+        ('{1,2},"s",3', ["{1,2}", "s", 3]),
+        ('{"a,b",2},4', ['{"a,b",2}', 4]),
+    ],
+)
+def test_parse_report_values(content: str, expected: list) -> None:
+    assert parse_report_values(content) == expected
+
+
+def test_parse_report_values_none() -> None:
+    assert parse_report_values(None) == []
+
+
+def test_quoted_comma_does_not_shift_later_values() -> None:
+    content = ",".join(['"x,y"'] + [str(i) for i in range(30)])
+    values = parse_report_values(content)
+    assert len(values) == 31
+    assert values[0] == "x,y"
+    assert values[1:] == list(range(30))
+
+
+def test_parse_report_values_with_decoders() -> None:
+    decoders = [
+        decoder_for_value_type(GrentonValueType.STRING),
+        decoder_for_value_type(GrentonValueType.FLOAT),
+        decoder_for_value_type(GrentonValueType.INTEGER),
+        decoder_for_value_type(GrentonValueType.STRING),
+    ]
+    # Positions past the decoders fall back to the guessing cast
+    assert parse_report_values('"007",2,-3,nil,4.5', decoders) == ["007", 2.0, -3, None, 4.5]
+
+
+def test_client_report_notification() -> None:
+    notification = GrentonCluApiClientReportNotification(
+        'resp:192.168.0.10:00000000:clientReport:123:{1,"a,b",nil,-2.5}'
+    )
+    assert notification.session_id == 123
+    assert notification.values == [1, "a,b", None, -2.5]
+
+
+def test_iter_report_values_skips_unchanged_positions() -> None:
+    decoded: list[str] = []
+
+    def decode(token: str) -> int:
+        decoded.append(token)
+        return int(token)
+
+    values = list(iter_report_values(["1", "5", "3"], ["1", "2", "3"], [decode] * 3))
+    assert values == [None, 5, None]
+    assert decoded == ["5"]
+
+
+def test_report_value_decoder_decodes_changes() -> None:
+    decoder = GrentonReportValueDecoder([decoder_for_value_type(None)] * 3)
+    # The first report has nothing to compare with
+    assert decoder.decode_changes('1,"a,b",2') == [1, "a,b", 2]
+    assert decoder.decode_changes('1,"a,c",2') == [None, "a,c", None]
+    assert decoder.decode_changes('1,"a,c",2') == [None, None, None]
+    # A different length is decoded in full
+    assert decoder.decode_changes("1,2") == [1, 2]
+    assert decoder.reports == 4
+
+
+def test_report_value_decoder_full_decode_resets() -> None:
+    decoder = GrentonReportValueDecoder([decoder_for_value_type(None)] * 2)
+    decoder.decode_changes("1,2")
+    assert decoder.decode("1,2") == [1, 2]
+    # Register values are applied on their own schedule: compare with nothing
+    assert decoder.decode_changes("1,2") == [1, 2]
+    assert decoder.reports == 2
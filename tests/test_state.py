@@ -0,0 +1,48 @@
+"""Tests for the read-only variable and attribute views of a CLU state."""
+import dataclasses
+
+import pytest
+
+from custom_components.homeassistant_grenton.state import (
+    GrentonCluState,
+    GrentonCluStateAttributeKey,
+    GrentonCluStateVariableKey,
+)
+
+
+def _state() -> GrentonCluState:
+    state = GrentonCluState()
+    state.add_variable("var1", initial_value=1)
+    state.add_attribute("DOU1", "0", initial_value=0)
+    state.add_attribute("DOU2", "0")
+    return state
+
+
+def test_views_split_keys_by_kind() -> None:
+    state = _state()
+    assert list(state.variables) == [GrentonCluStateVariableKey("var1")]
+    assert list(state.attributes) == [GrentonCluStateAttributeKey("DOU1", "0"), GrentonCluStateAttributeKey("DOU2", "0")]
+    assert len(state.attributes) == 2
+    assert GrentonCluStateVariableKey("var1") not in state.attributes
+    with pytest.raises(KeyError):
+        state.attributes[GrentonCluStateVariableKey("var1")]
+
+
+def test_views_are_live() -> None:
+    state = _state()
+    variables = state.variables
+    key = GrentonCluStateAttributeKey("DOU1", "0")
+    state.update_keys([key], [1])
+    state.add_variable("var2", initial_value="on")
+    assert state.attributes[key].value == 1
+    assert variables[GrentonCluStateVariableKey("var2")].value == "on"
+
+
+def test_views_are_read_only() -> None:
+    state = _state()
+    key = GrentonCluStateVariableKey("var1")
+    with pytest.raises(TypeError):
+        state.variables[key] = None  # type: ignore[index]
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        state.variables[key].value = 2  # type: ignore[misc]
+    assert state.variables[key].value == 1